@@ -24,7 +24,8 @@ from ..utils.llm_client import LLMManager
 from ..utils.mcp_integration import MCPAcademicTools
 from ..utils.paper_utils import (
     calculate_phm_relevance_score, classify_methodology, 
-    identify_application_domains, assess_venue_quality
+    identify_application_domains, assess_venue_quality, prepare_paper_text,
+    PreprocessedPaper
 )
 from ..utils.llm_analysis import generate_tldr_summary
 from ..utils.phm_constants import (
@@ -169,9 +170,10 @@ class ContentAnalysisAgent(BaseAgent):
                 analysis['reproducibility'] = self._assess_reproducibility(paper)
             
             # Additional enhancements
-            analysis['methodology_classification'] = classify_methodology(paper)
-            analysis['application_domain'] = identify_application_domains(paper)
-            analysis['phm_relevance'] = self._calculate_phm_relevance_detailed(paper)
+            paper_text = prepare_paper_text(paper)
+            analysis['methodology_classification'] = classify_methodology(paper, text=paper_text)
+            analysis['application_domain'] = identify_application_domains(paper, text=paper_text)
+            analysis['phm_relevance'] = self._calculate_phm_relevance_detailed(paper, paper_text)
             
             # Quality indicators
             analysis['analysis_quality'] = self._calculate_analysis_quality(analysis)
@@ -378,12 +380,9 @@ Provide insightful analysis for each aspect.
     
     
     
-    def _calculate_phm_relevance_detailed(self, paper: Dict[str, Any]) -> Dict[str, Any]:
+    def _calculate_phm_relevance_detailed(self, paper: Dict[str, Any],
+                                          text: Optional[PreprocessedPaper] = None) -> Dict[str, Any]:
         """Calculate detailed PHM relevance score."""
-        title = paper.get('title', '').lower()
-        abstract = paper.get('abstract', '').lower()
-        keywords = [kw.lower() for kw in paper.get('keywords', [])]
-        
         relevance = {
             'overall_score': 0.0,
             'title_relevance': 0.0,
@@ -395,7 +394,7 @@ Provide insightful analysis for each aspect.
         }
         
         # Use centralized PHM relevance calculation
-        overall_score, detailed_scores = calculate_phm_relevance_score(paper)
+        overall_score, detailed_scores = calculate_phm_relevance_score(paper, text=text)
         
         # Map to expected format for backward compatibility
         relevance['title_relevance'] = detailed_scores.get('title_score', 0.0)
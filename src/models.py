@@ -202,6 +202,135 @@ class ProcessingResult:
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
 
 
+# Venue fields that are only present in a paper dict when venue data exists
+_VENUE_FIELDS = ('venue', 'venue_type', 'publisher', 'issn', 'is_core')
+
+
+@dataclass
+class PaperRecord:
+    """
+    Compact in-memory record for an API search result.
+    
+    Uses ``__slots__`` so large result pages do not allocate a dict per
+    paper; records are materialized with to_dict() only for papers that are
+    kept. Dict-style access lets the dict-based scoring helpers read them.
+    """
+    __slots__ = (
+        'id', 'title', 'doi', 'year', 'publication_date', 'cited_by_count',
+        'is_open_access', 'source', 'authors', 'has_venue', 'venue', 'venue_type',
+        'publisher', 'issn', 'is_core', 'abstract', 'keywords',
+        'phm_relevance_score', 'quality_indicators'
+    )
+    
+    id: str
+    title: str
+    doi: str
+    year: Optional[int]
+    publication_date: Optional[str]
+    cited_by_count: int
+    is_open_access: bool
+    source: str
+    authors: List[str]
+    has_venue: bool
+    venue: Optional[str]
+    venue_type: Optional[str]
+    publisher: Optional[str]
+    issn: Optional[str]
+    is_core: bool
+    abstract: str
+    keywords: List[str]
+    phm_relevance_score: float
+    quality_indicators: Dict[str, Any]
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Read a field like ``dict.get`` (venue fields are absent without venue data)."""
+        if not self.has_venue and key in _VENUE_FIELDS:
+            return default
+        return getattr(self, key, default)
+    
+    def __getitem__(self, key: str) -> Any:
+        return getattr(self, key)
+    
+    def __setitem__(self, key: str, value: Any) -> None:
+        setattr(self, key, value)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the standard paper dictionary format."""
+        paper = {
+            'id': self.id,
+            'title': self.title,
+            'doi': self.doi,
+            'year': self.year,
+            'publication_date': self.publication_date,
+            'cited_by_count': self.cited_by_count,
+            'is_open_access': self.is_open_access,
+            'source': self.source,
+            'authors': self.authors
+        }
+        
+        if self.has_venue:
+            paper['venue'] = self.venue
+            paper['venue_type'] = self.venue_type
+            paper['publisher'] = self.publisher
+            paper['issn'] = self.issn
+            paper['is_core'] = self.is_core
+        
+        paper['abstract'] = self.abstract
+        paper['keywords'] = self.keywords
+        paper['phm_relevance_score'] = self.phm_relevance_score
+        paper['quality_indicators'] = self.quality_indicators
+        return paper
+
+
+
+@dataclass
+class QualityAssessment:
+    """
+    Quality assessment of a single paper produced by PaperQualityFilter.
+    
+    Uses ``__slots__`` so batch filtering does not allocate a dict per
+    assessed paper; to_dict() is only needed for papers that are kept.
+    Dict-style access keeps callers written against the dict form working.
+    """
+    __slots__ = (
+        'overall_score', 'venue_score', 'publisher_score', 'impact_score',
+        'citation_score', 'phm_relevance_score', 'quality_tier', 'warnings', 'strengths'
+    )
+    
+    overall_score: float
+    venue_score: float
+    publisher_score: float
+    impact_score: float
+    citation_score: float
+    phm_relevance_score: float
+    quality_tier: str
+    warnings: List[str]
+    strengths: List[str]
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Read a field like ``dict.get``."""
+        return getattr(self, key, default)
+    
+    def __getitem__(self, key: str) -> Any:
+        return getattr(self, key)
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self.__slots__
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the assessment dictionary format stored on papers."""
+        return {
+            'overall_score': self.overall_score,
+            'venue_score': self.venue_score,
+            'publisher_score': self.publisher_score,
+            'impact_score': self.impact_score,
+            'citation_score': self.citation_score,
+            'phm_relevance_score': self.phm_relevance_score,
+            'quality_tier': self.quality_tier,
+            'warnings': self.warnings,
+            'strengths': self.strengths
+        }
+
 if __name__ == "__main__":
     # Test data models
     identifiers = PaperIdentifiers(
@@ -12,11 +12,18 @@ import json
 import time
 import logging
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from typing import Dict, List, Any, Optional, Tuple, Set
 from datetime import datetime
+from urllib.parse import urlparse
 import requests
 
+from .json_utils import json_loads
 from .logging_config import get_logger
+from .rate_limiter import get_host_limiter
+
+# Maximum number of texts kept in the PHM relevance score cache
+_RELEVANCE_CACHE_SIZE = 4096
 
 
 class APIClientError(Exception):
@@ -45,16 +52,17 @@ class BaseAPIClient(ABC):
         self.timeout = 30
         self.max_retries = 3
         
-        # Request session with common headers
+        # Request session with common headers (subclasses may swap in another
+        # client with the same interface and extend _request_errors)
         self.session = requests.Session()
+        self._request_errors: Tuple[type, ...] = (requests.exceptions.RequestException, ValueError)
         self.session.headers.update({
             'User-Agent': 'APPA/1.0 (Awesome-PHM-Paper-Agent)',
             'Accept': 'application/json'
         })
         
-        # Rate limiting
+        # Rate limiting (per host, shared across clients; see rate_limiter)
         self._last_request_time = 0
-        self._request_interval = 1.0 / self.rate_limit if self.rate_limit > 0 else 0
         
         # PHM-specific keywords for relevance scoring
         self.phm_keywords = {
@@ -85,13 +93,13 @@ class BaseAPIClient(ABC):
             'hindawi', 'bentham', 'scirp', 'omics', 'frontiers media'
         }
         
-    def _enforce_rate_limit(self) -> None:
-        """Enforce rate limiting by sleeping if necessary."""
-        if self._request_interval > 0:
-            time_since_last = time.time() - self._last_request_time
-            if time_since_last < self._request_interval:
-                sleep_time = self._request_interval - time_since_last
-                time.sleep(sleep_time)
+        # LRU cache of keyword scores by combined paper text (papers recur
+        # across pages, retries and venue searches)
+        self._relevance_cache: OrderedDict = OrderedDict()
+        
+    def _enforce_rate_limit(self, url: str) -> None:
+        """Enforce the process-wide rate limit for the host of ``url``, sleeping if necessary."""
+        get_host_limiter(urlparse(url).netloc, self.rate_limit).acquire()
         
         self._last_request_time = time.time()
     
@@ -121,7 +129,7 @@ class BaseAPIClient(ABC):
         for attempt in range(self.max_retries + 1):
             try:
                 # Apply rate limiting
-                self._enforce_rate_limit()
+                self._enforce_rate_limit(url)
                 
                 # Prepare headers
                 headers = self.session.headers.copy()
@@ -146,7 +154,7 @@ class BaseAPIClient(ABC):
                 
                 # Handle specific status codes
                 if response.status_code == 200:
-                    return response.json()
+                    return json_loads(response.content)
                 elif response.status_code == 401:
                     raise APIClientError(f"Authentication failed (401): Invalid API key")
                 elif response.status_code == 403:
@@ -164,7 +172,7 @@ class BaseAPIClient(ABC):
                     self.logger.warning(f"HTTP {response.status_code}: {response.text[:200]}")
                     response.raise_for_status()
                     
-            except requests.exceptions.RequestException as e:
+            except self._request_errors as e:
                 if attempt < self.max_retries:
                     wait_time = 2 ** attempt
                     self.logger.warning(f"Request failed (attempt {attempt + 1}), retrying in {wait_time}s: {e}")
@@ -198,23 +206,31 @@ class BaseAPIClient(ABC):
         if not combined_text.strip():
             return 0.0
         
-        # Calculate weighted scores for each category
-        scores = {}
-        weights = {
-            'core': 0.4,        # Core PHM concepts most important
-            'technical': 0.3,   # Technical terms moderate weight
-            'ml_methods': 0.2,  # ML methods moderate weight
-            'applications': 0.1 # Application domains lowest weight
-        }
-        
-        for category, keywords in self.phm_keywords.items():
-            matches = sum(1 for kw in keywords if kw.lower() in combined_text)
-            total_keywords = len(keywords)
-            category_score = matches / total_keywords if total_keywords > 0 else 0.0
-            scores[category] = category_score
-        
-        # Calculate weighted average
-        relevance_score = sum(scores[cat] * weights[cat] for cat in weights.keys())
+        relevance_score = self._relevance_cache.get(combined_text)
+        if relevance_score is not None:
+            self._relevance_cache.move_to_end(combined_text)
+        else:
+            # Calculate weighted scores for each category
+            scores = {}
+            weights = {
+                'core': 0.4,        # Core PHM concepts most important
+                'technical': 0.3,   # Technical terms moderate weight
+                'ml_methods': 0.2,  # ML methods moderate weight
+                'applications': 0.1 # Application domains lowest weight
+            }
+            
+            for category, keywords in self.phm_keywords.items():
+                matches = sum(1 for kw in keywords if kw.lower() in combined_text)
+                total_keywords = len(keywords)
+                category_score = matches / total_keywords if total_keywords > 0 else 0.0
+                scores[category] = category_score
+            
+            # Calculate weighted average
+            relevance_score = sum(scores[cat] * weights[cat] for cat in weights.keys())
+            
+            self._relevance_cache[combined_text] = relevance_score
+            if len(self._relevance_cache) > _RELEVANCE_CACHE_SIZE:
+                self._relevance_cache.popitem(last=False)
         
         # Boost for high-citation papers in relevant domains
         citations = paper.get('cited_by_count', 0)
@@ -308,25 +324,7 @@ class BaseAPIClient(ABC):
         current_year = datetime.now().year
         
         for paper in papers:
-            # Skip if excluded publisher
-            if self.is_excluded_publisher(paper):
-                continue
-            
-            # Basic completeness checks
-            if not paper.get('title') or len(paper['title']) < 10:
-                continue
-            
-            if not paper.get('authors'):
-                continue
-            
-            # Year filter
-            year = paper.get('year')
-            if year and (year < 2010 or year > current_year):
-                continue
-            
-            # Citation filter for older papers
-            citations = paper.get('cited_by_count', 0)
-            if year and current_year - year > 3 and citations < 5:
+            if not self.passes_basic_filters(paper, current_year):
                 continue
             
             # PHM relevance filter
@@ -334,18 +332,70 @@ class BaseAPIClient(ABC):
                 continue
             
             # Add quality indicators
-            paper['quality_indicators'] = {
-                'data_completeness': self.assess_data_completeness(paper),
-                'citations': citations,
-                'is_recent': year and current_year - year <= 3,
-                'has_abstract': bool(paper.get('abstract')),
-                'excluded_publisher': False
-            }
+            paper['quality_indicators'] = self.build_quality_indicators(paper, current_year)
             
             filtered_papers.append(paper)
         
         return filtered_papers
     
+    def passes_basic_filters(self, paper: Dict[str, Any], current_year: int) -> bool:
+        """
+        Check the quality filters that need no content analysis.
+        
+        Covers publisher exclusion, title/author completeness, publication
+        year and citations for older papers; PHM relevance is checked
+        separately.
+        
+        Args:
+            paper: Paper metadata dictionary
+            current_year: Current calendar year
+            
+        Returns:
+            True if the paper passes
+        """
+        # Skip if excluded publisher
+        if self.is_excluded_publisher(paper):
+            return False
+        
+        # Basic completeness checks
+        if not paper.get('title') or len(paper['title']) < 10:
+            return False
+        
+        if not paper.get('authors'):
+            return False
+        
+        # Year filter
+        year = paper.get('year')
+        if year and (year < 2010 or year > current_year):
+            return False
+        
+        # Citation filter for older papers
+        citations = paper.get('cited_by_count', 0)
+        if year and current_year - year > 3 and citations < 5:
+            return False
+        
+        return True
+    
+    def build_quality_indicators(self, paper: Dict[str, Any], current_year: int) -> Dict[str, Any]:
+        """
+        Build the quality indicators attached to papers that pass filtering.
+        
+        Args:
+            paper: Paper metadata dictionary
+            current_year: Current calendar year
+            
+        Returns:
+            Quality indicator dictionary
+        """
+        year = paper.get('year')
+        return {
+            'data_completeness': self.assess_data_completeness(paper),
+            'citations': paper.get('cited_by_count', 0),
+            'is_recent': year and current_year - year <= 3,
+            'has_abstract': bool(paper.get('abstract')),
+            'excluded_publisher': False
+        }
+    
     def get_basic_api_status(self) -> Dict[str, Any]:
         """
         Get basic API status information.
@@ -20,7 +20,9 @@ import requests
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from .logging_config import get_logger
+from .json_utils import json_loads
 from .paper_quality_filter import PaperQualityFilter
+from .paper_utils import normalize_doi
 
 
 class CrossrefClient:
@@ -53,8 +55,9 @@ class CrossrefClient:
             'Accept': 'application/json'
         }
         
-        # Quality filter
-        self.quality_filter = PaperQualityFilter(config)
+        # Quality filter; the client config is a settings dict, so only an
+        # optional filter config path is passed on (defaults otherwise)
+        self.quality_filter = PaperQualityFilter(self.config.get('quality_filter_config'))
         
         # PHM-specific search terms
         self.phm_search_terms = [
@@ -102,9 +105,9 @@ class CrossrefClient:
             response = requests.get(url, headers=self.headers, params=params, timeout=30)
             response.raise_for_status()
             
-            return response.json()
+            return json_loads(response.content)
             
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             self.logger.error(f"Crossref API request failed: {e}")
             return None
     
@@ -480,6 +483,44 @@ class CrossrefClient:
         
         return None
     
+    def get_papers_by_dois(self, dois: List[str], batch_size: int = 50) -> Dict[str, Dict[str, Any]]:
+        """
+        Get detailed information for many DOIs with batched requests.
+        
+        Crossref accepts OR-combined ``doi:`` filters on the works endpoint,
+        so each request resolves up to ``batch_size`` DOIs.
+        
+        Args:
+            dois: List of DOIs (bare, doi.org URLs or "doi:" references)
+            batch_size: Number of DOIs per request
+            
+        Returns:
+            Dictionary mapping lowercased DOI to paper metadata
+        """
+        clean_dois = list(dict.fromkeys(
+            normalize_doi(doi).lower() for doi in dois if doi
+        ))
+        
+        papers = {}
+        for start in range(0, len(clean_dois), batch_size):
+            chunk = clean_dois[start:start + batch_size]
+            params = {
+                'filter': ','.join(f'doi:{doi}' for doi in chunk),
+                'rows': len(chunk)
+            }
+            
+            response_data = self._make_request('works', params)
+            if not response_data:
+                continue
+            
+            for work in response_data.get('message', {}).get('items', []):
+                paper = self._convert_work_to_paper(work)
+                if paper and paper.get('doi'):
+                    papers[paper['doi'].lower()] = paper
+        
+        self.logger.info(f"Resolved {len(papers)} of {len(clean_dois)} DOIs from Crossref")
+        return papers
+    
     def get_api_status(self) -> Dict[str, Any]:
         """Check API status and configuration."""
         
@@ -0,0 +1,44 @@
+"""
+JSON helpers for APPA system.
+
+Uses orjson for API payload (de)serialization when it is installed and
+falls back to the standard library json module otherwise.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+
+def json_loads(data: Union[str, bytes, bytearray]) -> Any:
+    """
+    Parse a JSON document from text or raw bytes.
+
+    Args:
+        data: JSON payload, e.g. a response body
+
+    Returns:
+        Parsed Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> str:
+    """
+    Serialize an object to a compact JSON string.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        JSON text
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
@@ -5,24 +5,188 @@ This module provides a unified interface to interact with MCP academic research
 for discovering, analyzing, and validating scholarly papers.
 """
 
-import json
+import os
 import re
-from typing import Dict, List, Any, Optional, Union
+import hashlib
+import sys
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Any, Optional, Tuple, Union
 from datetime import datetime, timedelta
 from urllib.parse import quote
 import logging
 
 from .logging_config import get_logger
+from .json_utils import json_loads
+from .crossref_client import CrossrefClient
+from .rate_limiter import TokenBucket
 from .phm_constants import (
     PHM_CONCEPTS, SEARCH_TEMPLATES, MCP_CONFIG,
-    ERROR_MESSAGES, DEFAULT_CONFIG
+    ERROR_MESSAGES, DEFAULT_CONFIG, KNOWN_CROSSREF_PREFIXES
 )
 from .paper_utils import (
-    create_paper_fingerprint, calculate_phm_relevance_score,
+    create_paper_fingerprint, calculate_phm_relevance_score, calculate_phm_relevance_scores,
     merge_paper_metadata, validate_doi, classify_methodology,
-    identify_application_domains
+    identify_application_domains, prepare_paper_text, normalize_doi
 )
 
+# Basic DOI shape check, compiled once for all papers
+_DOI_RE = re.compile(r'^10\.\d+/.+')
+
+# Citation parsing: first three period-delimited segments are authors,
+# title and venue/year
+_CITATION_RE = re.compile(r'^(?P<authors>[^.]*)\.(?P<title>[^.]*)\.(?P<venue>[^.]*)')
+_YEAR_RE = re.compile(r'\b(19|20)\d{2}\b')
+_VENUE_STRIP_RE = re.compile(r'\b(19|20)\d{2}\b|pp?\.\s*\d+[-–]\d+')
+
+# Core PHM terms always included in academic search queries
+_CORE_PHM_TERM_LIST = (
+    "prognostics", "health management", "fault diagnosis",
+    "predictive maintenance", "condition monitoring",
+    "remaining useful life", "RUL", "degradation modeling",
+    "anomaly detection", "failure prediction"
+)
+_CORE_PHM_TERMS = frozenset(_CORE_PHM_TERM_LIST)
+_CORE_PHM_CLAUSE = ' OR '.join(f'"{term}"' for term in _CORE_PHM_TERM_LIST)
+
+# Slug conversion for methodology/domain search tags
+_SLUG_TABLE = str.maketrans(' ', '-')
+
+# Batches smaller than this are enhanced in-process; pool startup would dominate
+_PARALLEL_ENHANCE_MIN_PAPERS = 200
+
+# Maximum number of papers kept in the methodology/domain classification caches
+_CLASSIFICATION_CACHE_SIZE = 10_000
+
+# Known high-impact PHM venues
+_PHM_JOURNALS = {
+    'Mechanical Systems and Signal Processing': {'impact_factor': 7.8, 'quartile': 'Q1'},
+    'IEEE Transactions on Industrial Electronics': {'impact_factor': 8.2, 'quartile': 'Q1'},
+    'Reliability Engineering & System Safety': {'impact_factor': 6.1, 'quartile': 'Q1'},
+    'IEEE/ASME Transactions on Mechatronics': {'impact_factor': 5.9, 'quartile': 'Q1'},
+    'Journal of Sound and Vibration': {'impact_factor': 4.4, 'quartile': 'Q1'},
+    'Expert Systems with Applications': {'impact_factor': 8.5, 'quartile': 'Q1'},
+    'IEEE Transactions on Reliability': {'impact_factor': 5.9, 'quartile': 'Q1'}
+}
+
+_PHM_CONFERENCES = [
+    'PHM Conference', 'ICPHM', 'European Conference of the PHM Society',
+    'IEEE Conference on Prognostics and Health Management',
+    'Annual Conference of the PHM Society'
+]
+
+# Lowercased venue tables so venue matching only lowercases the paper's venue
+_PHM_JOURNALS_LC = {journal.lower(): info for journal, info in _PHM_JOURNALS.items()}
+_PHM_CONF_LC = [conf.lower() for conf in _PHM_CONFERENCES]
+
+
+# Leading columns of the columnar paper view returned by papers_to_frame()
+_FRAME_COLUMNS = [
+    'title', 'authors', 'year', 'venue', 'doi', 'abstract', 'keywords', 'citation_count'
+]
+_FRAME_STRING_COLUMNS = ['title', 'venue', 'doi', 'abstract']
+
+
+@lru_cache(maxsize=512)
+def _render_phm_search_query(keywords: Tuple[str, ...],
+                             date_range: str,
+                             include_preprints: bool) -> str:
+    """Render the academic search query; cached because shards repeat keyword sets."""
+    
+    # Combine user keywords (deduplicated, in given order) with the
+    # pre-rendered core PHM clause
+    user_keywords = [kw for kw in dict.fromkeys(keywords) if kw not in _CORE_PHM_TERMS]
+    keyword_clause = ' OR '.join([f'"{kw}"' for kw in user_keywords])
+    keyword_query = f"{keyword_clause} OR {_CORE_PHM_CLAUSE}" if keyword_clause else _CORE_PHM_CLAUSE
+    
+    # Add date constraints
+    start_year, end_year = map(int, date_range.split('-'))
+    date_query = f"publication_year:[{start_year} TO {end_year}]"
+    
+    # Build final query
+    query_parts = [f"({keyword_query})", date_query]
+    
+    if include_preprints:
+        venue_query = "(venue:arXiv OR venue:bioRxiv OR journal:* OR conference:*)"
+    else:
+        venue_query = "(journal:* OR conference:*)"
+    
+    query_parts.append(venue_query)
+    
+    return " AND ".join(query_parts)
+
+
+def _apply_paper_analysis(paper: Dict[str, Any],
+                          overall_score: float,
+                          methodologies: List[str],
+                          domains: List[str]) -> Dict[str, Any]:
+    """Store PHM relevance, methodology and research area fields on a paper."""
+    paper['phm_relevance_score'] = overall_score
+    
+    paper['methodology'] = methodologies
+    
+    # Determine research area using application domains
+    paper['research_area'] = domains[0] if domains else 'General PHM'
+    paper['application_domains'] = domains
+    
+    return paper
+
+
+def _enhance_paper_chunk(papers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Process-pool entry point: enhance one chunk of papers."""
+    texts = [prepare_paper_text(paper) for paper in papers]
+    # Score the whole chunk at once using centralized function
+    scores = calculate_phm_relevance_scores(papers, texts).tolist()
+    for paper, text, overall_score in zip(papers, texts, scores):
+        _apply_paper_analysis(
+            paper, overall_score,
+            classify_methodology(paper, text=text),
+            identify_application_domains(paper, text=text)
+        )
+    return papers
+
+
+def papers_to_frame(papers: List[Dict[str, Any]]):
+    """
+    Convert a list of paper dictionaries to a columnar pandas DataFrame.
+    
+    Core metadata columns come first with compact dtypes (nullable integers
+    for year/citation_count, Arrow-backed strings when pyarrow is installed);
+    any additional paper fields follow as regular columns. Use
+    ``frame.to_dict('records')`` to get back to the list-of-dicts form.
+    
+    Args:
+        papers: List of paper metadata dictionaries
+        
+    Returns:
+        pandas DataFrame with one row per paper
+    
+    Raises:
+        ImportError: If pandas is not installed
+    """
+    import pandas as pd
+    
+    frame = pd.DataFrame.from_records(papers)
+    leading = [column for column in _FRAME_COLUMNS if column in frame.columns]
+    frame = frame[leading + [column for column in frame.columns if column not in leading]]
+    
+    for column in ('year', 'citation_count'):
+        if column in frame.columns:
+            frame[column] = pd.to_numeric(frame[column], errors='coerce').astype('Int64')
+    
+    try:
+        import pyarrow  # noqa: F401
+        string_dtype = pd.StringDtype('pyarrow')
+    except ImportError:
+        string_dtype = pd.StringDtype()
+    
+    for column in _FRAME_STRING_COLUMNS:
+        if column in frame.columns:
+            frame[column] = frame[column].astype(string_dtype)
+    
+    return frame
+
 
 class MCPAcademicTools:
     """
@@ -48,6 +212,18 @@ class MCPAcademicTools:
         self.max_results_per_query = self.mcp_config.get('max_results_per_query', 50)
         self.timeout_seconds = self.mcp_config.get('timeout_seconds', 120)
         
+        # Throttle MCP calls up front instead of relying on retries after rejection
+        self._rate_limiter = TokenBucket(self.mcp_config.get('requests_per_second', 10))
+        
+        # Two-tier DOI authority cache: bundled CrossRef registrant prefixes
+        # (KNOWN_CROSSREF_PREFIXES) plus prefixes confirmed at runtime
+        self._authority_cache: Dict[str, bool] = {}
+        self._crossref_client: Optional[CrossrefClient] = None
+        
+        # Methodology/domain classifications keyed by paper fingerprint
+        self._methodology_cache: OrderedDict = OrderedDict()
+        self._domain_cache: OrderedDict = OrderedDict()
+        
         self.logger.info("MCP Academic Tools integration initialized")
     
     def search_phm_papers(self, 
@@ -76,14 +252,24 @@ class MCPAcademicTools:
         # Build comprehensive search query
         search_query = self._build_phm_search_query(keywords, date_range, include_preprints)
         
+        # One timestamp for the whole batch
+        batch_ts = datetime.now().isoformat()
+        
         # Execute MCP academic search (this would call the actual MCP tool)
         try:
-            papers = self._execute_academic_search(search_query, max_results)
+            papers = self._execute_academic_search(search_query, max_results, batch_ts=batch_ts)
             
-            # Parse and validate results
+            # Parse and validate results, dropping duplicates across search
+            # shards before the validation step
             validated_papers = []
+            seen_fingerprints = set()
             for paper in papers:
-                validated_paper = self._validate_paper_metadata(paper)
+                fingerprint = create_paper_fingerprint(paper)
+                if fingerprint in seen_fingerprints:
+                    continue
+                seen_fingerprints.add(fingerprint)
+                
+                validated_paper = self._validate_paper_metadata(paper, batch_ts=batch_ts)
                 if validated_paper:
                     validated_papers.append(validated_paper)
             
@@ -121,7 +307,8 @@ class MCPAcademicTools:
                 query = identifier
             
             # Execute detailed lookup
-            paper_data = self._execute_paper_lookup(query)
+            with self._rate_limiter:
+                paper_data = self._execute_paper_lookup(query)
             
             if paper_data:
                 return self._enhance_paper_metadata(paper_data)
@@ -131,18 +318,121 @@ class MCPAcademicTools:
         
         return None
     
-    def validate_citation_data(self, papers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def get_paper_details_batch(self, dois: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get detailed information about many papers by DOI.
+        
+        DOIs are resolved through batched Crossref requests (up to 50 DOIs
+        per request) instead of one lookup per paper.
+        
+        Args:
+            dois: List of DOIs
+            
+        Returns:
+            Dictionary mapping each resolved DOI to enhanced paper metadata
+        """
+        clean_dois = [doi for doi in (self._clean_doi(doi) for doi in dois) if doi]
+        if not clean_dois:
+            return {}
+        
+        self.logger.info(f"Getting details for {len(clean_dois)} papers by DOI")
+        
+        try:
+            works = self._get_crossref_client().get_papers_by_dois(clean_dois)
+        except Exception as e:
+            self.logger.error(f"Failed to get paper details: {e}")
+            return {}
+        
+        details = {}
+        for doi in clean_dois:
+            paper = works.get(doi.lower())
+            if not paper:
+                continue
+            
+            # Crossref resolved the DOI, so its registrant prefix is trustworthy
+            self._authority_cache[doi.split('/', 1)[0]] = True
+            paper.setdefault('citation_count', paper.get('cited_by_count', 0))
+            details[doi] = self._enhance_paper_metadata(paper)
+        
+        return details
+    
+    def validate_citation_data(self, papers: List[Dict[str, Any]],
+                               as_frame: bool = False,
+                               enhance_metadata: bool = False,
+                               max_workers: Optional[int] = None) -> Union[List[Dict[str, Any]], Any]:
         """
         Validate and enhance citation data for a list of papers.
         
         Args:
             papers: List of paper metadata dictionaries
+            as_frame: Return a columnar pandas DataFrame (see papers_to_frame)
+                instead of a list of dictionaries
+            enhance_metadata: Also add PHM relevance, methodology and domain
+                classification (see enhance_papers)
+            max_workers: Worker processes for metadata enhancement
             
         Returns:
-            List of papers with validated and enhanced citation data
+            List of papers (or DataFrame) with validated and enhanced citation data
         """
         self.logger.info(f"Validating citation data for {len(papers)} papers")
         
+        try:
+            validated_papers = self._validate_citation_data_vectorized(papers)
+        except ImportError:
+            # pandas/numpy not available, fall back to per-paper validation
+            validated_papers = self._validate_citation_data_serial(papers)
+        
+        if enhance_metadata:
+            validated_papers = self.enhance_papers(validated_papers, max_workers=max_workers)
+        
+        if as_frame:
+            return papers_to_frame(validated_papers)
+        return validated_papers
+    
+    def enhance_papers(self, papers: List[Dict[str, Any]],
+                       max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Add PHM relevance, methodology and domain classification to papers.
+        
+        Classification is pure-Python CPU work, so large batches are split
+        into chunks and processed in a process pool. Small batches (or
+        ``max_workers=1``) run in-process and use the classification cache.
+        
+        Args:
+            papers: List of paper metadata dictionaries (updated in place)
+            max_workers: Number of worker processes (defaults to CPU count)
+            
+        Returns:
+            The same list of papers
+        """
+        workers = max_workers or os.cpu_count() or 1
+        if workers <= 1 or len(papers) < _PARALLEL_ENHANCE_MIN_PAPERS:
+            for paper in papers:
+                self._enhance_paper_metadata(paper)
+            return papers
+        
+        chunk_size = -(-len(papers) // workers)
+        chunks = [papers[i:i + chunk_size] for i in range(0, len(papers), chunk_size)]
+        
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                enhanced_chunks = list(executor.map(_enhance_paper_chunk, chunks))
+        except Exception as e:
+            self.logger.warning(f"Parallel metadata enhancement failed, running serially: {e}")
+            for paper in papers:
+                self._enhance_paper_metadata(paper)
+            return papers
+        
+        # Worker processes return copies; write the results back in place
+        for chunk, enhanced_chunk in zip(chunks, enhanced_chunks):
+            for paper, enhanced in zip(chunk, enhanced_chunk):
+                paper.update(enhanced)
+        
+        return papers
+    
+    def _validate_citation_data_serial(self, papers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Validate citation data paper by paper (used when pandas is unavailable)."""
+        current_year = datetime.now().year
         validated_papers = []
         for paper in papers:
             try:
@@ -151,7 +441,7 @@ class MCPAcademicTools:
                     paper = self._validate_doi(paper)
                 
                 # Enhance citation metrics
-                paper = self._enhance_citation_metrics(paper)
+                paper = self._enhance_citation_metrics(paper, current_year=current_year)
                 
                 # Validate journal/venue information
                 paper = self._validate_venue_info(paper)
@@ -166,6 +456,67 @@ class MCPAcademicTools:
         
         return validated_papers
     
+    def _validate_citation_data_vectorized(self, papers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Batch version of citation validation using pandas column operations.
+        
+        Citation metrics are computed for the whole batch at once and venue
+        matching runs once per distinct venue instead of once per paper.
+        
+        Raises:
+            ImportError: If pandas or numpy is not installed
+        """
+        import numpy as np
+        import pandas as pd
+        
+        # A malformed DOI only fails its own paper, as in the serial path
+        doi_failed = set()
+        for i, paper in enumerate(papers):
+            try:
+                if paper.get('doi'):
+                    self._validate_doi(paper)
+            except Exception as e:
+                self.logger.warning(f"Citation validation failed for paper {paper.get('title', 'Unknown')}: {e}")
+                paper['validation_status'] = 'failed'
+                doi_failed.add(i)
+        
+        if not papers:
+            return papers
+        
+        current_year = datetime.now().year
+        frame = pd.DataFrame({
+            'citation_count': [paper.get('citation_count', 0) for paper in papers],
+            'year': [paper.get('year', current_year) for paper in papers],
+            'venue': [paper.get('venue', '') for paper in papers]
+        })
+        
+        citations = pd.to_numeric(frame['citation_count'], errors='coerce')
+        years = pd.to_numeric(frame['year'], errors='coerce')
+        invalid = (citations.isna() | years.isna()).to_numpy()
+        
+        citations_per_year = (citations / np.maximum(1, current_year - years)).to_numpy()
+        citation_impact = pd.cut(
+            citations, [-np.inf, 20, 100, np.inf], labels=['low', 'medium', 'high']
+        ).astype(str).to_numpy()
+        
+        venues = frame['venue'].fillna('').astype(str).str.lower().to_numpy()
+        venue_matches = {venue: self._match_venue(venue) for venue in set(venues)}
+        
+        for i, paper in enumerate(papers):
+            if i in doi_failed:
+                continue
+            if invalid[i]:
+                self.logger.warning(f"Citation validation failed for paper {paper.get('title', 'Unknown')}: "
+                                    f"non-numeric year or citation count")
+                paper['validation_status'] = 'failed'
+                continue
+            
+            paper['citations_per_year'] = float(citations_per_year[i])
+            paper['citation_impact'] = citation_impact[i]
+            paper.update(venue_matches[venues[i]])
+        
+        return papers
+    
     def extract_research_themes(self, papers: List[Dict[str, Any]]) -> Dict[str, List[str]]:
         """
         Extract common research themes from a collection of papers.
@@ -197,7 +548,8 @@ class MCPAcademicTools:
                 })
             
             # Use MCP to extract themes
-            extracted_themes = self._execute_theme_extraction(text_corpus)
+            with self._rate_limiter:
+                extracted_themes = self._execute_theme_extraction(text_corpus)
             
             # Process and validate themes
             for theme_name, paper_ids in extracted_themes.items():
@@ -217,44 +569,19 @@ class MCPAcademicTools:
                                date_range: str,
                                include_preprints: bool) -> str:
         """Build comprehensive search query for PHM papers."""
-        
-        # Core PHM terms
-        core_terms = [
-            "prognostics", "health management", "fault diagnosis", 
-            "predictive maintenance", "condition monitoring",
-            "remaining useful life", "RUL", "degradation modeling",
-            "anomaly detection", "failure prediction"
-        ]
-        
-        # Combine user keywords with core PHM terms
-        all_keywords = list(set(keywords + core_terms))
-        
-        # Build search query
-        keyword_query = ' OR '.join([f'"{kw}"' for kw in all_keywords])
-        
-        # Add date constraints
-        start_year, end_year = map(int, date_range.split('-'))
-        date_query = f"publication_year:[{start_year} TO {end_year}]"
-        
-        # Build final query
-        query_parts = [f"({keyword_query})", date_query]
-        
-        if include_preprints:
-            venue_query = "(venue:arXiv OR venue:bioRxiv OR journal:* OR conference:*)"
-        else:
-            venue_query = "(journal:* OR conference:*)"
-        
-        query_parts.append(venue_query)
-        
-        return " AND ".join(query_parts)
+        return _render_phm_search_query(tuple(keywords), date_range, include_preprints)
     
-    def _execute_academic_search(self, query: str, max_results: int) -> List[Dict[str, Any]]:
+    def _execute_academic_search(self, query: str, max_results: int,
+                                 batch_ts: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Execute academic search using academic-researcher agent via Task tool.
         
         This method calls the academic-researcher agent to search real academic databases
-        and returns validated paper metadata.
+        and returns validated paper metadata. ``batch_ts`` is the ISO timestamp
+        stamped on every paper of this search (defaults to now).
         """
+        batch_ts = batch_ts or datetime.now().isoformat()
+
         search_prompt = f"""
         You are the academic-researcher agent. Search for academic papers related to Prognostics and Health Management (PHM) with the following criteria:
         
@@ -304,14 +631,19 @@ class MCPAcademicTools:
             
             # Call academic-researcher agent (this is a conceptual implementation)
             # In practice, this would use the Task tool
-            result = self._call_academic_researcher_agent(search_prompt)
+            with self._rate_limiter:
+                result = self._call_academic_researcher_agent(search_prompt)
+            
+            # The agent may hand back its JSON report as raw text
+            if isinstance(result, (str, bytes)):
+                result = json_loads(result)
             
             if result and isinstance(result, dict) and 'findings' in result:
                 papers = []
                 for finding in result['findings']:
                     # Convert academic-researcher format to our internal format
-                    paper = self._convert_academic_result_to_paper(finding)
-                    if paper and self._validate_paper_metadata(paper):
+                    paper = self._convert_academic_result_to_paper(finding, batch_ts=batch_ts)
+                    if paper and self._validate_paper_metadata(paper, batch_ts=batch_ts):
                         papers.append(paper)
                 
                 self.logger.info(f"Academic researcher returned {len(papers)} validated papers")
@@ -351,12 +683,14 @@ class MCPAcademicTools:
             "seminal_works": []
         }
     
-    def _convert_academic_result_to_paper(self, finding: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def _convert_academic_result_to_paper(self, finding: Dict[str, Any],
+                                          batch_ts: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         Convert academic-researcher agent result to internal paper format.
         
         Args:
             finding: Single paper result from academic-researcher agent
+            batch_ts: ISO timestamp shared by the current batch (defaults to now)
             
         Returns:
             Paper metadata dictionary in internal format or None if invalid
@@ -387,7 +721,7 @@ class MCPAcademicTools:
                 'peer_reviewed': finding.get('quality_indicators', {}).get('peer_reviewed', True),
                 'relevance_to_query': finding.get('relevance', ''),
                 'source': 'academic_researcher_agent',
-                'extraction_date': datetime.now().isoformat()
+                'extraction_date': batch_ts or datetime.now().isoformat()
             }
             
             # Calculate PHM relevance score
@@ -405,31 +739,23 @@ class MCPAcademicTools:
     def _parse_citation(self, citation: str) -> tuple:
         """Parse citation string to extract title, authors, year, venue."""
         try:
-            # Basic citation parsing - this could be enhanced with more sophisticated parsing
-            parts = citation.split('.')
-            
-            if len(parts) >= 3:
-                # Format: Authors. "Title." Journal/Conference, year.
-                authors_part = parts[0].strip()
-                title_part = parts[1].strip().strip('"')
-                venue_year_part = parts[2].strip()
-                
-                # Extract authors
-                authors = [name.strip() for name in authors_part.split(',')]
-                
-                # Extract year from venue part
-                import re
-                year_match = re.search(r'\b(19|20)\d{2}\b', venue_year_part)
-                year = int(year_match.group()) if year_match else None
-                
-                # Extract venue (remove year and page numbers)
-                venue = re.sub(r'\b(19|20)\d{2}\b', '', venue_year_part)
-                venue = re.sub(r'pp?\.\s*\d+[-–]\d+', '', venue)
-                venue = venue.strip(', ')
-                
-                return title_part, authors, year, venue
+            # Format: Authors. "Title." Journal/Conference, year.
+            match = _CITATION_RE.match(citation)
+            if not match:
+                return citation, [], None, ''
             
-            return citation, [], None, ''
+            authors = [name.strip() for name in match['authors'].split(',')]
+            title = match['title'].strip().strip('"')
+            venue_year_part = match['venue'].strip()
+            
+            # Extract year from venue part
+            year_match = _YEAR_RE.search(venue_year_part)
+            year = int(year_match.group()) if year_match else None
+            
+            # Extract venue (remove year and page numbers)
+            venue = _VENUE_STRIP_RE.sub('', venue_year_part).strip(', ')
+            
+            return title, authors, year, venue
             
         except Exception:
             return citation, [], None, ''
@@ -440,25 +766,26 @@ class MCPAcademicTools:
     
     def _generate_search_tags_for_paper(self, paper: Dict[str, Any]) -> List[str]:
         """Generate search tags for paper categorization."""
+        # Tags repeat heavily across papers, so they are interned to share
+        # one string object per distinct tag
         tags = []
         
         # Add year tag
         if paper.get('year'):
-            tags.append(f"year:{paper['year']}")
+            tags.append(sys.intern(f"year:{paper['year']}"))
         
         # Add methodology tags based on content analysis
-        methodologies = classify_methodology(paper)
+        methodologies, domains = self._classify_paper(paper)
         for method in methodologies:
-            tags.append(f"method:{method.lower().replace(' ', '-')}")
+            tags.append(sys.intern(f"method:{method.lower().translate(_SLUG_TABLE)}"))
         
         # Add domain tags
-        domains = identify_application_domains(paper)
         for domain in domains:
-            tags.append(f"domain:{domain.lower().replace(' ', '-')}")
+            tags.append(sys.intern(f"domain:{domain.lower().translate(_SLUG_TABLE)}"))
         
         # Add publication type tag
         paper_type = paper.get('paper_type', 'unknown')
-        tags.append(f"type:{paper_type}")
+        tags.append(sys.intern(f"type:{paper_type}"))
         
         # Add impact tag based on citation count
         citation_count = paper.get('citation_count', 0)
@@ -471,8 +798,71 @@ class MCPAcademicTools:
         
         return tags
     
+    def _classify_paper(self, paper: Dict[str, Any],
+                        text: Optional[tuple] = None) -> tuple:
+        """
+        Classify paper methodology and application domains, memoized.
+        
+        The cache key combines the paper fingerprint with a digest of the
+        classified text, so a paper seen again once its abstract or keywords
+        have arrived is classified afresh.
+        
+        Args:
+            paper: Paper metadata dictionary
+            text: Optional result of prepare_paper_text() for this paper
+            
+        Returns:
+            Tuple of (methodologies, domains)
+        """
+        text = text or prepare_paper_text(paper)
+        text_digest = hashlib.blake2b(text.combined_text.encode('utf-8'), digest_size=8).hexdigest()
+        cache_key = f"{create_paper_fingerprint(paper)}:{text_digest}"
+        
+        methodologies = self._cache_get(self._methodology_cache, cache_key)
+        if methodologies is None:
+            methodologies = classify_methodology(paper, text=text)
+            self._cache_put(self._methodology_cache, cache_key, methodologies)
+        
+        domains = self._cache_get(self._domain_cache, cache_key)
+        if domains is None:
+            domains = identify_application_domains(paper, text=text)
+            self._cache_put(self._domain_cache, cache_key, domains)
+        
+        return list(methodologies), list(domains)
+    
+    def _cache_get(self, cache: OrderedDict, key: str) -> Optional[List[str]]:
+        """Look up a cached classification and mark it as recently used."""
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+    
+    def _cache_put(self, cache: OrderedDict, key: str, value: List[str]) -> None:
+        """Store a classification, evicting the least recently used entry when full."""
+        cache[key] = value
+        if len(cache) > _CLASSIFICATION_CACHE_SIZE:
+            cache.popitem(last=False)
+    
+    def _get_crossref_client(self) -> CrossrefClient:
+        """Return the Crossref client, creating it on first use."""
+        if self._crossref_client is None:
+            self._crossref_client = CrossrefClient(self.config)
+        return self._crossref_client
+    
     def _execute_paper_lookup(self, query: str) -> Optional[Dict[str, Any]]:
         """Execute detailed paper lookup using MCP tools."""
+        # DOI lookups go through the same Crossref path as batch lookups
+        if query.startswith('DOI:'):
+            doi = self._clean_doi(query[len('DOI:'):])
+            if not doi:
+                return None
+            works = self._get_crossref_client().get_papers_by_dois([doi])
+            paper = works.get(doi.lower())
+            if paper:
+                self._authority_cache[doi.split('/', 1)[0]] = True
+                paper.setdefault('citation_count', paper.get('cited_by_count', 0))
+            return paper
+        
         # Placeholder for MCP paper lookup
         return None
     
@@ -481,8 +871,10 @@ class MCPAcademicTools:
         # Placeholder for MCP theme extraction
         return {}
     
-    def _validate_paper_metadata(self, paper: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def _validate_paper_metadata(self, paper: Dict[str, Any],
+                                 batch_ts: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """Validate and standardize paper metadata."""
+        batch_ts = batch_ts or datetime.now().isoformat()
         try:
             # Required fields
             if not paper.get('title') or not paper.get('authors'):
@@ -500,12 +892,14 @@ class MCPAcademicTools:
                 'citation_count': int(paper.get('citation_count', 0)),
                 'urls': paper.get('urls', {}),
                 'source': paper.get('source', 'mcp'),
-                'retrieved_date': datetime.now().isoformat(),
+                'retrieved_date': batch_ts,
                 'validation_status': 'validated'
             }
             
             # Additional validation
-            if validated_paper['year'] < 1900 or validated_paper['year'] > datetime.now().year + 1:
+            # batch_ts is ISO formatted, so its first four characters are the year
+            max_year = int(batch_ts[:4]) + 1
+            if validated_paper['year'] < 1900 or validated_paper['year'] > max_year:
                 validated_paper['year'] = 0
             
             return validated_paper
@@ -516,19 +910,12 @@ class MCPAcademicTools:
     
     def _enhance_paper_metadata(self, paper: Dict[str, Any]) -> Dict[str, Any]:
         """Enhance paper metadata with additional information."""
+        # Normalize title/abstract/keywords once for all three analyzers
+        text = prepare_paper_text(paper)
+        methodologies, domains = self._classify_paper(paper, text=text)
         # Add PHM relevance score using centralized function
-        overall_score, _ = calculate_phm_relevance_score(paper)
-        paper['phm_relevance_score'] = overall_score
-        
-        # Extract methodology using centralized function
-        paper['methodology'] = classify_methodology(paper)
-        
-        # Determine research area using application domains
-        domains = identify_application_domains(paper)
-        paper['research_area'] = domains[0] if domains else 'General PHM'
-        paper['application_domains'] = domains
-        
-        return paper
+        overall_score, _ = calculate_phm_relevance_score(paper, text=text)
+        return _apply_paper_analysis(paper, overall_score, methodologies, domains)
     
     def _validate_doi(self, paper: Dict[str, Any]) -> Dict[str, Any]:
         """Validate DOI and enhance with DOI-based metadata."""
@@ -538,24 +925,36 @@ class MCPAcademicTools:
         
         # Clean and validate DOI format
         clean_doi = self._clean_doi(doi)
-        if clean_doi:
-            paper['doi'] = clean_doi
-            paper['doi_url'] = f"https://doi.org/{clean_doi}"
-            
-            # Could add DOI resolution here
+        if not clean_doi:
+            paper['doi_valid'] = False
+            return paper
+        
+        paper['doi'] = clean_doi
+        paper['doi_url'] = f"https://doi.org/{clean_doi}"
+        
+        # DOIs from a known or already confirmed registrant are accepted
+        # directly; any other prefix falls back to the DOI format check
+        prefix = clean_doi.split('/', 1)[0]
+        if prefix in self._get_known_crossref_prefixes() or self._authority_cache.get(prefix):
             paper['doi_valid'] = True
         else:
-            paper['doi_valid'] = False
+            paper['doi_valid'] = _DOI_RE.match(clean_doi) is not None
         
         return paper
     
-    def _enhance_citation_metrics(self, paper: Dict[str, Any]) -> Dict[str, Any]:
+    def _get_known_crossref_prefixes(self) -> FrozenSet[str]:
+        """Return the (shared, read-only) set of known CrossRef registrant prefixes."""
+        return KNOWN_CROSSREF_PREFIXES
+    
+    def _enhance_citation_metrics(self, paper: Dict[str, Any],
+                                  current_year: Optional[int] = None) -> Dict[str, Any]:
         """Enhance paper with additional citation metrics."""
+        current_year = current_year or datetime.now().year
         citation_count = paper.get('citation_count', 0)
-        year = paper.get('year', datetime.now().year)
+        year = paper.get('year', current_year)
         
         # Calculate citations per year
-        years_since_publication = max(1, datetime.now().year - year)
+        years_since_publication = max(1, current_year - year)
         paper['citations_per_year'] = citation_count / years_since_publication
         
         # Classify citation impact
@@ -571,51 +970,39 @@ class MCPAcademicTools:
     def _validate_venue_info(self, paper: Dict[str, Any]) -> Dict[str, Any]:
         """Validate and enhance venue information."""
         venue = paper.get('venue', '')
-        
-        # Known high-impact PHM venues
-        phm_journals = {
-            'Mechanical Systems and Signal Processing': {'impact_factor': 7.8, 'quartile': 'Q1'},
-            'IEEE Transactions on Industrial Electronics': {'impact_factor': 8.2, 'quartile': 'Q1'},
-            'Reliability Engineering & System Safety': {'impact_factor': 6.1, 'quartile': 'Q1'},
-            'IEEE/ASME Transactions on Mechatronics': {'impact_factor': 5.9, 'quartile': 'Q1'},
-            'Journal of Sound and Vibration': {'impact_factor': 4.4, 'quartile': 'Q1'},
-            'Expert Systems with Applications': {'impact_factor': 8.5, 'quartile': 'Q1'},
-            'IEEE Transactions on Reliability': {'impact_factor': 5.9, 'quartile': 'Q1'}
-        }
+        paper.update(self._match_venue(venue.lower()))
+        return paper
+    
+    def _match_venue(self, venue_lower: str) -> Dict[str, Any]:
+        """Return the venue fields to set for an already-lowercased venue name."""
+        venue_fields = {}
         
         # Enhanced venue info if available
-        for journal, info in phm_journals.items():
-            if journal.lower() in venue.lower():
-                paper['venue_impact_factor'] = info['impact_factor']
-                paper['venue_quartile'] = info['quartile']
-                paper['venue_type'] = 'journal'
+        for journal, info in _PHM_JOURNALS_LC.items():
+            if journal in venue_lower:
+                venue_fields['venue_impact_factor'] = info['impact_factor']
+                venue_fields['venue_quartile'] = info['quartile']
+                venue_fields['venue_type'] = 'journal'
                 break
         
         # Check for conferences
-        phm_conferences = [
-            'PHM Conference', 'ICPHM', 'European Conference of the PHM Society',
-            'IEEE Conference on Prognostics and Health Management',
-            'Annual Conference of the PHM Society'
-        ]
-        
-        for conf in phm_conferences:
-            if conf.lower() in venue.lower():
-                paper['venue_type'] = 'conference'
+        for conf in _PHM_CONF_LC:
+            if conf in venue_lower:
+                venue_fields['venue_type'] = 'conference'
                 break
         
-        return paper
+        return venue_fields
     
     def _clean_doi(self, doi: Optional[str]) -> Optional[str]:
         """Clean and validate DOI format."""
         if not doi:
             return None
         
-        # Remove common prefixes
-        doi = doi.replace('https://doi.org/', '').replace('http://doi.org/', '').replace('doi:', '')
+        # Remove doi.org URL / "doi:" prefixes
+        doi = normalize_doi(doi)
         
         # Validate DOI format (basic)
-        doi_pattern = r'^10\.\d+/.+'
-        if re.match(doi_pattern, doi):
+        if _DOI_RE.match(doi):
             return doi
         
         return None
@@ -625,21 +1012,19 @@ class MCPAcademicTools:
     
     def _fallback_theme_extraction(self, papers: List[Dict[str, Any]]) -> Dict[str, List[str]]:
         """Fallback theme extraction using keyword frequency."""
-        themes = {}
-        
-        # Count keyword frequency
-        keyword_counts = {}
+        # Count keyword frequency and index paper titles by keyword in one pass
+        keyword_counts = Counter()
+        keyword_papers = defaultdict(list)
         for paper in papers:
-            for keyword in paper.get('keywords', []):
-                keyword_counts[keyword] = keyword_counts.get(keyword, 0) + 1
+            keywords = paper.get('keywords', [])
+            keyword_counts.update(keywords)
+            
+            title = paper.get('title', '')
+            for keyword in dict.fromkeys(keywords):
+                keyword_papers[keyword].append(title)
         
         # Group papers by common themes
-        common_keywords = [kw for kw, count in keyword_counts.items() if count >= 2]
-        
-        for keyword in common_keywords:
-            themes[keyword] = []
-            for paper in papers:
-                if keyword in paper.get('keywords', []):
-                    themes[keyword].append(paper.get('title', ''))
-        
-        return themes
\ No newline at end of file
+        return {
+            keyword: keyword_papers[keyword]
+            for keyword, count in keyword_counts.items() if count >= 2
+        }
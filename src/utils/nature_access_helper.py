@@ -7,15 +7,134 @@ including proper headers, rate limiting, and fallback mechanisms.
 Created: 2025-08-23
 """
 
+import re
+import threading
 import time
 import requests
 import random
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import lru_cache
+from pathlib import Path
 from typing import Dict, List, Any, Optional
 from urllib.parse import urlparse
 import logging
 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from requests_cache import DO_NOT_CACHE, CachedSession
+except ImportError:  # requests-cache is optional
+    CachedSession = None
+
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:  # selectolax is optional
+    HTMLParser = None
+
+from .json_utils import json_loads
+from .rate_limiter import get_host_limiter
+
 logger = logging.getLogger(__name__)
 
+# On-disk HTTP cache for DOI/CrossRef metadata (used when requests-cache is
+# installed). Anchored at the repository's data/cache directory rather than
+# the working directory, and created only when a session is first needed
+_HTTP_CACHE_NAME = str(Path(__file__).resolve().parents[2] / 'data' / 'cache' / 'appa_http_cache')
+
+# Only these metadata hosts are cached; everything else the shared session
+# fetches (landing pages, PDF bodies) bypasses the cache
+_HTTP_CACHE_EXPIRE_AFTER = {
+    'api.crossref.org': timedelta(days=90),
+    'dx.doi.org': timedelta(days=90),
+    'doi.org': timedelta(days=90),
+}
+
+# Host suffixes of Nature series platforms (including sharing links)
+_NATURE_SUFFIXES = ('nature.com', 'link.springer.com', 'rdcu.be')
+
+# Nature DOIs appear bare, behind doi.org/ or under /articles/; the bare
+# form is a substring of the other two, so one pattern covers all of them
+_NATURE_DOI_RE = re.compile(r'10\.1038/[a-zA-Z0-9.-]+')
+
+# Number of DOIs resolved per CrossRef works request
+_CROSSREF_BATCH_SIZE = 50
+
+# Metadata selectors for Nature article pages, in priority order. A comma
+# group matches the first element in document order, so only selectors
+# that identify the same element are grouped
+_TITLE_SELECTORS = ('h1[data-test="article-title"], h1.c-article-title', 'h1', 'title')
+_AUTHOR_SELECTORS = ('[data-test="author-name"]', '.c-article-author-list a', '.author-list a')
+_ABSTRACT_SELECTORS = ('[data-test="article-description"]', '.c-article-section--abstract', '.abstract')
+_DOI_SELECTOR = '[data-track-label="doi"]'
+
+
+@lru_cache(maxsize=4096)
+def _extract_nature_doi(url: str) -> Optional[str]:
+    """Extract a Nature DOI from a URL; memoized since URLs recur across access strategies."""
+    match = _NATURE_DOI_RE.search(url)
+    return match.group(0) if match else None
+
+
+def _create_cached_session() -> requests.Session:
+    """Create a requests-cache session backed by the shared on-disk HTTP cache."""
+    Path(_HTTP_CACHE_NAME).parent.mkdir(parents=True, exist_ok=True)
+    # Published DOI metadata is effectively immutable, so repeat lookups
+    # are served from a local SQLite cache. Nothing else is cached by
+    # default, and response Cache-Control headers are not honored since they
+    # would override that default (e.g. for large PDF bodies)
+    return CachedSession(
+        _HTTP_CACHE_NAME,
+        backend='sqlite',
+        expire_after=DO_NOT_CACHE,
+        urls_expire_after=_HTTP_CACHE_EXPIRE_AFTER,
+        cache_control=False,
+        allowable_codes=(200,)
+    )
+
+
+def _create_shared_session() -> requests.Session:
+    """Create the pooled session shared by all NatureAccessHelper instances."""
+    if CachedSession is not None:
+        session = _create_cached_session()
+    else:
+        session = requests.Session()
+    
+    # Transient failures (429/5xx) are retried inside urllib3 with jittered
+    # exponential backoff that honors Retry-After; the final response is
+    # returned rather than raised so callers still see its status code
+    retry = Retry(
+        total=3,
+        backoff_factor=2,
+        backoff_jitter=1.0,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=('GET',),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# Keep-alive connections to nature.com, doi.org and Crossref are reused
+# across helper instances instead of paying a new TLS handshake each time.
+# Built on first use so that importing this module has no side effects
+_SHARED_SESSION: Optional[requests.Session] = None
+_SHARED_SESSION_LOCK = threading.Lock()
+
+
+def _get_shared_session() -> requests.Session:
+    """Return the process-wide pooled session, creating it on first use."""
+    global _SHARED_SESSION
+    if _SHARED_SESSION is None:
+        with _SHARED_SESSION_LOCK:
+            if _SHARED_SESSION is None:
+                _SHARED_SESSION = _create_shared_session()
+    return _SHARED_SESSION
+
 
 class NatureAccessHelper:
     """
@@ -51,23 +170,67 @@ class NatureAccessHelper:
             'Cache-Control': 'max-age=0',
         }
         
-        # Rate limiting for Nature
-        self.last_request_time = 0
-        self.min_delay = 3.0  # Minimum 3 seconds between requests
+        # Per-service headers, built once rather than per request
+        self._doi_headers = {**self.nature_headers, 'Accept': 'application/vnd.citationstyles.csl+json'}
+        self._crossref_headers = {
+            'User-Agent': 'APPA-Research/1.0 (mailto:research@example.com)',
+            'Accept': 'application/json'
+        }
+        
+        # Rate limiting uses process-wide per-host limiters, so requests to
+        # different services can overlap when fetching many URLs
+        self.min_delay = 3.0  # Delay between requests to hosts without a known limit
         self.max_retries = 2  # Limited retries to avoid blocking
+        self.max_workers = self.config.get('nature_max_workers', 16)
+        
+        # CrossRef works prefetched in batches, keyed by lowercased DOI
+        self._crossref_works: Dict[str, Dict[str, Any]] = {}
         
-        # Session with optimized settings
-        self.session = requests.Session()
-        self.session.headers.update(self.nature_headers)
+        # Shared pooled session; headers are passed per request so the
+        # session itself is never mutated
+        self.session = _get_shared_session()
         
     def is_nature_url(self, url: str) -> bool:
         """Check if URL belongs to Nature series."""
+        # Cheap substring pre-check skips URL parsing for most non-Nature URLs
+        lowered = url.lower()
+        if not any(suffix in lowered for suffix in _NATURE_SUFFIXES):
+            return False
+        
         try:
-            domain = urlparse(url).netloc.lower()
-            return any(nature_domain in domain for nature_domain in self.nature_domains)
-        except:
+            return urlparse(lowered).netloc.endswith(_NATURE_SUFFIXES)
+        except ValueError:
             return False
     
+    def get_many(self, urls: List[str], max_workers: Optional[int] = None) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Retrieve paper information for many Nature URLs concurrently.
+        
+        URLs are fetched by a bounded thread pool so that network latency
+        overlaps; per-host rate limiting still spaces out requests to each
+        individual service.
+        
+        Args:
+            urls: Nature series URLs
+            max_workers: Maximum number of concurrent fetches
+            
+        Returns:
+            Dictionary mapping each URL to its paper information (or None)
+        """
+        unique_urls = list(dict.fromkeys(url for url in urls if self.is_nature_url(url)))
+        if not unique_urls:
+            return {}
+        
+        # Resolve CrossRef metadata for all DOIs up front in batched requests
+        dois = [self._extract_doi_from_url(url) for url in unique_urls if '10.1038' in url]
+        self.fetch_crossref_batch([doi for doi in dois if doi])
+        
+        workers = min(max_workers or self.max_workers, len(unique_urls))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(self.get_nature_paper_info, unique_urls))
+        
+        return dict(zip(unique_urls, results))
+    
     def get_nature_paper_info(self, url: str) -> Optional[Dict[str, Any]]:
         """
         Attempt to retrieve paper information from Nature URL.
@@ -78,7 +241,7 @@ class NatureAccessHelper:
         if not self.is_nature_url(url):
             return None
             
-        logger.info(f"Attempting Nature access: {url}")
+        logger.info("Attempting Nature access: %s", url)
         
         # Strategy 1: Try direct access with proper headers
         result = self._try_direct_access(url)
@@ -96,41 +259,29 @@ class NatureAccessHelper:
         if alt_result:
             return alt_result
             
-        logger.warning(f"All Nature access strategies failed for: {url}")
+        logger.warning("All Nature access strategies failed for: %s", url)
         return self._create_limited_metadata(url)
     
     def _try_direct_access(self, url: str) -> Optional[Dict[str, Any]]:
         """Try direct access to Nature URL with optimized headers."""
         try:
-            # Respect rate limiting
-            self._wait_for_rate_limit()
-            
-            response = self.session.get(
-                url, 
-                timeout=30,
-                allow_redirects=True
-            )
-            
-            # Update last request time
-            self.last_request_time = time.time()
+            response = self._get(url, headers=self.nature_headers, timeout=30)
             
             if response.status_code == 200:
                 # Extract basic metadata from HTML
                 return self._extract_metadata_from_html(response.text, url)
             elif response.status_code == 403:
-                logger.warning(f"Nature access forbidden (403) for: {url}")
+                logger.warning("Nature access forbidden (403) for: %s", url)
                 return None
             elif response.status_code == 429:
-                logger.warning(f"Nature rate limit exceeded (429) for: {url}")
-                # Wait longer before next attempt
-                time.sleep(10)
+                logger.warning("Nature rate limit exceeded (429) for: %s", url)
                 return None
             else:
-                logger.warning(f"Nature returned {response.status_code} for: {url}")
+                logger.warning("Nature returned %s for: %s", response.status_code, url)
                 return None
                 
         except requests.RequestException as e:
-            logger.error(f"Nature direct access failed: {e}")
+            logger.error("Nature direct access failed: %s", e)
             return None
     
     def _try_doi_resolution(self, url: str) -> Optional[Dict[str, Any]]:
@@ -144,29 +295,23 @@ class NatureAccessHelper:
             # Try dx.doi.org resolution
             doi_url = f"https://dx.doi.org/{doi}"
             
-            self._wait_for_rate_limit()
-            
             # Request with accept header for metadata
-            headers = self.nature_headers.copy()
-            headers['Accept'] = 'application/vnd.citationstyles.csl+json'
-            
-            response = self.session.get(doi_url, headers=headers, timeout=20)
-            self.last_request_time = time.time()
+            response = self._get(doi_url, headers=self._doi_headers, timeout=20)
             
             if response.status_code == 200:
                 try:
                     # Parse JSON metadata
-                    metadata = response.json()
+                    metadata = json_loads(response.content)
                     return self._convert_doi_metadata(metadata, doi)
-                except:
+                except ValueError:
                     # Fallback to HTML parsing
                     return self._extract_metadata_from_html(response.text, url)
             else:
-                logger.warning(f"DOI resolution failed with {response.status_code}")
+                logger.warning("DOI resolution failed with %s", response.status_code)
                 return None
                 
         except Exception as e:
-            logger.error(f"DOI resolution error: {e}")
+            logger.error("DOI resolution error: %s", e)
             return None
     
     def _try_alternative_access(self, url: str) -> Optional[Dict[str, Any]]:
@@ -188,122 +333,131 @@ class NatureAccessHelper:
             return None
             
         except Exception as e:
-            logger.error(f"Alternative access failed: {e}")
+            logger.error("Alternative access failed: %s", e)
             return None
     
+    def fetch_crossref_batch(self, dois: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Prefetch CrossRef works for many DOIs with batched requests.
+        
+        CrossRef accepts OR-combined ``doi:`` filters on the works endpoint,
+        so each request resolves up to 50 DOIs. Results are kept for later
+        ``_try_crossref_metadata`` lookups.
+        
+        Args:
+            dois: DOIs to resolve
+            
+        Returns:
+            Dictionary mapping lowercased DOI to CrossRef work
+        """
+        pending = [doi for doi in dict.fromkeys(doi.lower() for doi in dois) if doi not in self._crossref_works]
+        
+        for start in range(0, len(pending), _CROSSREF_BATCH_SIZE):
+            batch = pending[start:start + _CROSSREF_BATCH_SIZE]
+            params = {
+                'filter': ','.join(f'doi:{doi}' for doi in batch),
+                'rows': len(batch)
+            }
+            
+            try:
+                response = self._get("https://api.crossref.org/works", headers=self._crossref_headers,
+                                     timeout=30, params=params)
+                if response.status_code != 200:
+                    logger.warning("CrossRef batch lookup failed with %s", response.status_code)
+                    continue
+                
+                for work in json_loads(response.content).get('message', {}).get('items', []):
+                    if work.get('DOI'):
+                        self._crossref_works[work['DOI'].lower()] = work
+                        
+            except Exception as e:
+                logger.error("CrossRef batch lookup failed: %s", e)
+        
+        requested = (doi.lower() for doi in dois)
+        return {doi: self._crossref_works[doi] for doi in requested if doi in self._crossref_works}
+    
     def _try_crossref_metadata(self, doi: str) -> Optional[Dict[str, Any]]:
-        """Retrieve metadata from CrossRef API."""
+        """Retrieve metadata from CrossRef API (or the batch prefetch)."""
+        work = self._crossref_works.get(doi.lower())
+        if work is not None:
+            return self._convert_crossref_work(work, doi)
+        
         try:
-            self._wait_for_rate_limit()
-            
             crossref_url = f"https://api.crossref.org/works/{doi}"
-            headers = {
-                'User-Agent': 'APPA-Research/1.0 (mailto:research@example.com)',
-                'Accept': 'application/json'
-            }
             
-            response = requests.get(crossref_url, headers=headers, timeout=15)
-            self.last_request_time = time.time()
+            response = self._get(crossref_url, headers=self._crossref_headers, timeout=15)
             
             if response.status_code == 200:
-                data = response.json()
-                work = data.get('message', {})
-                
-                return {
-                    'title': ' '.join(work.get('title', [])),
-                    'authors': self._extract_crossref_authors(work.get('author', [])),
-                    'journal': work.get('container-title', ['Unknown'])[0] if work.get('container-title') else 'Unknown',
-                    'year': self._extract_crossref_year(work.get('published-print', work.get('published-online', {}))),
-                    'doi': doi,
-                    'abstract': work.get('abstract', ''),
-                    'url': f"https://doi.org/{doi}",
-                    'access_method': 'crossref',
-                    'access_status': 'metadata_only'
-                }
+                data = json_loads(response.content)
+                return self._convert_crossref_work(data.get('message', {}), doi)
             
             return None
             
         except Exception as e:
-            logger.error(f"CrossRef metadata retrieval failed: {e}")
+            logger.error("CrossRef metadata retrieval failed: %s", e)
             return None
     
+    def _convert_crossref_work(self, work: Dict[str, Any], doi: str) -> Dict[str, Any]:
+        """Convert a CrossRef work to standard format."""
+        return {
+            'title': ' '.join(work.get('title', [])),
+            'authors': self._extract_crossref_authors(work.get('author', [])),
+            'journal': work.get('container-title', ['Unknown'])[0] if work.get('container-title') else 'Unknown',
+            'year': self._extract_crossref_year(work.get('published-print', work.get('published-online', {}))),
+            'doi': doi,
+            'abstract': work.get('abstract', ''),
+            'url': f"https://doi.org/{doi}",
+            'access_method': 'crossref',
+            'access_status': 'metadata_only'
+        }
+    
     def _extract_doi_from_url(self, url: str) -> Optional[str]:
         """Extract DOI from Nature URL."""
-        try:
-            import re
-            
-            # Common Nature DOI patterns
-            patterns = [
-                r'10\.1038/[a-zA-Z0-9.-]+',
-                r'doi\.org/(10\.1038/[a-zA-Z0-9.-]+)',
-                r'/articles/(10\.1038/[a-zA-Z0-9.-]+)'
-            ]
-            
-            for pattern in patterns:
-                match = re.search(pattern, url)
-                if match:
-                    doi = match.group(1) if match.groups() else match.group(0)
-                    return doi.replace('doi.org/', '')
-            
-            return None
-            
-        except Exception:
-            return None
+        return _extract_nature_doi(url)
     
     def _extract_metadata_from_html(self, html: str, url: str) -> Optional[Dict[str, Any]]:
         """Extract paper metadata from Nature HTML."""
         try:
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html, 'html.parser')
+            # Parse once with the C-backed selectolax parser when available
+            if HTMLParser is not None:
+                tree = HTMLParser(html)
+                select_one, select = tree.css_first, tree.css
+                get_text = lambda node: node.text(strip=True)
+            else:
+                from bs4 import BeautifulSoup
+                soup = BeautifulSoup(html, 'lxml')
+                select_one, select = soup.select_one, soup.select
+                get_text = lambda elem: elem.get_text(strip=True)
             
             # Extract title
             title = None
-            title_selectors = [
-                'h1[data-test="article-title"]',
-                'h1.c-article-title',
-                'h1',
-                'title'
-            ]
-            
-            for selector in title_selectors:
-                title_elem = soup.select_one(selector)
+            for selector in _TITLE_SELECTORS:
+                title_elem = select_one(selector)
                 if title_elem:
-                    title = title_elem.get_text(strip=True)
+                    title = get_text(title_elem)
                     break
             
             # Extract authors
             authors = []
-            author_selectors = [
-                '[data-test="author-name"]',
-                '.c-article-author-list a',
-                '.author-list a'
-            ]
-            
-            for selector in author_selectors:
-                author_elems = soup.select(selector)
+            for selector in _AUTHOR_SELECTORS:
+                author_elems = select(selector)
                 if author_elems:
-                    authors = [elem.get_text(strip=True) for elem in author_elems]
+                    authors = [get_text(elem) for elem in author_elems]
                     break
             
             # Extract abstract
             abstract = ""
-            abstract_selectors = [
-                '[data-test="article-description"]',
-                '.c-article-section--abstract',
-                '.abstract'
-            ]
-            
-            for selector in abstract_selectors:
-                abstract_elem = soup.select_one(selector)
+            for selector in _ABSTRACT_SELECTORS:
+                abstract_elem = select_one(selector)
                 if abstract_elem:
-                    abstract = abstract_elem.get_text(strip=True)
+                    abstract = get_text(abstract_elem)
                     break
             
             # Extract DOI
             doi = ""
-            doi_elem = soup.select_one('[data-track-label="doi"]')
+            doi_elem = select_one(_DOI_SELECTOR)
             if doi_elem:
-                doi = doi_elem.get_text(strip=True)
+                doi = get_text(doi_elem)
             
             return {
                 'title': title or 'Nature Article',
@@ -317,7 +471,7 @@ class NatureAccessHelper:
             }
             
         except Exception as e:
-            logger.error(f"HTML metadata extraction failed: {e}")
+            logger.error("HTML metadata extraction failed: %s", e)
             return None
     
     def _create_limited_metadata(self, url: str) -> Dict[str, Any]:
@@ -336,16 +490,29 @@ class NatureAccessHelper:
             'note': 'Full text access may require institutional subscription or payment.'
         }
     
-    def _wait_for_rate_limit(self):
-        """Implement respectful rate limiting for Nature requests."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
+    def _get(self, url: str, headers: Dict[str, str], timeout: float,
+             params: Optional[Dict[str, Any]] = None) -> requests.Response:
+        """
+        Issue a rate-limited GET through the shared session.
+        
+        When the HTTP cache is available, a cached response is returned
+        without waiting on the politeness delay.
+        """
+        if CachedSession is not None:
+            response = self.session.get(url, headers=headers, params=params, timeout=timeout, only_if_cached=True)
+            if getattr(response, 'from_cache', False) and response.status_code == 200:
+                return response
+        
+        self._wait_for_rate_limit(url)
+        return self.session.get(url, headers=headers, params=params, timeout=timeout, allow_redirects=True)
+    
+    def _wait_for_rate_limit(self, url: str = ''):
+        """Implement respectful rate limiting for requests to the host of ``url``."""
+        limiter = get_host_limiter(urlparse(url).netloc, 1.0 / self.min_delay)
         
-        if time_since_last < self.min_delay:
-            wait_time = self.min_delay - time_since_last
+        if limiter.acquire() > 0:
             # Add some random jitter to avoid synchronized requests
-            wait_time += random.uniform(0, 1)
-            time.sleep(wait_time)
+            time.sleep(random.uniform(0, 1))
     
     def _extract_crossref_authors(self, authors: List[Dict]) -> List[str]:
         """Extract author names from CrossRef data."""
@@ -364,7 +531,7 @@ class NatureAccessHelper:
         try:
             if 'date-parts' in date_parts and date_parts['date-parts']:
                 return date_parts['date-parts'][0][0]
-        except:
+        except (IndexError, TypeError):
             pass
         return None
     
@@ -399,14 +566,14 @@ def get_nature_paper_safely(url: str, config: Dict[str, Any] = None) -> Optional
         result = helper.get_nature_paper_info(url)
         
         if result:
-            logger.info(f"Successfully retrieved Nature paper: {result.get('title', 'Unknown')}")
+            logger.info("Successfully retrieved Nature paper: %s", result.get('title', 'Unknown'))
         else:
-            logger.warning(f"Failed to retrieve Nature paper from: {url}")
+            logger.warning("Failed to retrieve Nature paper from: %s", url)
             
         return result
         
     except Exception as e:
-        logger.error(f"Nature access error: {e}")
+        logger.error("Nature access error: %s", e)
         return None
 
 
@@ -13,14 +13,45 @@ import os
 import re
 import json
 import time
+import logging
 import requests
-from typing import Dict, List, Any, Optional, Tuple, Union
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, FrozenSet, Iterator, List, Any, Optional, Tuple, Union
 from datetime import datetime
 from urllib.parse import quote
 
+try:
+    import httpx
+except ImportError:  # httpx is optional
+    httpx = None
+
+from ..models import PaperRecord
 from .base_api_client import BaseAPIClient, APIClientError
 from .paper_quality_filter import PaperQualityFilter
 
+# OpenAlex maximum page size
+_MAX_PER_PAGE = 200
+
+# OpenAlex maximum number of IDs in one OR'ed filter
+_MAX_IDS_PER_FILTER = 100
+
+# Full projection requested for search results
+_DETAIL_FIELDS = (
+    'id', 'title', 'display_name', 'doi', 'publication_year',
+    'publication_date', 'primary_location', 'open_access',
+    'authorships', 'concepts', 'abstract_inverted_index',
+    'cited_by_count', 'biblio', 'is_retracted', 'is_paratext',
+    'host_venue', 'primary_topic', 'keywords'
+)
+
+# Cheap projection for first-pass ranking (no abstracts)
+_RANKING_FIELDS = (
+    'id', 'display_name', 'doi', 'publication_year', 'publication_date',
+    'primary_location', 'open_access', 'authorships', 'concepts',
+    'cited_by_count', 'host_venue'
+)
+
 
 class OpenAlexClient(BaseAPIClient):
     """
@@ -42,15 +73,71 @@ class OpenAlexClient(BaseAPIClient):
         self.email = os.environ.get('OPENALEX_EMAIL', '')
         self.rate_limit = 10  # requests per second (polite pool)
         
+        # Optional record of work IDs processed in earlier runs; works listed
+        # there are skipped before conversion
+        settings = self.config.get('data_sources', {}).get('openalex', {}).get('settings', {})
+        self.seen_works_file = settings.get('seen_works_file') or ''
+        self._seen_work_ids = self._load_seen_work_ids() if self.seen_works_file else None
+        
+        # Multiplex requests over a single HTTP/2 connection when available
+        http2_client = self._create_http2_client()
+        if http2_client is not None:
+            self.session.close()
+            self.session = http2_client
+            self._request_errors = self._request_errors + (httpx.HTTPError,)
+        
         # Update session headers for OpenAlex
         self.session.headers.update({
             'User-Agent': f'APPA/1.0 (Awesome-PHM-Paper-Agent; {self.email})'
         })
         
-        # Quality filter
-        self.quality_filter = PaperQualityFilter(config)
+        # Quality filter; the client config is a settings dict, so only an
+        # optional filter config path is passed on (defaults otherwise)
+        self.quality_filter = PaperQualityFilter(self.config.get('quality_filter_config'))
+        
+        self.logger.info("OpenAlex client initialized %s%s",
+                         'with email' if self.email else 'without email',
+                         ' (HTTP/2)' if http2_client is not None else '')
+    
+    def _load_seen_work_ids(self) -> set:
+        """Load work IDs recorded by earlier runs (one per line)."""
+        if not os.path.exists(self.seen_works_file):
+            return set()
         
-        self.logger.info(f"OpenAlex client initialized {'with email' if self.email else 'without email'}")
+        with open(self.seen_works_file, 'r', encoding='utf-8') as f:
+            return {line.strip() for line in f if line.strip()}
+    
+    def _skip_seen_works(self, works: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Drop works processed in earlier runs and record the remaining ones as seen."""
+        new_works = [work for work in works if work.get('id') and work['id'] not in self._seen_work_ids]
+        if not new_works:
+            return new_works
+        
+        new_ids = list(dict.fromkeys(work['id'] for work in new_works))
+        self._seen_work_ids.update(new_ids)
+        try:
+            with open(self.seen_works_file, 'a', encoding='utf-8') as f:
+                f.write('\n'.join(new_ids) + '\n')
+        except OSError as e:
+            self.logger.warning("Failed to record seen OpenAlex works: %s", e)
+        
+        return new_works
+    
+    def _create_http2_client(self) -> Optional['httpx.Client']:
+        """Create an HTTP/2 httpx client, or None if httpx/h2 are not installed."""
+        if httpx is None:
+            return None
+        
+        try:
+            return httpx.Client(
+                http2=True,
+                headers=dict(self.session.headers),
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                timeout=self.timeout,
+                follow_redirects=True
+            )
+        except ImportError:  # http2=True requires the h2 package
+            return None
     
     def _make_openalex_request(self, endpoint: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Make request to OpenAlex API using base class method."""
@@ -63,14 +150,54 @@ class OpenAlexClient(BaseAPIClient):
         try:
             return self._make_request(url, params=params)
         except APIClientError as e:
-            self.logger.error(f"OpenAlex API request failed: {e}")
+            self.logger.error("OpenAlex API request failed: %s", e)
             return None
     
+    def _iter_work_pages(self, params: Dict[str, Any], max_results: int) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield pages of OpenAlex works until ``max_results`` works are fetched.
+        
+        Requests beyond one page use cursor pagination. The next page is
+        requested in a background thread while the caller processes the
+        current one, overlapping network and conversion time.
+        
+        Args:
+            params: Base query parameters (including 'per-page')
+            max_results: Maximum number of works to fetch
+            
+        Yields:
+            Lists of OpenAlex work objects
+        """
+        per_page = params['per-page']
+        if max_results > per_page:
+            params = dict(params, cursor='*')
+        
+        fetched = 0
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
+            pending = prefetcher.submit(self._make_openalex_request, 'works', dict(params))
+            while pending is not None:
+                response_data = pending.result()
+                pending = None
+                if not response_data:
+                    return
+                
+                works = response_data.get('results', [])
+                fetched += len(works)
+                
+                next_cursor = (response_data.get('meta') or {}).get('next_cursor')
+                if next_cursor and len(works) >= per_page and fetched < max_results:
+                    pending = prefetcher.submit(
+                        self._make_openalex_request, 'works', dict(params, cursor=next_cursor)
+                    )
+                
+                yield works
+    
     def search_papers(self, 
                      query: str,
                      filters: Optional[Dict[str, Any]] = None,
                      max_results: int = 50,
-                     year_range: Optional[Tuple[int, int]] = None) -> List[Dict[str, Any]]:
+                     year_range: Optional[Tuple[int, int]] = None,
+                     fetch_abstracts: bool = True) -> List[Dict[str, Any]]:
         """
         Search for PHM papers in OpenAlex.
         
@@ -79,39 +206,37 @@ class OpenAlexClient(BaseAPIClient):
             filters: Additional filters (venue, publisher, etc.)
             max_results: Maximum number of results
             year_range: Tuple of (start_year, end_year)
+            fetch_abstracts: Request abstracts with the search results. When
+                False, papers are ranked on a lighter projection and abstracts
+                are fetched afterwards only for the papers that pass filtering
             
         Returns:
             List of paper metadata dictionaries
         """
-        self.logger.info(f"Searching OpenAlex for: {query}")
+        self.logger.info("Searching OpenAlex for: %s", query)
         
         # Build search parameters
         params = {
             'search': query,
-            'per-page': min(max_results, 200),  # OpenAlex limit per request
+            'per-page': min(max_results, _MAX_PER_PAGE),  # OpenAlex limit per request
             'sort': 'cited_by_count:desc',  # Most cited first
-            'select': ','.join([
-                'id', 'title', 'display_name', 'doi', 'publication_year',
-                'publication_date', 'primary_location', 'open_access',
-                'authorships', 'concepts', 'abstract_inverted_index',
-                'cited_by_count', 'biblio', 'is_retracted', 'is_paratext',
-                'host_venue', 'primary_topic', 'keywords'
-            ])
+            'select': ','.join(_DETAIL_FIELDS if fetch_abstracts else _RANKING_FIELDS)
         }
         
         # Apply year range filter
         if year_range:
             params['filter'] = f'publication_year:{year_range[0]}-{year_range[1]}'
         
+        # Publisher exclusions (MDPI, etc.) are applied client-side to the raw
+        # works: N negated server-side text searches per query are costly
+        excluded_publishers = frozenset(
+            pub.lower() for pub in (filters or {}).get('exclude_publishers', [])
+        )
+        
         # Apply additional filters
         if filters:
             filter_parts = []
             
-            # Publisher filter (exclude MDPI, etc.)
-            if 'exclude_publishers' in filters:
-                for pub in filters['exclude_publishers']:
-                    filter_parts.append(f'host_venue.publisher.display_name.search:!{pub}')
-            
             # Venue type filter
             if 'venue_types' in filters:
                 venue_types = ','.join(filters['venue_types'])
@@ -129,88 +254,208 @@ class OpenAlexClient(BaseAPIClient):
                 else:
                     params['filter'] = ','.join(filter_parts)
         
-        # Make request
-        response_data = self._make_openalex_request('works', params)
-        if not response_data:
-            return []
-        
+        # Fetch pages (cursor-paginated beyond the first page); each work is
+        # filtered and converted in a single pass, and only accepted papers
+        # are materialized as dicts
         papers = []
-        for work in response_data.get('results', []):
-            try:
-                paper = self._convert_work_to_paper(work)
-                if paper and self.is_phm_relevant(paper):
-                    papers.append(paper)
-                    
-            except Exception as e:
-                self.logger.warning(f"Failed to process work {work.get('id', 'unknown')}: {e}")
-                continue
+        for works in self._iter_work_pages(params, max_results):
+            if self._seen_work_ids is not None:
+                works = self._skip_seen_works(works)
+            
+            papers.extend(record.to_dict() for record in self._accept_works(works, excluded_publishers) if record)
         
-        # Apply quality filters
-        filtered_papers = self.apply_quality_filters(papers)
+        filtered_papers = papers[:max_results]
         
-        self.logger.info(f"Found {len(filtered_papers)} PHM-relevant papers from OpenAlex")
-        return filtered_papers[:max_results]
+        if not fetch_abstracts:
+            self._enrich_abstracts(filtered_papers)
+        
+        self.logger.info("Found %s PHM-relevant papers from OpenAlex", len(filtered_papers))
+        return filtered_papers
     
-    def _convert_work_to_paper(self, work: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Convert OpenAlex work object to standard paper format."""
+    def _is_excluded_work(self, work: Dict[str, Any], excluded_publishers: FrozenSet[str]) -> bool:
+        """Check a raw work's publisher against lowercased exclusions before conversion."""
+        host_venue = work.get('host_venue') or (work.get('primary_location') or {}).get('source') or {}
+        publisher = (host_venue.get('publisher') or '').lower()
+        if not publisher:
+            return False
         
+        # Exact names are a set lookup; otherwise match as a substring, like
+        # the server-side text search did ('mdpi' excludes 'MDPI AG')
+        return publisher in excluded_publishers or any(pub in publisher for pub in excluded_publishers)
+    
+    def _accept_works(self,
+                      works: List[Dict[str, Any]],
+                      excluded_publishers: FrozenSet[str] = frozenset()) -> List[Optional[PaperRecord]]:
+        """
+        Filter and convert a page of OpenAlex works.
+        
+        Conversion runs in-process: a page holds at most 200 works, too few
+        to amortize process pool startup and pickling, and forking while the
+        page prefetch thread is mid-request risks deadlocks.
+        
+        Args:
+            works: OpenAlex work objects
+            excluded_publishers: Lowercased publisher names to exclude
+            
+        Returns:
+            Accepted paper records (None for rejected works), in input order
+        """
+        current_year = datetime.now().year
+        return [self._accept_work(work, excluded_publishers, current_year) for work in works]
+    
+    def _accept_work(self,
+                     work: Dict[str, Any],
+                     excluded_publishers: FrozenSet[str],
+                     current_year: int) -> Optional[PaperRecord]:
+        """
+        Filter and convert one OpenAlex work in a single pass.
+        
+        Hard filters that only need shallow fields (retraction, paratext,
+        publisher exclusion, completeness, year, citations) run first, so
+        abstract reconstruction and relevance scoring are only paid for
+        works that can still be accepted.
+        
+        Args:
+            work: OpenAlex work object
+            excluded_publishers: Lowercased publisher names to exclude
+            current_year: Current calendar year
+            
+        Returns:
+            Accepted paper record with quality indicators, or None
+        """
         try:
-            # Basic metadata
-            paper = {
-                'id': work.get('id', '').replace('https://openalex.org/', ''),
-                'title': work.get('display_name', '').strip(),
-                'doi': work.get('doi', '').replace('https://doi.org/', '') if work.get('doi') else '',
-                'year': work.get('publication_year'),
-                'publication_date': work.get('publication_date'),
-                'cited_by_count': work.get('cited_by_count', 0),
-                'is_open_access': work.get('open_access', {}).get('is_oa', False),
-                'source': 'openalex'
-            }
+            if work.get('is_retracted') or work.get('is_paratext'):
+                return None
             
-            # Authors
-            authors = []
-            for authorship in work.get('authorships', []):
-                author = authorship.get('author', {})
-                if author.get('display_name'):
-                    authors.append(author['display_name'])
-            paper['authors'] = authors
+            if excluded_publishers and self._is_excluded_work(work, excluded_publishers):
+                return None
             
-            # Venue information
-            host_venue = work.get('host_venue') or work.get('primary_location', {}).get('source', {})
-            if host_venue:
-                paper['venue'] = host_venue.get('display_name', '')
-                paper['venue_type'] = host_venue.get('type', '')
-                paper['publisher'] = host_venue.get('publisher', '')
-                paper['issn'] = host_venue.get('issn_l', '')
-                paper['is_core'] = host_venue.get('is_core', False)
+            record = self._build_record(work)
+            if not self.passes_basic_filters(record, current_year):
+                return None
             
-            # Abstract reconstruction from inverted index
-            paper['abstract'] = self._reconstruct_abstract(work.get('abstract_inverted_index', {}))
+            self._score_record(record, work)
+            if not self.is_phm_relevant(record):
+                return None
             
-            # Keywords and concepts
-            keywords = []
-            for concept in work.get('concepts', []):
-                if concept.get('level', 0) <= 2:  # Top-level concepts only
-                    keywords.append(concept.get('display_name', ''))
-            paper['keywords'] = keywords[:10]  # Limit to top 10
+            record.quality_indicators = self.build_quality_indicators(record, current_year)
+            return record
             
-            # PHM relevance scoring
-            paper['phm_relevance_score'] = self.calculate_phm_relevance(paper)
+        except Exception as e:
+            if self.logger.isEnabledFor(logging.WARNING):
+                self.logger.warning("Failed to process work %s: %s", work.get('id', 'unknown'), e)
+            return None
+    
+    def _convert_work_to_paper(self, work: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Convert OpenAlex work object to standard paper format."""
+        record = self._convert_work_to_record(work)
+        return record.to_dict() if record else None
+    
+    def _convert_work_to_record(self, work: Dict[str, Any]) -> Optional[PaperRecord]:
+        """Convert OpenAlex work object to a compact paper record."""
+        
+        try:
+            record = self._build_record(work)
+            self._score_record(record, work)
             
             # Quality indicators
-            paper['quality_indicators'] = {
-                'citations': paper['cited_by_count'],
-                'open_access': paper['is_open_access'],
-                'venue_prestige': 'high' if paper.get('is_core') else 'medium',
-                'data_completeness': self.assess_data_completeness(paper)
+            record.quality_indicators = {
+                'citations': record.cited_by_count,
+                'open_access': record.is_open_access,
+                'venue_prestige': 'high' if record.get('is_core') else 'medium',
+                'data_completeness': self.assess_data_completeness(record)
             }
             
-            return paper
+            return record
             
         except Exception as e:
-            self.logger.error(f"Error converting OpenAlex work: {e}")
+            self.logger.error("Error converting OpenAlex work: %s", e)
             return None
     
+    def _build_record(self, work: Dict[str, Any]) -> PaperRecord:
+        """Build a record from the shallow work fields (no abstract or scores yet)."""
+        # Authors
+        authors = []
+        for authorship in work.get('authorships', []):
+            author = authorship.get('author', {})
+            if author.get('display_name'):
+                authors.append(author['display_name'])
+        
+        # Venue information
+        host_venue = work.get('host_venue') or work.get('primary_location', {}).get('source', {})
+        
+        # Keywords and concepts
+        keywords = []
+        for concept in work.get('concepts', []):
+            if concept.get('level', 0) <= 2:  # Top-level concepts only
+                keywords.append(concept.get('display_name', ''))
+        
+        return PaperRecord(
+            id=work.get('id', '').replace('https://openalex.org/', ''),
+            title=work.get('display_name', '').strip(),
+            doi=work.get('doi', '').replace('https://doi.org/', '') if work.get('doi') else '',
+            year=work.get('publication_year'),
+            publication_date=work.get('publication_date'),
+            cited_by_count=work.get('cited_by_count', 0),
+            is_open_access=work.get('open_access', {}).get('is_oa', False),
+            source='openalex',
+            authors=authors,
+            has_venue=bool(host_venue),
+            venue=host_venue.get('display_name', '') if host_venue else None,
+            venue_type=host_venue.get('type', '') if host_venue else None,
+            publisher=host_venue.get('publisher', '') if host_venue else None,
+            issn=host_venue.get('issn_l', '') if host_venue else None,
+            is_core=host_venue.get('is_core', False) if host_venue else False,
+            abstract='',
+            keywords=keywords[:10],  # Limit to top 10
+            phm_relevance_score=0.0,
+            quality_indicators={}
+        )
+    
+    def _score_record(self, record: PaperRecord, work: Dict[str, Any]) -> None:
+        """Reconstruct the abstract and compute PHM relevance for a record."""
+        # Abstract reconstruction from inverted index
+        record.abstract = self._reconstruct_abstract(work.get('abstract_inverted_index', {}))
+        
+        # PHM relevance scoring
+        record.phm_relevance_score = self.calculate_phm_relevance(record)
+    
+    def _enrich_abstracts(self, papers: List[Dict[str, Any]]) -> None:
+        """
+        Fetch abstracts for papers retrieved without them.
+        
+        Works are requested in batches with an OR'ed ``openalex_id`` filter,
+        selecting only the inverted index. Relevance scores and quality
+        indicators are refreshed for each enriched paper.
+        
+        Args:
+            papers: Converted papers (updated in place)
+        """
+        papers_by_id = {paper['id']: paper for paper in papers if paper.get('id') and not paper.get('abstract')}
+        ids = list(papers_by_id)
+        current_year = datetime.now().year
+        
+        for start in range(0, len(ids), _MAX_IDS_PER_FILTER):
+            batch = ids[start:start + _MAX_IDS_PER_FILTER]
+            params = {
+                'filter': f"openalex_id:{'|'.join(batch)}",
+                'per-page': len(batch),
+                'select': 'id,abstract_inverted_index'
+            }
+            
+            response_data = self._make_openalex_request('works', params)
+            if not response_data:
+                continue
+            
+            for work in response_data.get('results', []):
+                paper = papers_by_id.get(work.get('id', '').replace('https://openalex.org/', ''))
+                if paper is None:
+                    continue
+                
+                paper['abstract'] = self._reconstruct_abstract(work.get('abstract_inverted_index') or {})
+                paper['phm_relevance_score'] = self.calculate_phm_relevance(paper)
+                paper['quality_indicators'] = self.build_quality_indicators(paper, current_year)
+    
     def _reconstruct_abstract(self, inverted_index: Dict[str, List[int]]) -> str:
         """
         Reconstruct abstract from OpenAlex inverted index format.
@@ -222,18 +467,18 @@ class OpenAlexClient(BaseAPIClient):
             return ''
         
         try:
-            # Create position -> word mapping
-            word_positions = {}
-            for word, positions in inverted_index.items():
-                for pos in positions:
-                    word_positions[pos] = word
+            # Flatten into parallel word/position arrays
+            words = []
+            positions = []
+            for word, word_positions in inverted_index.items():
+                words.extend([word] * len(word_positions))
+                positions.extend(word_positions)
             
-            # Sort by position and join
-            sorted_positions = sorted(word_positions.keys())
-            abstract_words = [word_positions[pos] for pos in sorted_positions]
+            # Order words by position with a C-level argsort
+            order = np.argsort(np.asarray(positions, dtype=np.int64), kind='stable')
             
             # Join with spaces and clean up
-            abstract = ' '.join(abstract_words)
+            abstract = ' '.join([words[i] for i in order])
             
             # Basic text cleaning
             abstract = re.sub(r'\s+', ' ', abstract)  # Normalize whitespace
@@ -242,7 +487,7 @@ class OpenAlexClient(BaseAPIClient):
             return abstract
             
         except Exception as e:
-            self.logger.warning(f"Failed to reconstruct abstract: {e}")
+            self.logger.warning("Failed to reconstruct abstract: %s", e)
             return ''
     
     
@@ -8,15 +8,247 @@ and PHM domain-specific criteria.
 Created: 2025-08-23
 """
 
+import os
 import re
+import hashlib
+import copy
+import heapq
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+import operator
+import json
+import tempfile
 import yaml
-from typing import Dict, List, Any, Optional, Tuple, Set
+from types import MappingProxyType
+import numpy as np
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Any, Optional, Tuple, Set, Iterable, Iterator, Mapping
 from pathlib import Path
 from dataclasses import dataclass
+from functools import lru_cache
 import logging
 
+from ..models import QualityAssessment
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # libyaml bindings are optional
+    from yaml import SafeLoader as _YamlLoader
+
 logger = logging.getLogger(__name__)
 
+# 解析后配置的JSON缓存目录（位于仓库data/cache下，不与源YAML放在一起）
+_CONFIG_CACHE_DIR = Path(__file__).resolve().parents[2] / 'data' / 'cache' / 'configs'
+
+# 论文数达到该值时filter_papers_parallel才使用进程池
+_PARALLEL_FILTER_MIN_PAPERS = 5000
+
+# 流式过滤时每批评估的论文数
+_STREAM_CHUNK_SIZE = 256
+
+# (期刊, 出版商) 类别评分缓存的最大条目数
+_CATEGORICAL_CACHE_SIZE = 4096
+
+# 评分查找表
+_QUARTILE_SCORE = {'Q1': 1.0, 'Q2': 0.8, 'Q3': 0.6, 'Q4': 0.4}
+_PUBLISHER_RATING_SCORE = {'excellent': 1.0, 'good': 0.8, 'questionable': 0.4, 'poor': 0.1}
+
+# 影响因子阈值（升序）及对应分数，分数比阈值多一档（低于最小阈值）
+_IMPACT_THRESHOLDS = (1.0, 3.0, 5.0, 8.0)
+_IMPACT_SCORES = (0.2, 0.4, 0.6, 0.8, 1.0)
+
+# 论文年龄上限（年，升序）及对应期望引用数
+_CITATION_AGE_LIMITS = (1, 2, 5)
+_EXPECTED_CITATIONS = (5, 15, 30, 50)
+
+# 质量等级阈值（升序）及对应等级
+_TIER_THRESHOLDS = (0.40, 0.55, 0.70, 0.85)
+_TIERS = ('poor', 'questionable', 'acceptable', 'good', 'excellent')
+
+# 批量评分用的数组形式查找表
+_IMPACT_SCORE_TABLE = np.array(_IMPACT_SCORES)
+_EXPECTED_CITATION_TABLE = np.array(_EXPECTED_CITATIONS, dtype=np.float64)
+
+# 期刊名称关键词 -> 出版商（按优先级排列）
+_VENUE_PUBLISHER_TOKENS = (
+    ('ieee', 'ieee'),
+    ('elsevier', 'elsevier'),
+    ('science direct', 'elsevier'),
+    ('springer', 'springer'),
+    ('nature', 'nature publishing group'),
+    ('wiley', 'wiley'),
+    ('mdpi', 'mdpi'),
+    ('hindawi', 'hindawi'),
+)
+_VENUE_TOKEN_PRIORITY = {token: i for i, (token, _) in enumerate(_VENUE_PUBLISHER_TOKENS)}
+_VENUE_TOKEN_PUBLISHER = dict(_VENUE_PUBLISHER_TOKENS)
+_VENUE_TOKEN_RE = re.compile('|'.join(re.escape(token) for token, _ in _VENUE_PUBLISHER_TOKENS))
+
+# DOI注册前缀 -> 出版商
+_DOI_PREFIX_PUBLISHER = {
+    '10.1109': 'ieee',
+    '10.1016': 'elsevier',
+    '10.1007': 'springer',
+    '10.1038': 'nature publishing group',
+    '10.3390': 'mdpi',
+}
+_DOI_PREFIX_RE = re.compile(r'10\.\d{4,9}')
+
+# 出版商数据库（只读，所有实例共享）
+_PUBLISHER_INFO: Mapping[str, Dict[str, str]] = MappingProxyType({
+    # 知名出版商及其评级
+    'ieee': {'rating': 'excellent', 'type': 'technical_society'},
+    'elsevier': {'rating': 'excellent', 'type': 'commercial'},
+    'springer': {'rating': 'excellent', 'type': 'commercial'},
+    'nature publishing group': {'rating': 'excellent', 'type': 'commercial'},
+    'wiley': {'rating': 'excellent', 'type': 'commercial'},
+    'taylor & francis': {'rating': 'good', 'type': 'commercial'},
+    
+    # 质量有争议的出版商
+    'mdpi': {'rating': 'questionable', 'type': 'open_access', 'note': 'Quality varies by journal'},
+    'hindawi': {'rating': 'questionable', 'type': 'open_access', 'note': 'Some quality concerns'},
+    'bentham science': {'rating': 'poor', 'type': 'commercial', 'note': 'Known predatory practices'},
+    'omics international': {'rating': 'poor', 'type': 'commercial', 'note': 'Predatory publisher'},
+})
+
+# 期刊数据库（键为小写期刊名，只读，所有实例共享）
+_JOURNAL_INFO: Mapping[str, Dict[str, Any]] = MappingProxyType({
+    # PHM核心期刊
+    'mechanical systems and signal processing': {
+        'impact_factor': 8.4, 'quartile': 'Q1', 'category': 'engineering',
+        'phm_relevance': 1.0, 'publisher': 'elsevier'
+    },
+    'ieee transactions on industrial electronics': {
+        'impact_factor': 8.2, 'quartile': 'Q1', 'category': 'engineering',
+        'phm_relevance': 0.9, 'publisher': 'ieee'
+    },
+    'reliability engineering & system safety': {
+        'impact_factor': 7.6, 'quartile': 'Q1', 'category': 'engineering',
+        'phm_relevance': 1.0, 'publisher': 'elsevier'
+    },
+    'expert systems with applications': {
+        'impact_factor': 8.5, 'quartile': 'Q1', 'category': 'computer_science',
+        'phm_relevance': 0.7, 'publisher': 'elsevier'
+    },
+    'applied soft computing': {
+        'impact_factor': 8.7, 'quartile': 'Q1', 'category': 'computer_science',
+        'phm_relevance': 0.6, 'publisher': 'elsevier'
+    },
+    'knowledge-based systems': {
+        'impact_factor': 8.8, 'quartile': 'Q1', 'category': 'computer_science',
+        'phm_relevance': 0.6, 'publisher': 'elsevier'
+    },
+    'ieee transactions on reliability': {
+        'impact_factor': 5.9, 'quartile': 'Q1', 'category': 'engineering',
+        'phm_relevance': 1.0, 'publisher': 'ieee'
+    },
+    'isa transactions': {
+        'impact_factor': 7.3, 'quartile': 'Q1', 'category': 'engineering',
+        'phm_relevance': 0.8, 'publisher': 'elsevier'
+    },
+    'measurement': {
+        'impact_factor': 5.6, 'quartile': 'Q1', 'category': 'engineering',
+        'phm_relevance': 0.7, 'publisher': 'elsevier'
+    },
+    'sensors': {
+        'impact_factor': 3.9, 'quartile': 'Q2', 'category': 'engineering',
+        'phm_relevance': 0.8, 'publisher': 'mdpi'
+    },
+    'neurocomputing': {
+        'impact_factor': 6.0, 'quartile': 'Q1', 'category': 'computer_science',
+        'phm_relevance': 0.5, 'publisher': 'elsevier'
+    }
+})
+
+# 自定义规则条件：形如 "citation_count > 100"，多个子句均需满足
+_RULE_CLAUSE_RE = re.compile(r'(\w+)\s*(==|!=|>=|<=|=|>|<)\s*(-?\d+(?:\.\d+)?)')
+_RULE_OPERATORS = {
+    '>': operator.gt,
+    '<': operator.lt,
+    '>=': operator.ge,
+    '<=': operator.le,
+    '=': operator.eq,
+    '==': operator.eq,
+    '!=': operator.ne,
+}
+
+# 默认过滤配置
+_DEFAULT_CONFIG: Dict[str, Any] = {
+    'quality_filters': {
+        'publisher_blacklist': [
+            'mdpi',
+            'hindawi', 
+            'bentham science',
+            'omics international',
+            'scientific research publishing',
+            'scirp',
+            'insight medical publishing'
+        ],
+        'publisher_whitelist': [
+            'ieee',
+            'elsevier',
+            'springer',
+            'nature publishing group',
+            'science',
+            'wiley',
+            'taylor & francis',
+            'american chemical society',
+            'american physical society',
+            'optical society of america'
+        ],
+        'impact_factor': {
+            'minimum': 3.0,
+            'preferred': 5.0,
+            'excellent': 8.0
+        },
+        'quartile': {
+            'minimum': 'Q3',
+            'preferred': 'Q2',
+            'excellent': 'Q1'
+        },
+        'phm_specific': {
+            'relevance_threshold': 0.6,
+            'core_venues': [
+                'Mechanical Systems and Signal Processing',
+                'IEEE Transactions on Industrial Electronics',
+                'Reliability Engineering & System Safety',
+                'Expert Systems with Applications',
+                'Applied Soft Computing',
+                'Knowledge-Based Systems',
+                'IEEE Transactions on Reliability',
+                'ISA Transactions',
+                'Measurement',
+                'Sensors',
+                'Neurocomputing'
+            ]
+        }
+    }
+}
+
+
+@lru_cache(maxsize=256)
+def _compile_rule_condition(condition: str) -> Tuple[Tuple[str, Any, float], ...]:
+    """
+    将自定义规则条件解析为 (字段, 比较函数, 阈值) 子句
+    
+    Args:
+        condition: 条件字符串，如 "citation_count > 100 and year >= 2020"
+        
+    Returns:
+        子句元组；无法解析时为空元组（规则永不命中）
+    """
+    return tuple(
+        (field, _RULE_OPERATORS[op], float(threshold))
+        for field, op, threshold in _RULE_CLAUSE_RE.findall(condition or '')
+    )
+
+
+def _rule_matches(clauses: Tuple[Tuple[str, Any, float], ...], paper: Dict[str, Any]) -> bool:
+    """判断论文是否满足已解析的规则条件"""
+    return bool(clauses) and all(compare(paper.get(field) or 0, threshold)
+                                 for field, compare, threshold in clauses)
+
 
 @dataclass
 class FilterCriteria:
@@ -37,6 +269,15 @@ class FilterCriteria:
             self.include_publishers = []
         if self.custom_rules is None:
             self.custom_rules = []
+        
+        # 预先计算小写出版商集合，避免每篇论文重复lower()和线性查找
+        self._exclude_set = frozenset(p.lower() for p in self.exclude_publishers)
+        self._include_set = frozenset(p.lower() for p in self.include_publishers)
+        
+        # 自定义规则条件只解析一次
+        self._compiled_rules = [
+            (rule, _compile_rule_condition(rule.get('condition', ''))) for rule in self.custom_rules
+        ]
 
 
 class PaperQualityFilter:
@@ -57,153 +298,150 @@ class PaperQualityFilter:
         self.config_path = config_path
         self.load_configuration()
         
+        # (期刊, 出版商) -> 类别评分，数据库重新加载时清空
+        self._categorical_cache: OrderedDict = OrderedDict()
+        
         # 预定义的出版商信息
         self._load_publisher_database()
         
         # 预定义的期刊信息
         self._load_journal_database()
     
+    def __getstate__(self) -> Dict[str, Any]:
+        """进程池pickle时不传递共享的只读数据库（mappingproxy不可pickle）和缓存"""
+        state = self.__dict__.copy()
+        for name, shared in (('publisher_info', _PUBLISHER_INFO), ('journal_info', _JOURNAL_INFO)):
+            state[name] = None if state[name] is shared else dict(state[name])
+        state['_categorical_cache'] = OrderedDict()
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        if self.publisher_info is None:
+            self.publisher_info = _PUBLISHER_INFO
+        if self.journal_info is None:
+            self.journal_info = _JOURNAL_INFO
+    
     def load_configuration(self):
         """加载过滤配置"""
         if self.config_path and Path(self.config_path).exists():
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                self.config = yaml.safe_load(f)
+            self.config = self._load_yaml_cached(Path(self.config_path))
         else:
             # 使用默认配置
             self.config = self._get_default_config()
         
-        logger.info(f"Loaded quality filter configuration")
+        logger.info("Loaded quality filter configuration")
+    
+    def _load_yaml_cached(self, config_path: Path) -> Dict[str, Any]:
+        """
+        解析YAML配置，并以路径+mtime+size为键缓存为JSON文件
+        
+        缓存使用JSON而非pickle，读取缓存不会执行任何代码；
+        无法以JSON无损表示的配置（如日期、非字符串键）不缓存。
+        
+        Args:
+            config_path: YAML配置文件路径
+            
+        Returns:
+            解析后的配置字典
+        """
+        stat = config_path.stat()
+        resolved = str(config_path.resolve())
+        cache_key = [resolved, stat.st_mtime_ns, stat.st_size]
+        cache_name = hashlib.blake2b(resolved.encode('utf-8'), digest_size=16).hexdigest()
+        cache_path = _CONFIG_CACHE_DIR / f'{cache_name}.json'
+        
+        # 缓存缺失、损坏或来自其他版本时均视为未命中，重新解析YAML
+        try:
+            cached = json.loads(cache_path.read_bytes())
+            if isinstance(cached, dict) and cached.get('key') == cache_key and 'config' in cached:
+                return cached['config']
+        except (OSError, ValueError):
+            pass
+        
+        with open(config_path, 'r', encoding='utf-8') as f:
+            config = yaml.load(f, Loader=_YamlLoader)
+        
+        # 只缓存能经JSON无损往返的配置
+        try:
+            payload = json.dumps({'key': cache_key, 'config': config}, ensure_ascii=False)
+        except (TypeError, ValueError):
+            return config
+        if json.loads(payload)['config'] != config:
+            return config
+        
+        # 原子写入缓存；目录不可写时仅跳过缓存
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=str(cache_path.parent), prefix=cache_path.name, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(payload)
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.debug("Could not write config cache %s: %s", cache_path, e)
+        
+        return config
     
     def _get_default_config(self) -> Dict[str, Any]:
         """获取默认过滤配置"""
-        return {
-            'quality_filters': {
-                'publisher_blacklist': [
-                    'mdpi',
-                    'hindawi', 
-                    'bentham science',
-                    'omics international',
-                    'scientific research publishing',
-                    'scirp',
-                    'insight medical publishing'
-                ],
-                'publisher_whitelist': [
-                    'ieee',
-                    'elsevier',
-                    'springer',
-                    'nature publishing group',
-                    'science',
-                    'wiley',
-                    'taylor & francis',
-                    'american chemical society',
-                    'american physical society',
-                    'optical society of america'
-                ],
-                'impact_factor': {
-                    'minimum': 3.0,
-                    'preferred': 5.0,
-                    'excellent': 8.0
-                },
-                'quartile': {
-                    'minimum': 'Q3',
-                    'preferred': 'Q2',
-                    'excellent': 'Q1'
-                },
-                'phm_specific': {
-                    'relevance_threshold': 0.6,
-                    'core_venues': [
-                        'Mechanical Systems and Signal Processing',
-                        'IEEE Transactions on Industrial Electronics',
-                        'Reliability Engineering & System Safety',
-                        'Expert Systems with Applications',
-                        'Applied Soft Computing',
-                        'Knowledge-Based Systems',
-                        'IEEE Transactions on Reliability',
-                        'ISA Transactions',
-                        'Measurement',
-                        'Sensors',
-                        'Neurocomputing'
-                    ]
-                }
-            }
-        }
+        return copy.deepcopy(_DEFAULT_CONFIG)
     
     def _load_publisher_database(self):
         """加载出版商数据库"""
-        self.publisher_info = {
-            # 知名出版商及其评级
-            'ieee': {'rating': 'excellent', 'type': 'technical_society'},
-            'elsevier': {'rating': 'excellent', 'type': 'commercial'},
-            'springer': {'rating': 'excellent', 'type': 'commercial'},
-            'nature publishing group': {'rating': 'excellent', 'type': 'commercial'},
-            'wiley': {'rating': 'excellent', 'type': 'commercial'},
-            'taylor & francis': {'rating': 'good', 'type': 'commercial'},
-            
-            # 质量有争议的出版商
-            'mdpi': {'rating': 'questionable', 'type': 'open_access', 'note': 'Quality varies by journal'},
-            'hindawi': {'rating': 'questionable', 'type': 'open_access', 'note': 'Some quality concerns'},
-            'bentham science': {'rating': 'poor', 'type': 'commercial', 'note': 'Known predatory practices'},
-            'omics international': {'rating': 'poor', 'type': 'commercial', 'note': 'Predatory publisher'},
-        }
+        self.publisher_info = _PUBLISHER_INFO
+        self._categorical_cache.clear()
     
     def _load_journal_database(self):
         """加载期刊数据库"""
-        self.journal_info = {
-            # PHM核心期刊
-            'mechanical systems and signal processing': {
-                'impact_factor': 8.4, 'quartile': 'Q1', 'category': 'engineering',
-                'phm_relevance': 1.0, 'publisher': 'elsevier'
-            },
-            'ieee transactions on industrial electronics': {
-                'impact_factor': 8.2, 'quartile': 'Q1', 'category': 'engineering',
-                'phm_relevance': 0.9, 'publisher': 'ieee'
-            },
-            'reliability engineering & system safety': {
-                'impact_factor': 7.6, 'quartile': 'Q1', 'category': 'engineering',
-                'phm_relevance': 1.0, 'publisher': 'elsevier'
-            },
-            'expert systems with applications': {
-                'impact_factor': 8.5, 'quartile': 'Q1', 'category': 'computer_science',
-                'phm_relevance': 0.7, 'publisher': 'elsevier'
-            },
-            'applied soft computing': {
-                'impact_factor': 8.7, 'quartile': 'Q1', 'category': 'computer_science',
-                'phm_relevance': 0.6, 'publisher': 'elsevier'
-            },
-            'knowledge-based systems': {
-                'impact_factor': 8.8, 'quartile': 'Q1', 'category': 'computer_science',
-                'phm_relevance': 0.6, 'publisher': 'elsevier'
-            },
-            'ieee transactions on reliability': {
-                'impact_factor': 5.9, 'quartile': 'Q1', 'category': 'engineering',
-                'phm_relevance': 1.0, 'publisher': 'ieee'
-            },
-            'isa transactions': {
-                'impact_factor': 7.3, 'quartile': 'Q1', 'category': 'engineering',
-                'phm_relevance': 0.8, 'publisher': 'elsevier'
-            },
-            'measurement': {
-                'impact_factor': 5.6, 'quartile': 'Q1', 'category': 'engineering',
-                'phm_relevance': 0.7, 'publisher': 'elsevier'
-            },
-            'sensors': {
-                'impact_factor': 3.9, 'quartile': 'Q2', 'category': 'engineering',
-                'phm_relevance': 0.8, 'publisher': 'mdpi'
-            },
-            'neurocomputing': {
-                'impact_factor': 6.0, 'quartile': 'Q1', 'category': 'computer_science',
-                'phm_relevance': 0.5, 'publisher': 'elsevier'
-            }
-        }
+        self.journal_info = _JOURNAL_INFO
+        self._categorical_cache.clear()
     
     def filter_papers(self, papers: List[Dict[str, Any]], 
-                     criteria: Optional[FilterCriteria] = None) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+                     criteria: Optional[FilterCriteria] = None,
+                     top_k: Optional[int] = None) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
         """
         过滤论文列表
         
         Args:
             papers: 论文元数据列表
             criteria: 过滤标准，如果为None则使用默认配置
+            top_k: 只返回分数最高的前K篇论文，None表示返回全部
+            
+        Returns:
+            (filtered_papers, filter_report) 过滤后的论文列表和过滤报告
+        """
+        filter_report = {}
+        filtered_papers = list(self.iter_filter_papers(papers, criteria, top_k=top_k, report=filter_report))
+        
+        # 按质量分数排序（top_k时迭代器已按分数降序输出）
+        if top_k is None:
+            filtered_papers.sort(key=operator.itemgetter('filter_score'), reverse=True)
+        
+        logger.info(f"Filtered {len(papers)} papers to {len(filtered_papers)} papers ({filter_report['filter_rate']:.2%} filtered out)")
+        
+        return filtered_papers, filter_report
+    
+    def filter_papers_parallel(self, papers: List[Dict[str, Any]],
+                               criteria: Optional[FilterCriteria] = None,
+                               workers: Optional[int] = None,
+                               chunksize: int = 512,
+                               top_k: Optional[int] = None) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        在多个进程中分块过滤论文列表，结果与filter_papers一致
+        
+        小列表（或单进程）直接走串行路径；进程池失败时回退到串行过滤。
+        并行路径返回的是子进程中处理过的论文副本，输入字典不会被修改。
+        
+        Args:
+            papers: 论文元数据列表
+            criteria: 过滤标准，如果为None则使用默认配置
+            workers: 进程数，默认为CPU核数
+            chunksize: 每个任务处理的论文数
+            top_k: 只返回分数最高的前K篇论文，None表示返回全部
             
         Returns:
             (filtered_papers, filter_report) 过滤后的论文列表和过滤报告
@@ -211,45 +449,145 @@ class PaperQualityFilter:
         if criteria is None:
             criteria = self._get_default_filter_criteria()
         
+        workers = workers or os.cpu_count() or 1
+        if workers <= 1 or len(papers) < _PARALLEL_FILTER_MIN_PAPERS:
+            return self.filter_papers(papers, criteria, top_k=top_k)
+        
+        chunks = [papers[i:i + chunksize] for i in range(0, len(papers), chunksize)]
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                chunk_results = list(executor.map(self._filter_chunk, chunks, repeat(criteria)))
+        except Exception as e:
+            logger.warning("Parallel paper filtering failed, running serially: %s", e)
+            return self.filter_papers(papers, criteria, top_k=top_k)
+        
+        # 合并各块结果（块按输入顺序返回，保证同分论文的相对顺序不变）
         filtered_papers = []
+        filter_reasons = Counter()
+        for chunk_papers, chunk_reasons in chunk_results:
+            filtered_papers.extend(chunk_papers)
+            filter_reasons.update(chunk_reasons)
+        
+        total = len(papers)
         filter_report = {
-            'total_papers': len(papers),
-            'filtered_papers': 0,
-            'filter_reasons': {},
+            'total_papers': total,
+            'filtered_papers': len(filtered_papers),
+            'filter_reasons': filter_reasons,
             'quality_distribution': {},
             'publisher_distribution': {},
-            'statistics': {}
+            'statistics': {},
+            'filter_rate': (total - len(filtered_papers)) / total if total else 0
         }
         
-        for paper in papers:
-            # 评估论文质量
-            quality_assessment = self.assess_paper_quality(paper)
+        score_key = operator.itemgetter('filter_score')
+        if top_k is not None:
+            filtered_papers = heapq.nlargest(top_k, filtered_papers, key=score_key)
+        else:
+            filtered_papers.sort(key=score_key, reverse=True)
+        
+        logger.info(f"Filtered {total} papers to {len(filtered_papers)} papers ({filter_report['filter_rate']:.2%} filtered out) with {workers} workers")
+        
+        return filtered_papers, filter_report
+    
+    def _filter_chunk(self, papers: List[Dict[str, Any]],
+                      criteria: FilterCriteria) -> Tuple[List[Dict[str, Any]], Counter]:
+        """过滤一块论文（进程池任务），返回通过的论文和过滤原因计数"""
+        report = {}
+        accepted = list(self.iter_filter_papers(papers, criteria, report=report))
+        return accepted, report['filter_reasons']
+    
+    def iter_filter_papers(self, papers: Iterable[Dict[str, Any]],
+                           criteria: Optional[FilterCriteria] = None,
+                           top_k: Optional[int] = None,
+                           report: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        流式过滤论文，通过的论文按输入顺序逐批产出
+        
+        输入可以是任意迭代器，每次只缓存一小批论文用于批量评估。
+        
+        Args:
+            papers: 论文元数据的可迭代对象
+            criteria: 过滤标准，如果为None则使用默认配置
+            top_k: 只保留分数最高的前K篇论文，在输入耗尽后按分数降序产出
+            report: 可选字典，过滤过程中增量写入过滤报告
             
-            # 应用过滤标准
-            filter_result = self._apply_filter_criteria(paper, quality_assessment, criteria)
+        Yields:
+            通过过滤的论文（已添加quality_assessment和filter_score）
+        """
+        if criteria is None:
+            criteria = self._get_default_filter_criteria()
+        if report is None:
+            report = {}
+        
+        filter_reasons = Counter()
+        report.update({
+            'total_papers': 0,
+            'filtered_papers': 0,
+            'filter_reasons': filter_reasons,
+            'quality_distribution': {},
+            'publisher_distribution': {},
+            'statistics': {}
+        })
+        
+        # top_k时维护大小为K的最小堆，序号保证同分时保留先出现的论文
+        heap = []
+        seq = 0
+        chunk = []
+        chunk_keys = []
+        papers_iter = iter(papers)
+        
+        while True:
+            # 先做廉价检查，被拒绝的论文无需完整质量评估；
+            # 小写期刊名和出版商每篇只计算一次，供评估阶段复用
+            for paper in papers_iter:
+                report['total_papers'] += 1
+                venue_lc = (paper.get('venue') or '').lower()
+                publisher = self._extract_publisher(paper, venue_lc)
+                reject_reason = next(self._iter_cheap_rejections(paper, criteria, publisher), None)
+                if reject_reason is not None:
+                    filter_reasons[reject_reason] += 1
+                else:
+                    chunk.append(paper)
+                    chunk_keys.append((venue_lc, publisher))
+                    if len(chunk) >= _STREAM_CHUNK_SIZE:
+                        break
+            if not chunk:
+                break
             
-            if filter_result['passed']:
+            # 批量评估剩余论文的质量
+            for paper, quality_assessment in zip(chunk, self._assess_batch(chunk, chunk_keys)):
+                # 应用依赖评估结果的过滤标准
+                filter_result = self._apply_assessment_criteria(paper, quality_assessment, criteria)
+                
+                if not filter_result['passed']:
+                    # 记录过滤原因
+                    filter_reasons.update(filter_result['reasons'])
+                    continue
+                
                 # 添加质量评估信息到论文元数据
-                paper['quality_assessment'] = quality_assessment
+                paper['quality_assessment'] = quality_assessment.to_dict()
                 paper['filter_score'] = filter_result['score']
-                filtered_papers.append(paper)
-            else:
-                # 记录过滤原因
-                for reason in filter_result['reasons']:
-                    filter_report['filter_reasons'][reason] = filter_report['filter_reasons'].get(reason, 0) + 1
-        
-        # 生成统计报告
-        filter_report['filtered_papers'] = len(filtered_papers)
-        filter_report['filter_rate'] = (len(papers) - len(filtered_papers)) / len(papers) if papers else 0
+                report['filtered_papers'] += 1
+                
+                if top_k is None:
+                    yield paper
+                elif top_k > 0:
+                    entry = (paper['filter_score'], -seq, paper)
+                    seq += 1
+                    if len(heap) < top_k:
+                        heapq.heappush(heap, entry)
+                    elif entry[:2] > heap[0][:2]:
+                        heapq.heapreplace(heap, entry)
+            chunk = []
+            chunk_keys = []
         
-        # 按质量分数排序
-        filtered_papers.sort(key=lambda x: x.get('filter_score', 0), reverse=True)
+        total = report['total_papers']
+        report['filter_rate'] = (total - report['filtered_papers']) / total if total else 0
         
-        logger.info(f"Filtered {len(papers)} papers to {len(filtered_papers)} papers ({filter_report['filter_rate']:.2%} filtered out)")
-        
-        return filtered_papers, filter_report
+        for _, _, paper in sorted(heap, key=operator.itemgetter(0, 1), reverse=True):
+            yield paper
     
-    def assess_paper_quality(self, paper: Dict[str, Any]) -> Dict[str, Any]:
+    def assess_paper_quality(self, paper: Dict[str, Any]) -> QualityAssessment:
         """
         评估单篇论文的质量
         
@@ -259,121 +597,200 @@ class PaperQualityFilter:
         Returns:
             质量评估结果
         """
-        assessment = {
-            'overall_score': 0.0,
-            'venue_score': 0.0,
-            'publisher_score': 0.0,
-            'impact_score': 0.0,
-            'citation_score': 0.0,
-            'phm_relevance_score': 0.0,
-            'quality_tier': 'unknown',
-            'warnings': [],
-            'strengths': []
-        }
-        
         # 获取基本信息
-        venue = paper.get('venue', '').lower().strip()
-        publisher = self._extract_publisher(paper)
+        venue_lc = (paper.get('venue') or '').lower()
+        publisher = self._extract_publisher(paper, venue_lc)
         impact_factor = paper.get('impact_factor', 0.0)
         citation_count = paper.get('citation_count', 0)
         phm_relevance = paper.get('phm_relevance_score', 0.0)
         year = paper.get('year', 2024)
         
         # 1. 期刊/会议评分 (40%)
-        venue_info = self.journal_info.get(venue, {})
+        # 2. 出版商评分 (20%)
+        venue_info, publisher_info, venue_score, publisher_score = self._categorical_scores(
+            venue_lc, publisher.lower() if publisher else None
+        )
+        
+        # 3. 影响因子评分 (15%)
+        impact_score = self._calculate_impact_score(impact_factor)
+        
+        # 4. 引用数评分 (15%)
+        citation_score = self._calculate_citation_score(citation_count, year)
+        
+        # 5. PHM相关性评分 (10%)
+        # 计算总分
+        overall_score = (
+            venue_score * 0.4 +
+            publisher_score * 0.2 +
+            impact_score * 0.15 +
+            citation_score * 0.15 +
+            phm_relevance * 0.1
+        )
+        
+        return self._build_assessment(
+            venue_info, publisher_info, impact_factor, citation_count, phm_relevance,
+            venue_score, publisher_score, impact_score, citation_score, overall_score,
+            self._determine_quality_tier(overall_score)
+        )
+    
+    def assess_papers_batch(self, papers: List[Dict[str, Any]]) -> List[QualityAssessment]:
+        """
+        批量评估论文质量，数值评分以NumPy向量化计算
+        
+        Args:
+            papers: 论文元数据列表
+            
+        Returns:
+            与papers一一对应的质量评估结果，与assess_paper_quality结果一致
+        """
+        keys = []
+        for paper in papers:
+            venue_lc = (paper.get('venue') or '').lower()
+            keys.append((venue_lc, self._extract_publisher(paper, venue_lc)))
+        return self._assess_batch(papers, keys)
+    
+    def _assess_batch(self, papers: List[Dict[str, Any]],
+                      keys: List[Tuple[str, Optional[str]]]) -> List[QualityAssessment]:
+        """批量评估论文质量，keys为每篇论文已计算好的 (小写期刊名, 出版商)"""
+        n = len(papers)
+        if not n:
+            return []
+        
+        categorical = [
+            self._categorical_scores(venue_lc, publisher.lower() if publisher else None)
+            for venue_lc, publisher in keys
+        ]
+        
+        impact_factors = [paper.get('impact_factor', 0.0) for paper in papers]
+        citation_counts = [paper.get('citation_count', 0) for paper in papers]
+        relevances = [paper.get('phm_relevance_score', 0.0) for paper in papers]
+        
+        impact = np.fromiter(impact_factors, dtype=np.float64, count=n)
+        citations = np.fromiter(citation_counts, dtype=np.float64, count=n)
+        relevance = np.fromiter(relevances, dtype=np.float64, count=n)
+        ages = 2024 - np.fromiter((paper.get('year', 2024) for paper in papers), dtype=np.float64, count=n)
+        
+        venue_scores = np.fromiter((c[2] for c in categorical), dtype=np.float64, count=n)
+        publisher_scores = np.fromiter((c[3] for c in categorical), dtype=np.float64, count=n)
+        # digitize(right=False)等价于bisect_right，right=True等价于bisect_left
+        impact_scores = _IMPACT_SCORE_TABLE[np.digitize(impact, _IMPACT_THRESHOLDS)]
+        expected = _EXPECTED_CITATION_TABLE[np.digitize(ages, _CITATION_AGE_LIMITS, right=True)]
+        citation_scores = np.minimum(citations / expected, 1.0)
+        
+        overall_scores = (
+            venue_scores * 0.4 +
+            publisher_scores * 0.2 +
+            impact_scores * 0.15 +
+            citation_scores * 0.15 +
+            relevance * 0.1
+        )
+        tier_indices = np.digitize(overall_scores, _TIER_THRESHOLDS)
+        
+        return [
+            self._build_assessment(
+                categorical[i][0], categorical[i][1], impact_factors[i], citation_counts[i], relevances[i],
+                float(venue_scores[i]), float(publisher_scores[i]), float(impact_scores[i]),
+                float(citation_scores[i]), float(overall_scores[i]), _TIERS[tier_indices[i]]
+            )
+            for i in range(n)
+        ]
+    
+    def _categorical_scores(self, venue: str, publisher: Optional[str]
+                            ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]], float, float]:
+        """
+        查询期刊与出版商信息及其评分（按 (期刊, 出版商) 缓存）
+        
+        Args:
+            venue: 小写期刊名（可含首尾空白）
+            publisher: 小写出版商名，未知时为None
+            
+        Returns:
+            (venue_info, publisher_info, venue_score, publisher_score)，
+            没有出版商时publisher_info为None
+        """
+        key = (venue, publisher)
+        cached = self._categorical_cache.get(key)
+        if cached is not None:
+            self._categorical_cache.move_to_end(key)
+            return cached
+        
+        # 期刊名仅在未命中时才去除首尾空白重试
+        venue_info = self.journal_info.get(venue) or self.journal_info.get(venue.strip(), {})
+        publisher_info = self.publisher_info.get(publisher, {}) if publisher else None
+        cached = (
+            venue_info,
+            publisher_info,
+            self._calculate_venue_score(venue_info) if venue_info else 0.0,
+            self._calculate_publisher_score(publisher_info) if publisher_info is not None else 0.0,
+        )
+        
+        self._categorical_cache[key] = cached
+        if len(self._categorical_cache) > _CATEGORICAL_CACHE_SIZE:
+            self._categorical_cache.popitem(last=False)
+        return cached
+    
+    def _build_assessment(self, venue_info: Dict[str, Any], publisher_info: Optional[Dict[str, Any]],
+                          impact_factor: float, citation_count: int, phm_relevance: float,
+                          venue_score: float, publisher_score: float, impact_score: float,
+                          citation_score: float, overall_score: float, quality_tier: str) -> QualityAssessment:
+        """组装质量评估结果，并生成优势与警告说明"""
+        warnings = []
+        strengths = []
+        
         if venue_info:
-            assessment['venue_score'] = self._calculate_venue_score(venue_info)
             if venue_info.get('quartile') == 'Q1':
-                assessment['strengths'].append('Published in Q1 journal')
+                strengths.append('Published in Q1 journal')
         else:
-            assessment['warnings'].append('Unknown venue quality')
+            warnings.append('Unknown venue quality')
         
-        # 2. 出版商评分 (20%)
-        if publisher:
-            publisher_info = self.publisher_info.get(publisher.lower(), {})
-            assessment['publisher_score'] = self._calculate_publisher_score(publisher_info)
+        if publisher_info is not None:
             if publisher_info.get('rating') == 'excellent':
-                assessment['strengths'].append('Excellent publisher')
+                strengths.append('Excellent publisher')
             elif publisher_info.get('rating') in ['questionable', 'poor']:
-                assessment['warnings'].append(f'Publisher quality concern: {publisher_info.get("note", "")}')
+                warnings.append(f'Publisher quality concern: {publisher_info.get("note", "")}')
         
-        # 3. 影响因子评分 (15%)
-        assessment['impact_score'] = self._calculate_impact_score(impact_factor)
         if impact_factor >= 8.0:
-            assessment['strengths'].append('High impact factor')
+            strengths.append('High impact factor')
         elif impact_factor < 3.0:
-            assessment['warnings'].append('Low impact factor')
+            warnings.append('Low impact factor')
         
-        # 4. 引用数评分 (15%)
-        assessment['citation_score'] = self._calculate_citation_score(citation_count, year)
         if citation_count > 100:
-            assessment['strengths'].append('High citation count')
+            strengths.append('High citation count')
         
-        # 5. PHM相关性评分 (10%)
-        assessment['phm_relevance_score'] = phm_relevance
         if phm_relevance >= 0.8:
-            assessment['strengths'].append('High PHM relevance')
+            strengths.append('High PHM relevance')
         elif phm_relevance < 0.5:
-            assessment['warnings'].append('Low PHM relevance')
+            warnings.append('Low PHM relevance')
         
-        # 计算总分
-        assessment['overall_score'] = (
-            assessment['venue_score'] * 0.4 +
-            assessment['publisher_score'] * 0.2 +
-            assessment['impact_score'] * 0.15 +
-            assessment['citation_score'] * 0.15 +
-            assessment['phm_relevance_score'] * 0.1
+        return QualityAssessment(
+            overall_score=overall_score,
+            venue_score=venue_score,
+            publisher_score=publisher_score,
+            impact_score=impact_score,
+            citation_score=citation_score,
+            phm_relevance_score=phm_relevance,
+            quality_tier=quality_tier,
+            warnings=warnings,
+            strengths=strengths
         )
-        
-        # 确定质量等级
-        assessment['quality_tier'] = self._determine_quality_tier(assessment['overall_score'])
-        
-        return assessment
     
     def _calculate_venue_score(self, venue_info: Dict[str, Any]) -> float:
         """计算期刊/会议评分"""
         if not venue_info:
             return 0.2
         
-        quartile = venue_info.get('quartile', 'Q4')
-        if quartile == 'Q1':
-            return 1.0
-        elif quartile == 'Q2':
-            return 0.8
-        elif quartile == 'Q3':
-            return 0.6
-        else:
-            return 0.4
+        return _QUARTILE_SCORE.get(venue_info.get('quartile', 'Q4'), 0.4)
     
     def _calculate_publisher_score(self, publisher_info: Dict[str, Any]) -> float:
         """计算出版商评分"""
         if not publisher_info:
             return 0.5
         
-        rating = publisher_info.get('rating', 'unknown')
-        if rating == 'excellent':
-            return 1.0
-        elif rating == 'good':
-            return 0.8
-        elif rating == 'questionable':
-            return 0.4
-        elif rating == 'poor':
-            return 0.1
-        else:
-            return 0.5
+        return _PUBLISHER_RATING_SCORE.get(publisher_info.get('rating', 'unknown'), 0.5)
     
     def _calculate_impact_score(self, impact_factor: float) -> float:
         """计算影响因子评分"""
-        if impact_factor >= 8.0:
-            return 1.0
-        elif impact_factor >= 5.0:
-            return 0.8
-        elif impact_factor >= 3.0:
-            return 0.6
-        elif impact_factor >= 1.0:
-            return 0.4
-        else:
-            return 0.2
+        return _IMPACT_SCORES[bisect_right(_IMPACT_THRESHOLDS, impact_factor)]
     
     def _calculate_citation_score(self, citation_count: int, year: int) -> float:
         """计算引用数评分（考虑时间因素）"""
@@ -381,130 +798,117 @@ class PaperQualityFilter:
         age = current_year - year
         
         # 根据论文年龄调整期望引用数
-        if age <= 1:
-            expected_citations = 5
-        elif age <= 2:
-            expected_citations = 15
-        elif age <= 5:
-            expected_citations = 30
-        else:
-            expected_citations = 50
+        expected_citations = _EXPECTED_CITATIONS[bisect_left(_CITATION_AGE_LIMITS, age)]
         
         ratio = citation_count / expected_citations
         return min(ratio, 1.0)
     
     def _determine_quality_tier(self, score: float) -> str:
         """确定质量等级"""
-        if score >= 0.85:
-            return 'excellent'
-        elif score >= 0.70:
-            return 'good'
-        elif score >= 0.55:
-            return 'acceptable'
-        elif score >= 0.40:
-            return 'questionable'
-        else:
-            return 'poor'
+        return _TIERS[bisect_right(_TIER_THRESHOLDS, score)]
     
-    def _extract_publisher(self, paper: Dict[str, Any]) -> Optional[str]:
-        """从论文信息中提取出版商"""
+    def _extract_publisher(self, paper: Dict[str, Any], venue_lc: Optional[str] = None) -> Optional[str]:
+        """从论文信息中提取出版商（venue_lc为调用方已计算的小写期刊名）"""
         # 直接从元数据获取
         if 'publisher' in paper:
             return paper['publisher']
         
-        # 从期刊名称推断
-        venue = paper.get('venue', '').lower()
-        
-        if 'ieee' in venue:
-            return 'ieee'
-        elif any(keyword in venue for keyword in ['elsevier', 'science direct']):
-            return 'elsevier'
-        elif 'springer' in venue:
-            return 'springer'
-        elif 'nature' in venue:
-            return 'nature publishing group'
-        elif 'wiley' in venue:
-            return 'wiley'
-        elif 'mdpi' in venue:
-            return 'mdpi'
-        elif 'hindawi' in venue:
-            return 'hindawi'
-        
-        # 从DOI推断
+        # 从期刊名称推断：一次正则扫描找出所有关键词，取优先级最高者
+        if venue_lc is None:
+            venue_lc = (paper.get('venue') or '').lower()
+        tokens = _VENUE_TOKEN_RE.findall(venue_lc)
+        if tokens:
+            return _VENUE_TOKEN_PUBLISHER[min(tokens, key=_VENUE_TOKEN_PRIORITY.__getitem__)]
+        
+        # 从DOI注册前缀推断
         doi = paper.get('doi', '')
         if doi:
-            if '10.1109' in doi:
-                return 'ieee'
-            elif '10.1016' in doi:
-                return 'elsevier'
-            elif '10.1007' in doi:
-                return 'springer'
-            elif '10.1038' in doi:
-                return 'nature publishing group'
-            elif '10.3390' in doi:
-                return 'mdpi'
+            match = _DOI_PREFIX_RE.search(doi)
+            if match:
+                return _DOI_PREFIX_PUBLISHER.get(match.group())
         
         return None
     
     def _apply_filter_criteria(self, paper: Dict[str, Any], 
-                              assessment: Dict[str, Any], 
+                              assessment: QualityAssessment, 
                               criteria: FilterCriteria) -> Dict[str, Any]:
-        """应用过滤标准"""
-        result = {
-            'passed': True,
-            'reasons': [],
-            'score': assessment['overall_score']
-        }
-        
-        publisher = self._extract_publisher(paper)
-        venue = paper.get('venue', '').lower()
-        impact_factor = paper.get('impact_factor', 0.0)
-        quartile = assessment.get('venue_score', 0.0)
-        citation_count = paper.get('citation_count', 0)
-        phm_relevance = paper.get('phm_relevance_score', 0.0)
-        paper_type = paper.get('venue_type', paper.get('type', 'journal'))
-        
-        # 1. 出版商黑名单检查
-        if publisher and publisher.lower() in [p.lower() for p in criteria.exclude_publishers]:
+        """应用全部过滤标准，并收集所有未通过的原因"""
+        result = self._apply_assessment_criteria(paper, assessment, criteria)
+        cheap_reasons = list(self._iter_cheap_rejections(paper, criteria, self._extract_publisher(paper)))
+        if cheap_reasons:
             result['passed'] = False
-            result['reasons'].append(f'Excluded publisher: {publisher}')
+            result['reasons'] = cheap_reasons + result['reasons']
         
-        # 2. 出版商白名单检查（如果指定了白名单）
-        if criteria.include_publishers and publisher:
-            if publisher.lower() not in [p.lower() for p in criteria.include_publishers]:
-                result['passed'] = False
-                result['reasons'].append(f'Not in approved publisher list: {publisher}')
+        return result
+    
+    def _fast_reject(self, paper: Dict[str, Any], criteria: FilterCriteria) -> Optional[str]:
+        """
+        只用论文元数据做廉价检查，返回第一个未通过的原因
         
-        # 3. 影响因子检查
-        if impact_factor > 0 and impact_factor < criteria.min_impact_factor:
-            result['passed'] = False
-            result['reasons'].append(f'Impact factor {impact_factor} below minimum {criteria.min_impact_factor}')
+        Args:
+            paper: 论文元数据
+            criteria: 过滤标准
+            
+        Returns:
+            拒绝原因；全部通过时返回None
+        """
+        return next(self._iter_cheap_rejections(paper, criteria, self._extract_publisher(paper)), None)
+    
+    def _iter_cheap_rejections(self, paper: Dict[str, Any],
+                               criteria: FilterCriteria,
+                               publisher: Optional[str]) -> Iterator[str]:
+        """按开销从低到高生成不依赖质量评估的拒绝原因（publisher为已提取的出版商）"""
+        if publisher:
+            publisher_lc = publisher.lower()
+            
+            # 1. 出版商黑名单检查
+            if publisher_lc in criteria._exclude_set:
+                yield f'Excluded publisher: {publisher}'
+            
+            # 2. 出版商白名单检查（如果指定了白名单）
+            if criteria._include_set and publisher_lc not in criteria._include_set:
+                yield f'Not in approved publisher list: {publisher}'
         
-        # 4. 期刊分级检查
-        quartile_scores = {'Q1': 1.0, 'Q2': 0.8, 'Q3': 0.6, 'Q4': 0.4}
-        min_quartile_score = quartile_scores.get(criteria.min_quartile, 0.0)
-        if assessment['venue_score'] < min_quartile_score:
-            result['passed'] = False
-            result['reasons'].append(f'Journal quality below {criteria.min_quartile}')
+        # 3. 预印本检查
+        if not criteria.allow_preprints:
+            paper_type = paper.get('venue_type', paper.get('type', 'journal'))
+            if paper_type in ['preprint', 'arxiv']:
+                yield 'Preprints not allowed'
         
-        # 5. 引用数检查
+        # 4. 引用数检查
+        citation_count = paper.get('citation_count', 0)
         if citation_count < criteria.min_citation_count:
-            result['passed'] = False
-            result['reasons'].append(f'Citation count {citation_count} below minimum {criteria.min_citation_count}')
+            yield f'Citation count {citation_count} below minimum {criteria.min_citation_count}'
+        
+        # 5. 影响因子检查
+        impact_factor = paper.get('impact_factor', 0.0)
+        if impact_factor > 0 and impact_factor < criteria.min_impact_factor:
+            yield f'Impact factor {impact_factor} below minimum {criteria.min_impact_factor}'
         
         # 6. PHM相关性检查
+        phm_relevance = paper.get('phm_relevance_score', 0.0)
         if phm_relevance < criteria.phm_relevance_threshold:
-            result['passed'] = False
-            result['reasons'].append(f'PHM relevance {phm_relevance:.2f} below threshold {criteria.phm_relevance_threshold}')
+            yield f'PHM relevance {phm_relevance:.2f} below threshold {criteria.phm_relevance_threshold}'
+    
+    def _apply_assessment_criteria(self, paper: Dict[str, Any],
+                                   assessment: QualityAssessment,
+                                   criteria: FilterCriteria) -> Dict[str, Any]:
+        """应用依赖质量评估结果的过滤标准（期刊分级、自定义规则）"""
+        result = {
+            'passed': True,
+            'reasons': [],
+            'score': assessment.overall_score
+        }
         
-        # 7. 预印本检查
-        if not criteria.allow_preprints and paper_type in ['preprint', 'arxiv']:
+        # 期刊分级检查
+        min_quartile_score = _QUARTILE_SCORE.get(criteria.min_quartile, 0.0)
+        if assessment.venue_score < min_quartile_score:
             result['passed'] = False
-            result['reasons'].append('Preprints not allowed')
+            result['reasons'].append(f'Journal quality below {criteria.min_quartile}')
         
-        # 8. 自定义规则检查
-        for rule in criteria.custom_rules:
-            if self._evaluate_custom_rule(paper, assessment, rule):
+        # 自定义规则检查
+        for rule, clauses in criteria._compiled_rules:
+            if _rule_matches(clauses, paper):
                 if rule.get('action') == 'exclude':
                     result['passed'] = False
                     result['reasons'].append(f'Custom rule: {rule.get("name", "unnamed rule")}')
@@ -514,19 +918,11 @@ class PaperQualityFilter:
         return result
     
     def _evaluate_custom_rule(self, paper: Dict[str, Any], 
-                             assessment: Dict[str, Any], 
+                             assessment: QualityAssessment, 
                              rule: Dict[str, Any]) -> bool:
         """评估自定义规则"""
-        # 这里可以实现更复杂的规则逻辑
-        # 目前简单实现基于条件字符串的评估
-        condition = rule.get('condition', '')
-        
-        # 简化的条件评估（实际实现可以更复杂）
-        if 'citation_count >' in condition:
-            threshold = int(re.search(r'citation_count > (\d+)', condition).group(1))
-            return paper.get('citation_count', 0) > threshold
-        
-        return False
+        # 条件按字段比较子句解析（结果有缓存），所有子句都满足才算命中
+        return _rule_matches(_compile_rule_condition(rule.get('condition', '')), paper)
     
     def _get_default_filter_criteria(self) -> FilterCriteria:
         """获取默认过滤标准"""
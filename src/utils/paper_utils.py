@@ -9,11 +9,20 @@ Created during redundancy removal refactoring - 2025-08-23
 
 import hashlib
 import re
+from bisect import bisect_right
+import time
 import requests
-from typing import Dict, List, Any, Optional, Set, Tuple
+from typing import Dict, FrozenSet, Iterable, List, Any, NamedTuple, Optional, Set, Tuple, Union
 from datetime import datetime, timedelta
+from functools import lru_cache
 from urllib.parse import urlparse
 import logging
+import numpy as np
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional
+    ahocorasick = None
 
 from .phm_constants import (
     PHM_CONCEPTS, METHODOLOGY_KEYWORDS, APPLICATION_DOMAINS,
@@ -23,6 +32,180 @@ from .phm_constants import (
 
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns for the per-paper helpers below
+_PUNCT_RE = re.compile(r'[^\w\s]')
+_DOI_RE = re.compile(r'^10\.\d{4,}/[^\s]+$')
+# doi.org / dx.doi.org URL (http or https) or "doi:" prefix in front of a DOI
+_DOI_PREFIX_RE = re.compile(r'^(?:https?://(?:dx\.)?doi\.org/|doi:\s*)', re.I)
+# One underscore per problematic character and per whitespace run
+_FNAME_CLEAN_RE = re.compile(r'[<>:"/\\|?*]|\s+')
+_PREPRINT_RE = re.compile('|'.join(map(re.escape, (
+    'arxiv', 'biorxiv', 'medrxiv', 'preprint', 'ssrn',
+    'research square', 'techrxiv', 'chemrxiv'
+))))
+
+# Venue name fragments that indicate a PHM-related venue
+_PHM_VENUE_KEYWORDS = (
+    'prognostics', 'health management', 'reliability', 'maintenance',
+    'condition monitoring', 'fault diagnosis', 'mechanical systems',
+    'signal processing', 'industrial electronics', 'measurement'
+)
+
+# Flattened keyword vocabularies, in PHM_CONCEPTS/METHODOLOGY_KEYWORDS order
+_ALL_PHM_KEYWORDS = tuple(kw for config in PHM_CONCEPTS.values() for kw in config['keywords'])
+_ALL_METHOD_KEYWORDS = tuple(kw for config in METHODOLOGY_KEYWORDS.values() for kw in config['keywords'])
+_ALL_DOMAIN_KEYWORDS = tuple(kw for config in APPLICATION_DOMAINS.values() for kw in config['keywords'])
+
+# Per-group keyword sets, intersected with the keywords found in a text
+_PHM_CONCEPT_KEYWORDS: Dict[str, FrozenSet[str]] = {
+    concept: frozenset(config['keywords']) for concept, config in PHM_CONCEPTS.items()
+}
+# (concept, keyword set, weight) rows iterated by the concept scoring loop
+_PHM_CONCEPT_TABLE: Tuple[Tuple[str, FrozenSet[str], float], ...] = tuple(
+    (concept, _PHM_CONCEPT_KEYWORDS[concept], config['weight']) for concept, config in PHM_CONCEPTS.items()
+)
+# Distinct PHM keywords and their (keyword x concept) membership matrix and
+# concept weights, in _PHM_CONCEPT_TABLE order, for batch scoring
+_PHM_KEYWORD_INDEX: Dict[str, int] = {kw: i for i, kw in enumerate(dict.fromkeys(_ALL_PHM_KEYWORDS))}
+_PHM_CONCEPT_MATRIX = np.array(
+    [[kw in concept_keywords for _, concept_keywords, _ in _PHM_CONCEPT_TABLE] for kw in _PHM_KEYWORD_INDEX],
+    dtype=np.int64
+)
+_PHM_CONCEPT_WEIGHTS = np.array([weight for _, _, weight in _PHM_CONCEPT_TABLE])
+_METHOD_KEYWORD_SETS: Dict[str, FrozenSet[str]] = {
+    method_id: frozenset(config['keywords']) for method_id, config in METHODOLOGY_KEYWORDS.items()
+}
+_DOMAIN_KEYWORD_SETS: Dict[str, FrozenSet[str]] = {
+    domain_id: frozenset(config['keywords']) for domain_id, config in APPLICATION_DOMAINS.items()
+}
+
+
+def _build_keyword_automaton(keywords: Iterable[str]):
+    """Compile keywords into an Aho-Corasick automaton (None without pyahocorasick)."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+_PHM_AUTOMATON = _build_keyword_automaton(_ALL_PHM_KEYWORDS)
+_METHOD_AUTOMATON = _build_keyword_automaton(_ALL_METHOD_KEYWORDS)
+_DOMAIN_AUTOMATON = _build_keyword_automaton(_ALL_DOMAIN_KEYWORDS)
+
+# Time relevance factor indexed by publication age in years (last entry: older)
+_TIME_DECAY_BY_AGE = (
+    TIME_DECAY_FACTORS['current_year'],
+    TIME_DECAY_FACTORS['last_year'],
+    TIME_DECAY_FACTORS['two_years'],
+    TIME_DECAY_FACTORS['three_years'],
+    TIME_DECAY_FACTORS['older'],
+)
+
+# Citation impact category lower bounds (ascending) and their labels
+_CITATION_IMPACT_CUTS = (
+    CITATION_IMPACT_CATEGORIES['emerging'],
+    CITATION_IMPACT_CATEGORIES['medium_impact'],
+    CITATION_IMPACT_CATEGORIES['high_impact'],
+)
+_CITATION_IMPACT_LABELS = ('new', 'emerging', 'medium_impact', 'high_impact')
+
+# Current year, re-read from the wall clock at most once per TTL
+_CURRENT_YEAR_TTL = 3600.0
+_CURRENT_YEAR = datetime.now().year
+_CURRENT_YEAR_EXPIRES = time.monotonic() + _CURRENT_YEAR_TTL
+
+
+def _current_year() -> int:
+    """Return the current year, refreshing the cached value once it expires."""
+    global _CURRENT_YEAR, _CURRENT_YEAR_EXPIRES
+    now = time.monotonic()
+    if now >= _CURRENT_YEAR_EXPIRES:
+        _CURRENT_YEAR = datetime.now().year
+        _CURRENT_YEAR_EXPIRES = now + _CURRENT_YEAR_TTL
+    return _CURRENT_YEAR
+
+
+def _find_keywords(text: str, keywords: Tuple[str, ...], automaton) -> Set[str]:
+    """
+    Find which keywords occur as substrings of a text.
+    
+    With pyahocorasick installed this is a single pass over the text that
+    reports every (including overlapping) match; otherwise each keyword is
+    tested with ``in``.
+    
+    Args:
+        text: Lowercased text to scan
+        keywords: Keyword vocabulary the automaton was built from
+        automaton: Result of _build_keyword_automaton() for ``keywords``
+        
+    Returns:
+        Set of keywords found in the text
+    """
+    if not text:
+        return set()
+    if automaton is not None:
+        return {keyword for _, keyword in automaton.iter(text)}
+    return {keyword for keyword in keywords if keyword in text}
+
+
+def _scan_phm_fields(title: str, abstract: str, keywords: List[str]
+                     ) -> Tuple[Set[str], Set[str], Set[str], Set[str]]:
+    """
+    Find the PHM keywords in each searchable field of a paper.
+    
+    With pyahocorasick the fields are joined with NUL separators (which no
+    keyword contains, so no match spans two fields) and scanned once; each
+    hit is attributed to a field by its end offset.
+    
+    Args:
+        title: Lowercased title
+        abstract: Lowercased abstract
+        keywords: Lowercased author keywords
+        
+    Returns:
+        Tuple of (title_hits, abstract_hits, keyword_hits, keyword_text_hits),
+        where keyword_hits are PHM keywords contained in some single author
+        keyword and keyword_text_hits those found in the space-joined keywords
+    """
+    keyword_text = ' '.join(keywords)
+    if _PHM_AUTOMATON is None:
+        return (
+            _find_keywords(title, _ALL_PHM_KEYWORDS, None),
+            _find_keywords(abstract, _ALL_PHM_KEYWORDS, None),
+            _find_keywords('\0'.join(keywords), _ALL_PHM_KEYWORDS, None),
+            _find_keywords(keyword_text, _ALL_PHM_KEYWORDS, None),
+        )
+    
+    combined = '\0'.join((title, abstract, keyword_text, '\0'.join(keywords)))
+    title_end = len(title)
+    abstract_end = title_end + 1 + len(abstract)
+    keyword_text_end = abstract_end + 1 + len(keyword_text)
+    
+    title_hits, abstract_hits, keyword_hits, keyword_text_hits = set(), set(), set(), set()
+    for end, keyword in _PHM_AUTOMATON.iter(combined):
+        if end < title_end:
+            title_hits.add(keyword)
+        elif end < abstract_end:
+            abstract_hits.add(keyword)
+        elif end < keyword_text_end:
+            keyword_text_hits.add(keyword)
+        else:
+            keyword_hits.add(keyword)
+    return title_hits, abstract_hits, keyword_hits, keyword_text_hits
+
+# The ASCII characters _PUNCT_RE removes, for a bytes.translate fast path
+_ASCII_PUNCT_BYTES = bytes(c for c in range(128) if _PUNCT_RE.match(chr(c)))
+
+
+def _strip_punctuation(text: str) -> str:
+    """Remove non-word, non-space characters (translate fast path for ASCII text)."""
+    if text.isascii():
+        return text.encode('ascii').translate(None, _ASCII_PUNCT_BYTES).decode('ascii')
+    return _PUNCT_RE.sub('', text)
+
 
 def create_paper_fingerprint(paper: Dict[str, Any], method: str = 'advanced') -> str:
     """
@@ -58,52 +241,95 @@ def _create_legacy_fingerprint(paper: Dict[str, Any]) -> str:
             first_author = parts[-1] if parts else ''
     
     fingerprint_text = f"{title}|{first_author}|{paper.get('year', 0)}"
-    return hashlib.md5(fingerprint_text.encode('utf-8')).hexdigest()
+    return hashlib.blake2b(fingerprint_text.encode('utf-8'), digest_size=16).hexdigest()
 
 
 def _create_advanced_fingerprint(paper: Dict[str, Any]) -> str:
     """Create advanced fingerprint with multiple components."""
-    components = []
-    
-    # Title component (normalized)
-    title = paper.get('title', '').lower()
-    title = re.sub(r'[^\w\s]', '', title)  # Remove punctuation
-    title = ' '.join(title.split())  # Normalize whitespace
-    components.append(title[:100])  # First 100 chars
+    fingerprint_text = _advanced_fingerprint_text(paper)
+    return hashlib.blake2b(fingerprint_text.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def _advanced_fingerprint_text(paper: Dict[str, Any]) -> str:
+    """Build the normalized text that the advanced fingerprint hashes."""
+    # Title component (punctuation removed, whitespace normalized)
+    title = ' '.join(_strip_punctuation(paper.get('title', '').lower()).split())
     
-    # First author last name
+    # First author last name (handle "Last, First" and "First Last")
+    last_name = ''
     authors = paper.get('authors', [])
     if authors:
         first_author = str(authors[0]).lower()
-        # Extract last name (handle various formats)
-        if ',' in first_author:
-            last_name = first_author.split(',')[0].strip()
+        head, comma, _ = first_author.partition(',')
+        if comma:
+            last_name = head.strip()
         else:
             parts = first_author.split()
             last_name = parts[-1] if parts else first_author
-        components.append(last_name[:20])
-    else:
-        components.append('')
     
-    # Year
-    components.append(str(paper.get('year', 0)))
+    # Venue (punctuation removed)
+    venue = _strip_punctuation(paper.get('venue', '').lower())
     
-    # Venue (normalized)
-    venue = paper.get('venue', '').lower()
-    venue = re.sub(r'[^\w\s]', '', venue)
-    components.append(venue[:30])
+    return f"{title[:100]}|{last_name[:20]}|{paper.get('year', 0)}|{venue[:30]}"
+
+
+class PreprocessedPaper(NamedTuple):
+    """Lowercased searchable text fields of a paper."""
+    title: str
+    abstract: str
+    keywords: List[str]
+    combined_text: str
+
+
+# Most recent prepare_paper_text() input and result:
+# (paper, title, abstract, keywords copy, PreprocessedPaper)
+_last_prepared: Tuple[Any, ...] = (None, None, None, None, None)
+
+
+def prepare_paper_text(paper: Dict[str, Any]) -> PreprocessedPaper:
+    """
+    Lowercase the searchable text fields of a paper once.
     
-    # Create fingerprint
-    fingerprint_text = '|'.join(components)
-    return hashlib.sha256(fingerprint_text.encode('utf-8')).hexdigest()[:16]
+    The result can be passed to the relevance, methodology, domain and
+    keyword analyzers so that several of them can share one normalization
+    pass; it still unpacks as a (title, abstract, keywords, combined_text)
+    tuple. Analyzers called with just the paper dict reuse the result of
+    the previous call while its title, abstract and keywords are unchanged.
+    
+    Args:
+        paper: Paper metadata dictionary
+        
+    Returns:
+        PreprocessedPaper with all fields lowercased
+    """
+    global _last_prepared
+    raw_title = paper.get('title', '')
+    raw_abstract = paper.get('abstract', '')
+    raw_keywords = paper.get('keywords', [])
+    
+    last_paper, last_title, last_abstract, last_keywords, last_text = _last_prepared
+    if (last_paper is paper and last_title is raw_title and
+            last_abstract is raw_abstract and last_keywords == raw_keywords):
+        return last_text
+    
+    title = raw_title.lower()
+    abstract = raw_abstract.lower()
+    keywords = [k.lower() for k in raw_keywords]
+    combined_text = f"{title} {abstract} {' '.join(keywords)}"
+    text = PreprocessedPaper(title, abstract, keywords, combined_text)
+    _last_prepared = (paper, raw_title, raw_abstract, list(raw_keywords), text)
+    return text
 
 
-def calculate_phm_relevance_score(paper: Dict[str, Any]) -> Tuple[float, Dict[str, Any]]:
+def calculate_phm_relevance_score(paper: Dict[str, Any],
+                                  text: Optional[PreprocessedPaper] = None
+                                  ) -> Tuple[float, Dict[str, Any]]:
     """
     Calculate PHM relevance score based on multiple factors.
     
     Args:
         paper: Paper metadata dictionary
+        text: Optional result of prepare_paper_text() for this paper
         
     Returns:
         Tuple of (overall_score, detailed_scores)
@@ -118,39 +344,29 @@ def calculate_phm_relevance_score(paper: Dict[str, Any]) -> Tuple[float, Dict[st
     }
     
     # Get text content
-    title = paper.get('title', '').lower()
-    abstract = paper.get('abstract', '').lower()
-    keywords = [k.lower() for k in paper.get('keywords', [])]
-    venue = paper.get('venue', '').lower()
+    title, abstract, keywords, combined_text = text or prepare_paper_text(paper)
+    venue = paper.get('venue', '')
     
-    # Combine text for analysis
-    combined_text = f"{title} {abstract} {' '.join(keywords)}"
+    # Find all PHM keywords per field in one scan, then count per concept
+    title_hits, abstract_hits, keyword_hits, keyword_text_hits = _scan_phm_fields(title, abstract, keywords)
+    
+    # Count words per field once; the concept and field scores share them
+    title_words = len(title.split())
+    abstract_words = len(abstract.split())
+    keyword_text = ' '.join(keywords)
+    keyword_text_words = len(keyword_text.split())
     
     # Calculate concept scores
-    total_concept_score = 0.0
-    for concept, config in PHM_CONCEPTS.items():
-        concept_keywords = config['keywords']
-        weight = config['weight']
-        
-        # Count matches in different fields
-        title_matches = sum(1 for kw in concept_keywords if kw in title)
-        abstract_matches = sum(1 for kw in concept_keywords if kw in abstract)
-        keyword_matches = sum(1 for kw in concept_keywords if any(kw in k for k in keywords))
-        
-        # Calculate normalized scores
-        title_norm = min(title_matches / len(title.split()) * 10, 1.0) if title else 0
-        abstract_norm = min(abstract_matches / len(abstract.split()) * 100, 1.0) if abstract else 0
-        keyword_norm = min(keyword_matches / max(len(keywords), 1), 1.0)
-        
-        # Weighted concept score
-        concept_score = (title_norm * 0.4 + abstract_norm * 0.4 + keyword_norm * 0.2) * weight
-        detailed_scores['concept_scores'][concept] = concept_score
-        total_concept_score += concept_score
+    concept_scores, total_concept_score = _compute_concept_scores(
+        title_words, abstract_words, len(keywords), title_hits, abstract_hits, keyword_hits
+    )
+    detailed_scores['concept_scores'] = concept_scores
     
     # Individual field scores
-    detailed_scores['title_score'] = _calculate_field_score(title, 'title')
-    detailed_scores['abstract_score'] = _calculate_field_score(abstract, 'abstract')
-    detailed_scores['keyword_score'] = _calculate_field_score(' '.join(keywords), 'keywords')
+    detailed_scores['title_score'] = _calculate_field_score(title, 'title', title_hits, title_words)
+    detailed_scores['abstract_score'] = _calculate_field_score(abstract, 'abstract', abstract_hits, abstract_words)
+    detailed_scores['keyword_score'] = _calculate_field_score(keyword_text, 'keywords', keyword_text_hits,
+                                                              keyword_text_words)
     detailed_scores['venue_score'] = _calculate_venue_relevance(venue)
     
     # Overall score calculation
@@ -167,42 +383,155 @@ def calculate_phm_relevance_score(paper: Dict[str, Any]) -> Tuple[float, Dict[st
     return detailed_scores['overall_score'], detailed_scores
 
 
-def _calculate_field_score(text: str, field_type: str) -> float:
-    """Calculate relevance score for a specific text field."""
-    if not text:
-        return 0.0
+def calculate_phm_relevance_scores(papers: List[Dict[str, Any]],
+                                   texts: Optional[List[PreprocessedPaper]] = None) -> np.ndarray:
+    """
+    Calculate the overall PHM relevance score of many papers at once.
+    
+    Equivalent to calling calculate_phm_relevance_score() on each paper and
+    keeping the overall score. Keyword matching still runs per paper, but the
+    per-concept counting and all score arithmetic run as NumPy array
+    operations over the whole batch.
+    
+    Args:
+        papers: List of paper metadata dictionaries
+        texts: Optional results of prepare_paper_text() for these papers
+        
+    Returns:
+        Array of overall scores, one per paper
+    """
+    if texts is None:
+        texts = [prepare_paper_text(paper) for paper in papers]
+    n_papers = len(papers)
+    n_keywords = len(_PHM_KEYWORD_INDEX)
+    
+    # Paper x keyword hit matrices for title, abstract, per-keyword and joined-keyword text
+    hit_matrices = [np.zeros((n_papers, n_keywords), dtype=np.int64) for _ in range(4)]
+    word_counts = np.zeros((4, n_papers), dtype=np.int64)
+    venue_scores = np.empty(n_papers)
+    for i, (paper, (title, abstract, keywords, _)) in enumerate(zip(papers, texts)):
+        for matrix, hits in zip(hit_matrices, _scan_phm_fields(title, abstract, keywords)):
+            if hits:
+                matrix[i, [_PHM_KEYWORD_INDEX[kw] for kw in hits]] = 1
+        word_counts[0, i] = len(title.split())
+        word_counts[1, i] = len(abstract.split())
+        word_counts[2, i] = len(keywords)
+        word_counts[3, i] = len(' '.join(keywords).split())
+        venue_scores[i] = _calculate_venue_relevance(paper.get('venue', ''))
+    title_hits, abstract_hits, keyword_hits, keyword_text_hits = hit_matrices
+    title_words, abstract_words, keyword_count, keyword_text_words = word_counts
+    
+    # Concept scores: paper x concept match counts via the membership matrix
+    concept_scores = (
+        _capped_ratios(title_hits @ _PHM_CONCEPT_MATRIX, title_words[:, None], 10) * 0.4 +
+        _capped_ratios(abstract_hits @ _PHM_CONCEPT_MATRIX, abstract_words[:, None], 100) * 0.4 +
+        _capped_ratios(keyword_hits @ _PHM_CONCEPT_MATRIX, keyword_count[:, None], 1) * 0.2
+    ) * _PHM_CONCEPT_WEIGHTS
+    total_concept_score = np.zeros(n_papers)
+    for column in concept_scores.T:  # same summation order as the scalar path
+        total_concept_score += column
+    
+    overall_scores = (
+        total_concept_score * 0.5 +
+        _capped_ratios(title_hits.sum(axis=1), title_words, 5) * 0.2 +
+        _capped_ratios(abstract_hits.sum(axis=1), abstract_words, 20) * 0.15 +
+        _capped_ratios(keyword_text_hits.sum(axis=1), keyword_text_words, 1) * 0.1 +
+        venue_scores * 0.05
+    )
+    return np.minimum(overall_scores, 1.0)
+
+
+def _capped_ratios(matches: np.ndarray, words: np.ndarray, factor: int) -> np.ndarray:
+    """Vectorized min(matches / words * factor, 1.0), 0.0 where there are no matches."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratios = matches / words * factor
+    return np.where(matches == 0, 0.0, np.where(matches * factor >= words, 1.0, ratios))
+
+
+def _compute_concept_scores(title_words: int, abstract_words: int, keyword_count: int,
+                            title_hits: Set[str], abstract_hits: Set[str],
+                            keyword_hits: Set[str]) -> Tuple[Dict[str, float], float]:
+    """
+    Score each PHM concept from the keywords found in a paper's fields.
     
-    words = text.split()
-    if not words:
+    Args:
+        title_words: Number of words in the title
+        abstract_words: Number of words in the abstract
+        keyword_count: Number of author keywords
+        title_hits: PHM keywords found in the title
+        abstract_hits: PHM keywords found in the abstract
+        keyword_hits: PHM keywords found in some author keyword
+    
+    Returns:
+        Tuple of (weighted score per concept, sum of the concept scores)
+    """
+    concept_scores = {}
+    total_concept_score = 0.0
+    for concept, concept_keywords, weight in _PHM_CONCEPT_TABLE:
+        # Count matches in different fields
+        title_matches = len(concept_keywords & title_hits)
+        abstract_matches = len(concept_keywords & abstract_hits)
+        keyword_matches = len(concept_keywords & keyword_hits)
+        
+        # Calculate normalized scores, capped at 1.0 (compare before dividing)
+        title_norm = 0.0
+        if title_matches:
+            title_norm = 1.0 if title_matches * 10 >= title_words else title_matches / title_words * 10
+        abstract_norm = 0.0
+        if abstract_matches:
+            abstract_norm = 1.0 if abstract_matches * 100 >= abstract_words else abstract_matches / abstract_words * 100
+        keyword_norm = 0.0
+        if keyword_matches:
+            keyword_norm = 1.0 if keyword_matches >= keyword_count else keyword_matches / keyword_count
+        
+        # Weighted concept score
+        concept_score = (title_norm * 0.4 + abstract_norm * 0.4 + keyword_norm * 0.2) * weight
+        concept_scores[concept] = concept_score
+        total_concept_score += concept_score
+    return concept_scores, total_concept_score
+
+
+def _calculate_field_score(text: str, field_type: str,
+                           phm_hits: Optional[Set[str]] = None,
+                           word_count: Optional[int] = None) -> float:
+    """Calculate relevance score for a specific text field (phm_hits/word_count: precomputed for it)."""
+    if word_count is None:
+        word_count = len(text.split())
+    if not word_count:
         return 0.0
     
     # Count PHM-related terms
-    phm_count = 0
-    all_phm_keywords = []
-    for concept_config in PHM_CONCEPTS.values():
-        all_phm_keywords.extend(concept_config['keywords'])
+    if phm_hits is None:
+        phm_hits = _find_keywords(text, _ALL_PHM_KEYWORDS, _PHM_AUTOMATON)
+    phm_count = len(phm_hits)
     
-    for keyword in all_phm_keywords:
-        if keyword in text:
-            phm_count += 1
-    
-    # Normalize based on field type
+    # Normalize based on field type, capped at 1.0 (compare before dividing)
     if field_type == 'title':
-        return min(phm_count / len(words) * 5, 1.0)
+        factor = 5
     elif field_type == 'abstract':
-        return min(phm_count / len(words) * 20, 1.0)
+        factor = 20
     elif field_type == 'keywords':
-        return min(phm_count / max(len(words), 1), 1.0)
+        factor = 1
     else:
-        return min(phm_count / len(words) * 10, 1.0)
+        factor = 10
+    if phm_count * factor >= word_count:
+        return 1.0
+    return phm_count / word_count * factor
+
 
+@lru_cache(maxsize=4096)
+def _norm_venue(venue: str) -> str:
+    """Lowercase and strip a venue name (few distinct venues, so cached)."""
+    return venue.lower().strip()
 
+
+@lru_cache(maxsize=4096)
 def _calculate_venue_relevance(venue: str) -> float:
     """Calculate venue-based relevance score."""
     if not venue:
         return 0.0
     
-    venue_lower = venue.lower().strip()
+    venue_lower = _norm_venue(venue)
     
     # Check exact matches first
     if venue_lower in VENUE_QUALITY_MAPPING:
@@ -213,66 +542,62 @@ def _calculate_venue_relevance(venue: str) -> float:
             return venue_info['score']
     
     # Check partial matches
-    phm_venue_keywords = [
-        'prognostics', 'health management', 'reliability', 'maintenance',
-        'condition monitoring', 'fault diagnosis', 'mechanical systems',
-        'signal processing', 'industrial electronics', 'measurement'
-    ]
-    
-    matches = sum(1 for keyword in phm_venue_keywords if keyword in venue_lower)
+    matches = sum(1 for keyword in _PHM_VENUE_KEYWORDS if keyword in venue_lower)
     return min(matches * 0.15, 0.6)  # Max 0.6 for partial matches
 
 
-def classify_methodology(paper: Dict[str, Any]) -> List[str]:
+def classify_methodology(paper: Dict[str, Any],
+                         text: Optional[PreprocessedPaper] = None) -> List[str]:
     """
     Classify paper methodology based on content analysis.
     
     Args:
         paper: Paper metadata dictionary
+        text: Optional result of prepare_paper_text() for this paper
         
     Returns:
         List of methodology classifications
     """
-    title = paper.get('title', '').lower()
-    abstract = paper.get('abstract', '').lower()
-    keywords = [k.lower() for k in paper.get('keywords', [])]
+    title, _, _, combined_text = text or prepare_paper_text(paper)
     
-    combined_text = f"{title} {abstract} {' '.join(keywords)}"
+    combined_hits = _find_keywords(combined_text, _ALL_METHOD_KEYWORDS, _METHOD_AUTOMATON)
     
     classifications = []
     for method_id, method_config in METHODOLOGY_KEYWORDS.items():
-        method_keywords = method_config['keywords']
-        matches = sum(1 for keyword in method_keywords if keyword in combined_text)
+        method_hits = _METHOD_KEYWORD_SETS[method_id] & combined_hits
+        matches = len(method_hits)
         
         if matches >= 2:  # Require at least 2 keyword matches
             classifications.append(method_config['category'])
-        elif matches == 1 and any(keyword in title for keyword in method_keywords):
-            # Single match in title is also significant
-            classifications.append(method_config['category'])
+        elif matches == 1:
+            # Single match in title is also significant; the title is part of
+            # combined_text, so only the matched keyword can occur in it
+            (keyword,) = method_hits
+            if keyword in title:
+                classifications.append(method_config['category'])
     
     return list(set(classifications))  # Remove duplicates
 
 
-def identify_application_domains(paper: Dict[str, Any]) -> List[str]:
+def identify_application_domains(paper: Dict[str, Any],
+                                 text: Optional[PreprocessedPaper] = None) -> List[str]:
     """
     Identify application domains mentioned in the paper.
     
     Args:
         paper: Paper metadata dictionary
+        text: Optional result of prepare_paper_text() for this paper
         
     Returns:
         List of identified application domains
     """
-    title = paper.get('title', '').lower()
-    abstract = paper.get('abstract', '').lower()
-    keywords = [k.lower() for k in paper.get('keywords', [])]
+    _, _, _, combined_text = text or prepare_paper_text(paper)
     
-    combined_text = f"{title} {abstract} {' '.join(keywords)}"
+    combined_hits = _find_keywords(combined_text, _ALL_DOMAIN_KEYWORDS, _DOMAIN_AUTOMATON)
     
     domains = []
     for domain_id, domain_config in APPLICATION_DOMAINS.items():
-        domain_keywords = domain_config['keywords']
-        matches = sum(1 for keyword in domain_keywords if keyword in combined_text)
+        matches = len(_DOMAIN_KEYWORD_SETS[domain_id] & combined_hits)
         
         if matches >= 1:  # Single match is sufficient for domain identification
             domains.append(domain_config['domain'])
@@ -299,7 +624,7 @@ def assess_venue_quality(venue: str) -> Dict[str, Any]:
             'score': 0.0
         }
     
-    venue_lower = venue.lower().strip()
+    venue_lower = _norm_venue(venue)
     
     # Check exact match
     if venue_lower in VENUE_QUALITY_MAPPING:
@@ -344,19 +669,11 @@ def calculate_time_relevance_factor(year: int) -> float:
     Returns:
         Time relevance factor (0.0 to 1.0)
     """
-    current_year = datetime.now().year
-    age = current_year - year
+    age = _current_year() - year
     
     if age <= 0:
-        return TIME_DECAY_FACTORS['current_year']
-    elif age == 1:
-        return TIME_DECAY_FACTORS['last_year']
-    elif age == 2:
-        return TIME_DECAY_FACTORS['two_years']
-    elif age == 3:
-        return TIME_DECAY_FACTORS['three_years']
-    else:
-        return TIME_DECAY_FACTORS['older']
+        return _TIME_DECAY_BY_AGE[0]
+    return _TIME_DECAY_BY_AGE[age if age < 4 else 4]
 
 
 def categorize_citation_impact(citation_count: int) -> str:
@@ -369,14 +686,22 @@ def categorize_citation_impact(citation_count: int) -> str:
     Returns:
         Impact category string
     """
-    if citation_count >= CITATION_IMPACT_CATEGORIES['high_impact']:
-        return 'high_impact'
-    elif citation_count >= CITATION_IMPACT_CATEGORIES['medium_impact']:
-        return 'medium_impact'
-    elif citation_count >= CITATION_IMPACT_CATEGORIES['emerging']:
-        return 'emerging'
-    else:
-        return 'new'
+    return _CITATION_IMPACT_LABELS[bisect_right(_CITATION_IMPACT_CUTS, citation_count)]
+
+
+def normalize_doi(doi: Optional[str]) -> str:
+    """
+    Reduce a DOI given as a bare DOI, doi.org URL or "doi:" reference to the bare DOI.
+    
+    Args:
+        doi: DOI string, e.g. 'https://dx.doi.org/10.1016/j.ymssp.2020.1'
+        
+    Returns:
+        Bare DOI with surrounding whitespace removed ('' for empty input)
+    """
+    if not doi:
+        return ''
+    return _DOI_PREFIX_RE.sub('', doi.strip()).strip()
 
 
 def validate_doi(doi: str) -> bool:
@@ -393,8 +718,7 @@ def validate_doi(doi: str) -> bool:
         return False
     
     # Basic DOI pattern validation
-    doi_pattern = re.compile(r'^10\.\d{4,}/[^\s]+$')
-    return bool(doi_pattern.match(doi))
+    return bool(_DOI_RE.match(doi))
 
 
 def normalize_author_name(author: str) -> str:
@@ -413,24 +737,21 @@ def normalize_author_name(author: str) -> str:
     # Remove extra whitespace
     normalized = ' '.join(author.split())
     
-    # Handle common patterns
-    if ',' in normalized:
-        # "Last, First" format
-        parts = normalized.split(',', 1)
-        if len(parts) == 2:
-            last_name = parts[0].strip()
-            first_name = parts[1].strip()
-            normalized = f"{first_name} {last_name}"
+    # Handle "Last, First" format
+    last_name, comma, first_name = normalized.partition(',')
+    if comma:
+        normalized = f"{first_name.strip()} {last_name.strip()}"
     
     return normalized
 
 
-def extract_keywords_from_text(text: str, max_keywords: int = 10) -> List[str]:
+def extract_keywords_from_text(text: Union[str, PreprocessedPaper], max_keywords: int = 10) -> List[str]:
     """
     Extract potential keywords from text content.
     
     Args:
-        text: Input text
+        text: Input text, or the result of prepare_paper_text() to search a
+            paper's combined text without lowercasing it again
         max_keywords: Maximum number of keywords to extract
         
     Returns:
@@ -440,22 +761,23 @@ def extract_keywords_from_text(text: str, max_keywords: int = 10) -> List[str]:
         return []
     
     # Simple keyword extraction based on PHM terminology
-    text_lower = text.lower()
-    found_keywords = []
+    if isinstance(text, PreprocessedPaper):
+        text_lower = text.combined_text
+    else:
+        text_lower = text.lower()
     
-    # Check for PHM concepts
-    for concept_config in PHM_CONCEPTS.values():
-        for keyword in concept_config['keywords']:
-            if keyword in text_lower and keyword not in found_keywords:
-                found_keywords.append(keyword)
+    # Check for PHM concepts (dict keys: ordered and de-duplicated)
+    phm_hits = _find_keywords(text_lower, _ALL_PHM_KEYWORDS, _PHM_AUTOMATON)
+    found_keywords = dict.fromkeys(keyword for keyword in _ALL_PHM_KEYWORDS if keyword in phm_hits)
     
-    # Check for methodology keywords
-    for method_config in METHODOLOGY_KEYWORDS.values():
-        for keyword in method_config['keywords']:
-            if keyword in text_lower and keyword not in found_keywords:
-                found_keywords.append(keyword)
+    # Check for methodology keywords, unless PHM concepts already fill the limit
+    if not 0 <= max_keywords <= len(found_keywords):
+        method_hits = _find_keywords(text_lower, _ALL_METHOD_KEYWORDS, _METHOD_AUTOMATON)
+        for keyword in _ALL_METHOD_KEYWORDS:
+            if keyword in method_hits:
+                found_keywords.setdefault(keyword)
     
-    return found_keywords[:max_keywords]
+    return list(found_keywords)[:max_keywords]
 
 
 def sanitize_filename(filename: str) -> str:
@@ -471,9 +793,8 @@ def sanitize_filename(filename: str) -> str:
     if not filename:
         return "unknown_file"
     
-    # Remove or replace problematic characters
-    sanitized = re.sub(r'[<>:"/\\|?*]', '_', filename)
-    sanitized = re.sub(r'\s+', '_', sanitized)  # Replace spaces with underscores
+    # Replace problematic characters and whitespace runs in one pass
+    sanitized = _FNAME_CLEAN_RE.sub('_', filename)
     sanitized = sanitized[:200]  # Limit length
     
     return sanitized or "unknown_file"
@@ -492,13 +813,7 @@ def is_preprint_venue(venue: str) -> bool:
     if not venue:
         return False
     
-    venue_lower = venue.lower()
-    preprint_indicators = [
-        'arxiv', 'biorxiv', 'medrxiv', 'preprint', 'ssrn',
-        'research square', 'techrxiv', 'chemrxiv'
-    ]
-    
-    return any(indicator in venue_lower for indicator in preprint_indicators)
+    return _PREPRINT_RE.search(_norm_venue(venue)) is not None
 
 
 def merge_paper_metadata(papers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -511,26 +826,28 @@ def merge_paper_metadata(papers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     Returns:
         List of merged papers with duplicates removed
     """
-    seen_fingerprints = set()
-    merged_papers = []
+    # Fingerprint text -> first paper seen with it (dicts keep insertion order).
+    # Equal fingerprints mean equal fingerprint texts, so the in-memory index
+    # keys on the text directly and skips hashing altogether.
+    merged_papers: Dict[str, Dict[str, Any]] = {}
     
     for paper in papers:
-        fingerprint = create_paper_fingerprint(paper)
+        fingerprint = _advanced_fingerprint_text(paper)
+        existing_paper = merged_papers.get(fingerprint)
         
-        if fingerprint not in seen_fingerprints:
-            seen_fingerprints.add(fingerprint)
-            merged_papers.append(paper)
+        if existing_paper is None:
+            merged_papers[fingerprint] = paper
         else:
-            # Find existing paper and merge information
-            for existing_paper in merged_papers:
-                if create_paper_fingerprint(existing_paper) == fingerprint:
-                    # Merge additional information if available
-                    if not existing_paper.get('doi') and paper.get('doi'):
-                        existing_paper['doi'] = paper['doi']
-                    if not existing_paper.get('abstract') and paper.get('abstract'):
-                        existing_paper['abstract'] = paper['abstract']
-                    if paper.get('citation_count', 0) > existing_paper.get('citation_count', 0):
-                        existing_paper['citation_count'] = paper['citation_count']
-                    break
-    
-    return merged_papers
\ No newline at end of file
+            _merge_fields(existing_paper, paper)
+    
+    return list(merged_papers.values())
+
+
+def _merge_fields(existing_paper: Dict[str, Any], paper: Dict[str, Any]) -> None:
+    """Merge additional information from a duplicate into the kept paper."""
+    if not existing_paper.get('doi') and paper.get('doi'):
+        existing_paper['doi'] = paper['doi']
+    if not existing_paper.get('abstract') and paper.get('abstract'):
+        existing_paper['abstract'] = paper['abstract']
+    if paper.get('citation_count', 0) > existing_paper.get('citation_count', 0):
+        existing_paper['citation_count'] = paper['citation_count']
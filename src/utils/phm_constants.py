@@ -217,6 +217,39 @@ VENUE_QUALITY_MAPPING = {
     'pattern recognition': {'impact_factor': 8.0, 'quartile': 'Q1', 'category': 'journal'}
 }
 
+# Known CrossRef registrant prefixes (the "10.NNNN" part of a DOI) for
+# publishers that regularly carry PHM research
+KNOWN_CROSSREF_PREFIXES = frozenset({
+    '10.1016',   # Elsevier
+    '10.1109',   # IEEE
+    '10.1007',   # Springer
+    '10.1002',   # Wiley
+    '10.1115',   # ASME
+    '10.1177',   # SAGE
+    '10.1080',   # Taylor & Francis
+    '10.1038',   # Nature Portfolio
+    '10.1049',   # IET
+    '10.1088',   # IOP Publishing
+    '10.1145',   # ACM
+    '10.1063',   # AIP Publishing
+    '10.1061',   # ASCE
+    '10.1121',   # Acoustical Society of America
+    '10.1142',   # World Scientific
+    '10.1137',   # SIAM
+    '10.1126',   # Science (AAAS)
+    '10.1093',   # Oxford University Press
+    '10.1017',   # Cambridge University Press
+    '10.1098',   # Royal Society
+    '10.1371',   # PLOS
+    '10.1051',   # EDP Sciences
+    '10.1515',   # De Gruyter
+    '10.4271',   # SAE International
+    '10.36001',  # PHM Society
+    '10.3390',   # MDPI
+    '10.1155',   # Hindawi
+    '10.3389',   # Frontiers
+})
+
 # Relevance Score Thresholds
 RELEVANCE_THRESHOLDS = {
     'high': 0.7,
@@ -0,0 +1,110 @@
+"""
+Rate limiting utilities for APPA system.
+
+This module provides a thread-safe token-bucket limiter that throttles
+outgoing calls proactively, so bursts are smoothed to the provider's
+sustained rate instead of being rejected and retried, and a process-wide
+registry of per-host limiters shared by all API clients.
+"""
+
+import math
+import threading
+import time
+from typing import Dict, Optional
+
+
+class TokenBucket:
+    """
+    Thread-safe token-bucket rate limiter.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``.
+    Each call to acquire() reserves tokens immediately and sleeps outside
+    the lock until its reservation is covered, so concurrent callers are
+    served in order without holding the lock while waiting.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Initialize token bucket.
+
+        Args:
+            rate: Sustained rate in tokens (requests) per second; <= 0 disables limiting
+            capacity: Maximum burst size (defaults to one second worth of tokens)
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens from the bucket, blocking until they are available.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            Seconds spent waiting
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+            self._last_refill = now
+            self._tokens -= tokens
+            wait_time = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait_time > 0:
+            time.sleep(wait_time)
+        return wait_time
+
+    def __enter__(self) -> 'TokenBucket':
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        return None
+
+
+# Upper bounds on sustained request rates (requests per second) for known
+# hosts; a client configured slower than this keeps its own rate
+HOST_RATE_LIMITS: Dict[str, float] = {
+    'www.nature.com': 1.0 / 3.0,
+    'nature.com': 1.0 / 3.0,
+    'api.crossref.org': 5.0,  # be polite, matches CrossrefClient
+    'api.openalex.org': 10.0,  # polite pool
+}
+
+_HOST_LIMITERS: Dict[str, TokenBucket] = {}
+_HOST_LIMITERS_LOCK = threading.Lock()
+
+
+def get_host_limiter(host: str, default_rate: float) -> TokenBucket:
+    """
+    Get the process-wide limiter for a host, creating it on first use.
+
+    All clients and threads talking to the same host share one bucket, so
+    concurrent callers cannot burst past the host's rate limit. The bucket's
+    rate is the caller's rate capped by HOST_RATE_LIMITS, and it is fixed by
+    the first caller for that host: later callers share the existing bucket
+    and their default_rate is ignored.
+
+    Args:
+        host: Network location, e.g. 'api.openalex.org'
+        default_rate: Caller's requests per second (capped for known hosts)
+
+    Returns:
+        TokenBucket for the host
+    """
+    host = host.lower()
+    limiter = _HOST_LIMITERS.get(host)
+    if limiter is None:
+        with _HOST_LIMITERS_LOCK:
+            limiter = _HOST_LIMITERS.get(host)
+            if limiter is None:
+                limiter = TokenBucket(rate=min(HOST_RATE_LIMITS.get(host, math.inf), default_rate))
+                _HOST_LIMITERS[host] = limiter
+    return limiter
@@ -203,6 +203,30 @@ class TestAgentImports(unittest.TestCase):
         self.assertIsNotNone(agent.config)
 
 
+class TestRateLimiter(unittest.TestCase):
+    """Test token-bucket rate limiter."""
+
+    def test_burst_within_capacity_does_not_wait(self):
+        """Test that calls within the bucket capacity return immediately."""
+        from src.utils.rate_limiter import TokenBucket
+
+        bucket = TokenBucket(rate=5, capacity=3)
+        waits = [bucket.acquire() for _ in range(3)]
+        self.assertEqual(waits, [0.0, 0.0, 0.0])
+
+    @patch('src.utils.rate_limiter.time.sleep')
+    def test_exhausted_bucket_waits_for_refill(self, mock_sleep):
+        """Test that an empty bucket sleeps for the refill interval."""
+        from src.utils.rate_limiter import TokenBucket
+
+        bucket = TokenBucket(rate=10, capacity=1)
+        bucket.acquire()
+        wait_time = bucket.acquire()
+        self.assertGreater(wait_time, 0.05)
+        self.assertLessEqual(wait_time, 0.1)
+        mock_sleep.assert_called_once()
+
+
 class TestMainStatusManager(unittest.TestCase):
     """Test main status manager functionality."""
     
@@ -0,0 +1,602 @@
+"""
+Equivalence and regression tests for the batched, streaming and cached paths.
+
+Batch helpers are checked against their scalar counterparts (and against
+the plain substring matcher used without pyahocorasick), and caches are
+checked for correct invalidation.
+"""
+
+import copy
+import gzip
+import http.server
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import patch, MagicMock
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.models import PaperRecord, QualityAssessment
+from src.utils import paper_utils
+from src.utils.paper_quality_filter import PaperQualityFilter, FilterCriteria, _STREAM_CHUNK_SIZE
+from src.utils.pdf_downloader import PDFDownloader, PaperValidator
+
+# A minimal body that passes the fast PDF check (header, >= 1 KB, %%EOF)
+_PDF_BODY = b'%PDF-1.4\n' + b'x' * 2000 + b'\n%%EOF\n'
+
+_VENUES = (
+    'Mechanical Systems and Signal Processing', 'IEEE Transactions on Reliability',
+    'Measurement', 'Sensors', 'Neurocomputing', 'Unknown Workshop', ''
+)
+_TEXT_SNIPPETS = (
+    'remaining useful life prediction', 'fault diagnosis of rolling bearings',
+    'condition monitoring', 'deep learning', 'reliability analysis', 'anomaly detection',
+    'prognostics and health management', 'a survey', 'wind turbine gearbox'
+)
+
+
+def _make_papers(count, seed=0):
+    """Build reproducible synthetic papers covering the filter and scoring branches."""
+    rng = random.Random(seed)
+    papers = []
+    for i in range(count):
+        papers.append({
+            'title': f"Paper {i}: {' '.join(rng.sample(_TEXT_SNIPPETS, 2))}",
+            'abstract': ' '.join(rng.choice(_TEXT_SNIPPETS) for _ in range(rng.randint(0, 12))),
+            'keywords': rng.sample(_TEXT_SNIPPETS, rng.randint(0, 3)),
+            'venue': rng.choice(_VENUES),
+            'doi': f"10.{rng.choice(('1016', '1109', '3390', '9999'))}/test.{i}",
+            'year': rng.randint(2015, 2025),
+            'citation_count': rng.randint(0, 200),
+            'impact_factor': rng.choice((0.0, 2.0, 6.5)),
+            'phm_relevance_score': round(rng.random(), 3),
+        })
+    return papers
+
+
+class _PDFHandler(http.server.BaseHTTPRequestHandler):
+    """Serves a small PDF, or a gzip-encoded oversized body under /big.pdf."""
+
+    hits = 0
+    hits_lock = threading.Lock()
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        with _PDFHandler.hits_lock:
+            _PDFHandler.hits += 1
+        if self.path.startswith('/big.pdf'):
+            body = gzip.compress(b'%PDF-1.4\n' + b'\0' * 500000)
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/pdf')
+            self.send_header('Content-Encoding', 'gzip')
+        else:
+            time.sleep(0.2)  # keep downloads in flight long enough to overlap
+            body = _PDF_BODY
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/pdf')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class TestStreamingFilter(unittest.TestCase):
+    """Test that iter_filter_papers and filter_papers_parallel match filter_papers."""
+
+    def setUp(self):
+        self.filter = PaperQualityFilter()
+        self.criteria = FilterCriteria(min_quartile='Q2')
+        self.papers = _make_papers(700)
+
+    def _baseline(self):
+        return self.filter.filter_papers(copy.deepcopy(self.papers), self.criteria)
+
+    def test_top_k_matches_sorted_prefix(self):
+        """Test that top_k yields the K best papers of the full filter, best first."""
+        expected, _ = self._baseline()
+        top = list(self.filter.iter_filter_papers(copy.deepcopy(self.papers), self.criteria, top_k=25))
+        self.assertEqual([p['title'] for p in top], [p['title'] for p in expected[:25]])
+        self.assertEqual([p['filter_score'] for p in top], [p['filter_score'] for p in expected[:25]])
+
+    def test_report_is_written_incrementally(self):
+        """Test that the report reflects only the papers consumed so far."""
+        report = {}
+        papers = (paper for paper in copy.deepcopy(self.papers))
+        iterator = self.filter.iter_filter_papers(papers, self.criteria, report=report)
+
+        next(iterator)
+        self.assertLessEqual(report['total_papers'], _STREAM_CHUNK_SIZE)
+        self.assertNotIn('filter_rate', report)
+
+        rest = list(iterator)
+        _, expected_report = self._baseline()
+        self.assertEqual(report['total_papers'], len(self.papers))
+        self.assertEqual(report['filtered_papers'], len(rest) + 1)
+        self.assertEqual(report['filter_reasons'], expected_report['filter_reasons'])
+        self.assertEqual(report['filter_rate'], expected_report['filter_rate'])
+
+    def test_parallel_matches_serial(self):
+        """Test that the process-pool path returns the serial result."""
+        expected, expected_report = self._baseline()
+        with patch('src.utils.paper_quality_filter._PARALLEL_FILTER_MIN_PAPERS', 10):
+            result, report = self.filter.filter_papers_parallel(
+                copy.deepcopy(self.papers), self.criteria, workers=2, chunksize=128
+            )
+        self.assertEqual([p['title'] for p in result], [p['title'] for p in expected])
+        self.assertEqual([p['quality_assessment'] for p in result],
+                         [p['quality_assessment'] for p in expected])
+        self.assertEqual(report['filter_reasons'], expected_report['filter_reasons'])
+        self.assertEqual(report['filter_rate'], expected_report['filter_rate'])
+
+    def test_batch_assessment_matches_scalar(self):
+        """Test that assess_papers_batch agrees with assess_paper_quality."""
+        batch = self.filter.assess_papers_batch(self.papers)
+        scalar = [self.filter.assess_paper_quality(paper) for paper in self.papers]
+        self.assertEqual([a.to_dict() for a in batch], [a.to_dict() for a in scalar])
+
+    def test_corrupt_config_cache_is_a_miss(self):
+        """Test that an unreadable cache file falls back to parsing the YAML."""
+        with tempfile.TemporaryDirectory() as tmp, \
+                patch('src.utils.paper_quality_filter._CONFIG_CACHE_DIR', Path(tmp) / 'cache'):
+            config_path = Path(tmp) / 'filters.yaml'
+            config_path.write_text('quality_filters:\n  publisher_blacklist: [mdpi]\n', encoding='utf-8')
+            expected = {'quality_filters': {'publisher_blacklist': ['mdpi']}}
+
+            self.assertEqual(PaperQualityFilter(str(config_path)).config, expected)
+            cache_files = list((Path(tmp) / 'cache').iterdir())
+            self.assertEqual(len(cache_files), 1)
+            self.assertEqual(sorted(p.name for p in Path(tmp).iterdir()), ['cache', 'filters.yaml'])
+
+            # A corrupt cache file is a miss and is rewritten
+            cache_files[0].write_bytes(b'\x80\x09')
+            self.assertEqual(PaperQualityFilter(str(config_path)).config, expected)
+            self.assertNotEqual(cache_files[0].read_bytes(), b'\x80\x09')
+            self.assertEqual(PaperQualityFilter(str(config_path)).config, expected)
+
+    def test_config_cache_skips_values_json_cannot_hold(self):
+        """Test that configs with dates are parsed every time instead of cached lossily."""
+        with tempfile.TemporaryDirectory() as tmp, \
+                patch('src.utils.paper_quality_filter._CONFIG_CACHE_DIR', Path(tmp) / 'cache'):
+            config_path = Path(tmp) / 'filters.yaml'
+            config_path.write_text('cutoff: 2024-01-01\n', encoding='utf-8')
+
+            config = PaperQualityFilter(str(config_path)).config
+            self.assertEqual(config['cutoff'].isoformat(), '2024-01-01')
+            self.assertFalse((Path(tmp) / 'cache').exists())
+
+
+class TestSlottedRecords(unittest.TestCase):
+    """Test dict compatibility of PaperRecord and QualityAssessment."""
+
+    def _record(self, has_venue):
+        return PaperRecord(
+            id='W1', title='Bearing prognostics', doi='10.1016/x', year=2024,
+            publication_date='2024-01-01', cited_by_count=3, is_open_access=False,
+            source='openalex', authors=['A. Author'], has_venue=has_venue,
+            venue='Measurement', venue_type='journal', publisher='Elsevier',
+            issn='0263-2241', is_core=True, abstract='', keywords=[],
+            phm_relevance_score=0.5, quality_indicators={}
+        )
+
+    def test_paper_record_dict_access(self):
+        """Test get/[] access and to_dict on a PaperRecord."""
+        record = self._record(has_venue=True)
+        self.assertFalse(hasattr(record, '__dict__'))
+        self.assertEqual(record['title'], 'Bearing prognostics')
+        self.assertEqual(record.get('venue'), 'Measurement')
+        self.assertEqual(record.get('missing', 'default'), 'default')
+
+        record['abstract'] = 'Remaining useful life'
+        self.assertEqual(record.to_dict()['abstract'], 'Remaining useful life')
+        self.assertEqual(record.to_dict()['venue'], 'Measurement')
+
+    def test_paper_record_without_venue(self):
+        """Test that venue fields behave as absent keys without venue data."""
+        record = self._record(has_venue=False)
+        self.assertIsNone(record.get('venue'))
+        self.assertEqual(record.get('publisher', ''), '')
+        paper = record.to_dict()
+        for key in ('venue', 'venue_type', 'publisher', 'issn', 'is_core'):
+            self.assertNotIn(key, paper)
+
+    def test_quality_assessment_dict_access(self):
+        """Test get/[]/in access and to_dict on a QualityAssessment."""
+        assessment = QualityAssessment(
+            overall_score=0.8, venue_score=1.0, publisher_score=1.0, impact_score=0.8,
+            citation_score=0.5, phm_relevance_score=0.3, quality_tier='good',
+            warnings=[], strengths=['High-quality venue']
+        )
+        self.assertFalse(hasattr(assessment, '__dict__'))
+        self.assertEqual(assessment['quality_tier'], 'good')
+        self.assertEqual(assessment.get('overall_score'), 0.8)
+        self.assertIsNone(assessment.get('missing'))
+        self.assertIn('strengths', assessment)
+        self.assertNotIn('missing', assessment)
+        self.assertEqual(set(assessment.to_dict()), set(QualityAssessment.__slots__))
+
+
+class TestBatchScoring(unittest.TestCase):
+    """Test that batch scoring matches the scalar functions."""
+
+    def setUp(self):
+        self.papers = _make_papers(300, seed=1)
+        self.papers.append({'title': '', 'abstract': '', 'keywords': []})
+
+    def _scalar_scores(self):
+        return [paper_utils.calculate_phm_relevance_score(paper)[0] for paper in self.papers]
+
+    def test_phm_relevance_batch_matches_scalar(self):
+        """Test calculate_phm_relevance_scores against the per-paper score."""
+        batch = paper_utils.calculate_phm_relevance_scores(self.papers).tolist()
+        for batch_score, scalar_score in zip(batch, self._scalar_scores()):
+            self.assertAlmostEqual(batch_score, scalar_score, places=12)
+
+    def test_phm_relevance_without_automaton(self):
+        """Test that scores do not depend on pyahocorasick being installed."""
+        with_automaton = self._scalar_scores()
+        batch_with_automaton = paper_utils.calculate_phm_relevance_scores(self.papers).tolist()
+        with patch.object(paper_utils, '_PHM_AUTOMATON', None), \
+                patch.object(paper_utils, '_METHOD_AUTOMATON', None), \
+                patch.object(paper_utils, '_DOMAIN_AUTOMATON', None):
+            self.assertEqual(self._scalar_scores(), with_automaton)
+            self.assertEqual(paper_utils.calculate_phm_relevance_scores(self.papers).tolist(),
+                             batch_with_automaton)
+            methods = [paper_utils.classify_methodology(paper) for paper in self.papers]
+            domains = [paper_utils.identify_application_domains(paper) for paper in self.papers]
+        self.assertEqual([paper_utils.classify_methodology(paper) for paper in self.papers], methods)
+        self.assertEqual([paper_utils.identify_application_domains(paper) for paper in self.papers], domains)
+
+    def test_validation_batch_matches_scalar(self):
+        """Test calculate_validation_scores against _calculate_validation_score."""
+        validator = PaperValidator({})
+        rng = random.Random(2)
+        results_list = []
+        for _ in range(200):
+            results = {}
+            if rng.random() < 0.7:
+                results['doi'] = {'valid': rng.random() < 0.5}
+            if rng.random() < 0.7:
+                results['citations'] = {'verified': rng.random() < 0.5}
+            if rng.random() < 0.7:
+                results['venue'] = {'recognized': rng.random() < 0.5}
+            results_list.append(results)
+
+        batch = validator.calculate_validation_scores(results_list).tolist()
+        scalar = [validator._calculate_validation_score(results) for results in results_list]
+        self.assertEqual(batch, scalar)
+
+
+class TestDOIHandling(unittest.TestCase):
+    """Test DOI normalization and batched CrossRef lookups."""
+
+    _DOI_FORMS = (
+        '10.1016/J.YMSSP.2020.1',
+        ' https://doi.org/10.1016/J.YMSSP.2020.1 ',
+        'http://dx.doi.org/10.1016/J.YMSSP.2020.1',
+        'doi:10.1016/J.YMSSP.2020.1',
+        'DOI: 10.1016/J.YMSSP.2020.1',
+    )
+
+    @staticmethod
+    def _works_response(filter_value):
+        """CrossRef works items for the DOIs in a doi: filter (except ones ending in 'missing')."""
+        dois = [part[len('doi:'):] for part in filter_value.split(',')]
+        return [{'DOI': doi.upper(), 'title': [f'Title {doi}']} for doi in dois if not doi.endswith('missing')]
+
+    def test_normalize_doi_variants(self):
+        """Test that URL and doi: forms reduce to the bare DOI."""
+        for doi in self._DOI_FORMS:
+            self.assertEqual(paper_utils.normalize_doi(doi), '10.1016/J.YMSSP.2020.1')
+        self.assertEqual(paper_utils.normalize_doi(None), '')
+        self.assertEqual(paper_utils.normalize_doi(''), '')
+
+    def test_get_papers_by_dois_batches(self):
+        """Test that CrossrefClient resolves deduplicated DOIs in batches."""
+        from src.utils.crossref_client import CrossrefClient
+
+        client = CrossrefClient()
+        dois = [f'10.1000/test.{i}' for i in range(120)] + list(self._DOI_FORMS)
+        with patch.object(client, '_make_request',
+                          side_effect=lambda endpoint, params: {
+                              'message': {'items': self._works_response(params['filter'])}
+                          }) as mock_request:
+            papers = client.get_papers_by_dois(dois)
+
+        batch_sizes = [call.args[1]['rows'] for call in mock_request.call_args_list]
+        self.assertEqual(batch_sizes, [50, 50, 21])
+        self.assertEqual(len(papers), 121)
+        self.assertIn('10.1016/j.ymssp.2020.1', papers)
+
+    def _crossref_session(self):
+        session = MagicMock()
+
+        def get(url, params=None, timeout=None):
+            response = MagicMock(status_code=200)
+            response.content = json.dumps({
+                'message': {'items': self._works_response(params['filter'])}
+            }).encode('utf-8')
+            return response
+
+        session.get.side_effect = get
+        return session
+
+    def test_fetch_crossref_batch_caches_results(self):
+        """Test that PaperValidator batches lookups and reuses cached works."""
+        validator = PaperValidator({})
+        validator.session = self._crossref_session()
+        dois = [f'10.1000/test.{i}' for i in range(100)] + ['10.1000/missing'] + list(self._DOI_FORMS)
+
+        works = validator.fetch_crossref_batch(dois)
+        self.assertEqual(validator.session.get.call_count, 3)
+        self.assertEqual(len(works), 101)
+        self.assertNotIn('10.1000/missing', works)
+
+        # Known and known-missing DOIs are served from the cache
+        self.assertEqual(validator.fetch_crossref_batch(dois), works)
+        self.assertEqual(validator.session.get.call_count, 3)
+
+    def test_fetch_crossref_batch_cache_is_bounded(self):
+        """Test that the CrossRef work cache evicts its oldest entries."""
+        validator = PaperValidator({})
+        validator.session = self._crossref_session()
+        with patch('src.utils.pdf_downloader._CROSSREF_CACHE_SIZE', 10):
+            validator.fetch_crossref_batch([f'10.1000/test.{i}' for i in range(30)])
+        self.assertEqual(list(validator._crossref_works), [f'10.1000/test.{i}' for i in range(20, 30)])
+
+
+class TestMCPPaperLookup(unittest.TestCase):
+    """Test the Crossref-backed MCP DOI lookups."""
+
+    def setUp(self):
+        from src.utils.crossref_client import CrossrefClient
+        from src.utils.mcp_integration import MCPAcademicTools
+
+        # A full settings dict, as passed by the application
+        self.tools = MCPAcademicTools({'mcp_tools': {'requests_per_second': 0}, 'quality_filters': {}})
+        self.request_patch = patch.object(
+            CrossrefClient, '_make_request',
+            side_effect=lambda endpoint, params: {
+                'message': {'items': TestDOIHandling._works_response(params['filter'])}
+            }
+        )
+        self.mock_request = self.request_patch.start()
+
+    def tearDown(self):
+        self.request_patch.stop()
+
+    def test_get_paper_details_accepts_doi_forms(self):
+        """Test that URL and doi: forms resolve and record a clean registrant prefix."""
+        for doi in ('10.1186/s13634-020-1', 'https://doi.org/10.1186/S13634-020-1', 'doi:10.1186/s13634-020-1'):
+            paper = self.tools.get_paper_details(doi)
+            self.assertIsNotNone(paper, doi)
+            self.assertEqual(paper['doi'].lower(), '10.1186/s13634-020-1')
+            self.assertIn('phm_relevance_score', paper)
+        self.assertEqual(self.tools._authority_cache, {'10.1186': True})
+
+    def test_get_paper_details_unresolved(self):
+        """Test that unknown and malformed DOIs return None without trusting their prefix."""
+        self.assertIsNone(self.tools.get_paper_details('10.1000/missing'))
+        self.assertIsNone(self.tools.get_paper_details('https://doi.org/not-a-doi'))
+        self.assertEqual(self.mock_request.call_count, 1)
+        self.assertEqual(self.tools._authority_cache, {})
+
+    def test_get_paper_details_batch(self):
+        """Test that batch lookups resolve every DOI through one Crossref request."""
+        dois = ['10.1016/j.ymssp.2020.1', 'https://dx.doi.org/10.1109/TR.2021.2', '10.1000/missing', 'not a doi']
+        details = self.tools.get_paper_details_batch(dois)
+
+        self.assertEqual(sorted(details), ['10.1016/j.ymssp.2020.1', '10.1109/TR.2021.2'])
+        self.assertEqual(self.mock_request.call_count, 1)
+        self.assertEqual(self.mock_request.call_args.args[1]['rows'], 3)
+
+
+class TestCitationValidation(unittest.TestCase):
+    """Test that batch citation validation matches the per-paper path."""
+
+    def test_vectorized_matches_serial(self):
+        """Test that a malformed DOI only fails its own paper in both paths."""
+        from src.utils.mcp_integration import MCPAcademicTools
+
+        tools = MCPAcademicTools({})
+        papers = _make_papers(50, seed=3)
+        papers[5]['doi'] = 12345
+        papers[9]['year'] = 'unknown'
+
+        vectorized = tools._validate_citation_data_vectorized(copy.deepcopy(papers))
+        serial = tools._validate_citation_data_serial(copy.deepcopy(papers))
+        self.assertEqual(vectorized, serial)
+        self.assertEqual([i for i, paper in enumerate(vectorized) if paper.get('validation_status') == 'failed'],
+                         [5, 9])
+
+    def test_doi_with_unlisted_prefix_is_valid(self):
+        """Test that well-formed DOIs outside the bundled prefix list still validate."""
+        from src.utils.mcp_integration import MCPAcademicTools
+
+        tools = MCPAcademicTools({})
+        for doi, expected in (('10.1016/j.ymssp.2020.1', True), ('https://doi.org/10.1186/s13634-020-1', True),
+                              ('not a doi', False)):
+            self.assertIs(tools._validate_doi({'doi': doi})['doi_valid'], expected, doi)
+
+
+class TestPDFDownloader(unittest.TestCase):
+    """Test concurrent downloads, PDF validation and download statistics."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _PDFHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base_url = f'http://127.0.0.1:{cls.server.server_port}'
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.download_dir = Path(self.tmp.name)
+        self.downloader = PDFDownloader({'pdf_downloader': {
+            'download_directory': self.tmp.name, 'max_retries': 1
+        }})
+        _PDFHandler.hits = 0
+
+    def tearDown(self):
+        self.downloader.session.close()
+        self.tmp.cleanup()
+
+    def _paper(self, title):
+        return {'title': title, 'year': 2024, 'authors': ['Ada Lovelace'],
+                'urls': {'pdf': f'{self.base_url}/{title.replace(" ", "_")}.pdf'}}
+
+    def test_download_papers_deduplicates_filenames(self):
+        """Test that download_papers fetches each filename once and keeps input order."""
+        papers = [self._paper('First paper'), self._paper('Second paper'), self._paper('First paper')]
+        paths = self.downloader.download_papers(papers, max_workers=4)
+
+        self.assertEqual(_PDFHandler.hits, 2)
+        self.assertEqual(paths[0], paths[2])
+        self.assertNotEqual(paths[0], paths[1])
+        self.assertTrue(all(Path(path).read_bytes() == _PDF_BODY for path in paths))
+
+    def test_concurrent_downloads_are_coalesced(self):
+        """Test that concurrent calls for the same PDF share one download."""
+        paper = self._paper('Shared paper')
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            paths = list(executor.map(self.downloader.download_paper_pdf, [paper] * 8))
+
+        self.assertEqual(_PDFHandler.hits, 1)
+        self.assertEqual(len(set(paths)), 1)
+        self.assertIsNotNone(paths[0])
+        self.assertEqual(self.downloader._inflight, {})
+
+    def test_decoded_body_is_bounded(self):
+        """Test that a gzip body decoding past max_file_size is cut off and rejected."""
+        self.downloader.max_file_size = 100000
+        with self.downloader.session.get(f'{self.base_url}/big.pdf', stream=True) as response:
+            buffer = io.BytesIO()
+            self.assertEqual(self.downloader._copy_response_body(response, buffer), 100001)
+            self.assertEqual(len(buffer.getvalue()), 100001)
+
+        filepath = self.download_dir / 'big.pdf'
+        self.assertFalse(self.downloader._download_from_url(f'{self.base_url}/big.pdf', filepath))
+        self.assertEqual(list(self.download_dir.iterdir()), [])
+
+    def test_validate_pdf_requires_eof_marker(self):
+        """Test that the fast check rejects truncated and tiny files."""
+        complete = self.download_dir / 'complete.pdf'
+        complete.write_bytes(_PDF_BODY)
+        truncated = self.download_dir / 'truncated.pdf'
+        truncated.write_bytes(_PDF_BODY[:-8])
+        tiny = self.download_dir / 'tiny.pdf'
+        tiny.write_bytes(b'%PDF-1.4\n%%EOF\n')
+
+        self.assertTrue(self.downloader._validate_pdf_file(complete))
+        self.assertFalse(self.downloader._validate_pdf_file(truncated))
+        self.assertFalse(self.downloader._validate_pdf_file(tiny))
+        self.assertFalse(self.downloader._validate_pdf_file(self.download_dir / 'absent.pdf'))
+
+    def test_download_stats_cached_until_directory_changes(self):
+        """Test that get_download_stats reuses its result while the directory mtime is unchanged."""
+        (self.download_dir / 'a.pdf').write_bytes(_PDF_BODY)
+        old = time.time() - 60
+        os.utime(self.download_dir, (old, old))
+
+        stats = self.downloader.get_download_stats()
+        self.assertEqual(stats['total_files'], 1)
+        with patch('src.utils.pdf_downloader.os.scandir') as mock_scandir:
+            self.assertEqual(self.downloader.get_download_stats(), stats)
+            mock_scandir.assert_not_called()
+
+        (self.download_dir / 'b.pdf').write_bytes(_PDF_BODY)
+        os.utime(self.download_dir, (old + 1, old + 1))
+        self.assertEqual(self.downloader.get_download_stats()['total_files'], 2)
+
+    def test_download_stats_not_cached_for_recent_changes(self):
+        """Test that a directory modified within the racy window is rescanned."""
+        (self.download_dir / 'a.pdf').write_bytes(_PDF_BODY)
+        self.downloader.get_download_stats()
+        self.assertIsNone(self.downloader._stats_cache)
+
+
+class TestHTTPCacheSession(unittest.TestCase):
+    """Test the requests-cache session shared by the DOI/CrossRef lookups."""
+
+    def test_cached_session_only_caches_metadata_hosts(self):
+        """Test that the session caches nothing by default and lives under a cache directory."""
+        from src.utils import nature_access_helper
+
+        sentinel = object()
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_name = os.path.join(tmp, 'cache', 'appa_http_cache')
+            with patch.object(nature_access_helper, 'CachedSession') as mock_session, \
+                    patch.object(nature_access_helper, 'DO_NOT_CACHE', sentinel, create=True), \
+                    patch.object(nature_access_helper, '_HTTP_CACHE_NAME', cache_name):
+                nature_access_helper._create_cached_session()
+                self.assertTrue(os.path.isdir(os.path.dirname(cache_name)))
+
+        args, kwargs = mock_session.call_args
+        self.assertEqual(args, (cache_name,))
+        self.assertIs(kwargs['expire_after'], sentinel)
+        self.assertFalse(kwargs['cache_control'])
+        self.assertEqual(set(kwargs['urls_expire_after']), {'api.crossref.org', 'dx.doi.org', 'doi.org'})
+
+
+class TestCacheInvalidation(unittest.TestCase):
+    """Test that derived data is refreshed when its inputs change."""
+
+    def test_enriched_abstract_refreshes_quality_indicators(self):
+        """Test that OpenAlex abstract enrichment updates has_abstract."""
+        from src.utils.openalex_client import OpenAlexClient
+
+        client = OpenAlexClient()
+        paper = {'id': 'W1', 'title': 'Bearing prognostics', 'abstract': '', 'year': 2024,
+                 'quality_indicators': {'has_abstract': False}}
+        response = {'results': [{
+            'id': 'https://openalex.org/W1',
+            'abstract_inverted_index': {'Remaining': [0], 'useful': [1], 'life': [2]}
+        }]}
+        with patch.object(client, '_make_openalex_request', return_value=response):
+            client._enrich_abstracts([paper])
+
+        self.assertEqual(paper['abstract'], 'Remaining useful life')
+        self.assertTrue(paper['quality_indicators']['has_abstract'])
+
+    def test_classification_cache_keyed_on_text(self):
+        """Test that a paper is reclassified once its abstract arrives."""
+        from src.utils.mcp_integration import MCPAcademicTools
+
+        tools = MCPAcademicTools({})
+        paper = {'title': 'Bearing study', 'doi': '10.1000/classify', 'abstract': '', 'keywords': []}
+        methods_before, _ = tools._classify_paper(paper)
+
+        paper['abstract'] = 'A deep learning model based on a convolutional neural network'
+        methods_after, _ = tools._classify_paper(paper)
+        self.assertNotEqual(methods_before, methods_after)
+        self.assertIn('Deep Learning', methods_after)
+
+    def test_host_limiter_is_capped_by_known_rate(self):
+        """Test that known host rates cap, but never raise, a caller's rate."""
+        from src.utils import rate_limiter
+
+        with patch.dict(rate_limiter.HOST_RATE_LIMITS, {'fast.example': 2.0, 'slow.example': 10.0}), \
+                patch.dict(rate_limiter._HOST_LIMITERS, clear=True):
+            self.assertEqual(rate_limiter.get_host_limiter('fast.example', 10.0).rate, 2.0)
+            self.assertEqual(rate_limiter.get_host_limiter('slow.example', 1.0).rate, 1.0)
+            self.assertEqual(rate_limiter.get_host_limiter('other.example', 3.0).rate, 3.0)
+
+            # The first caller fixes the rate for a host
+            self.assertEqual(rate_limiter.get_host_limiter('other.example', 0.5).rate, 3.0)
+
+
+if __name__ == '__main__':
+    unittest.main()